@@ -12,16 +12,44 @@ Per ADR-0063: PydanticAI Core Agent Orchestrator
 
 import os
 import json
+import mmap
 import logging
 import asyncio
+import functools
+import heapq
+import importlib.util
+import inspect
+import re
+import threading
+import time
+from array import array
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, FrozenSet, Tuple
 from dataclasses import dataclass
 
+from .query_cache import QueryCache, SemanticQueryCache, make_query_key
+
+# NumPy accelerates keyword scoring; it is imported on first use so that
+# importing this module stays cheap for processes that never search.
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+_numpy_module = None
+
+
+def _numpy():
+    """Import NumPy lazily on first use."""
+    global _numpy_module
+    if _numpy_module is None:
+        import numpy
+
+        _numpy_module = numpy
+    return _numpy_module
+
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGContext:
     """Context from RAG for agent use."""
 
@@ -31,7 +59,7 @@ class RAGContext:
     total_results: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LineageContext:
     """Context from Marquez lineage for agent use."""
 
@@ -41,6 +69,46 @@ class LineageContext:
     successful_patterns: List[str]
 
 
+# DAG relevance boosts: (task keyword, DAG text keywords, DAG id keywords, weight).
+# A rule fires when the task contains the keyword and the DAG's description/tags
+# or dag_id contain any of the listed keywords (substring match).
+_DAG_BOOST_RULES = (
+    ("vm", ("vm",), (), 3),
+    ("centos", ("centos",), ("generic",), 3),
+    ("rhel", ("rhel",), (), 3),
+    ("openshift", (), ("ocp",), 3),
+    ("freeipa", (), ("freeipa",), 5),
+    ("deploy", (), ("deployment",), 2),
+    ("create", ("create", "deploy"), (), 2),
+)
+_TASK_KEYWORD_RE = re.compile("|".join(re.escape(rule[0]) for rule in _DAG_BOOST_RULES))
+
+
+@functools.lru_cache(maxsize=1024)
+def _dag_boost_hits(dag_id: str, dag_text: str) -> FrozenSet[str]:
+    """Return the task keywords whose DAG-side condition matches this DAG."""
+    return frozenset(task_kw for task_kw, text_kws, id_kws, _ in _DAG_BOOST_RULES if any(kw in dag_text for kw in text_kws) or any(kw in dag_id for kw in id_kws))
+
+
+def _dag_terms(dag: Dict[str, Any]) -> Tuple[str, FrozenSet[str]]:
+    """Return the lowercased description+tags text of a DAG and its token set."""
+    dag_text = f"{dag.get('description', '')} {' '.join(dag.get('tags', []))}".lower()
+    return dag_text, frozenset(dag_text.split())
+
+
+def _unique_first(items: List[str], limit: int) -> List[str]:
+    """Return up to limit distinct items, preserving first-seen order."""
+    seen = set()
+    unique = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            unique.append(item)
+            if len(unique) == limit:
+                break
+    return unique
+
+
 class AgentContextManager:
     """
     Singleton manager for shared agent context.
@@ -53,18 +121,30 @@ class AgentContextManager:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __new__(cls):
+        # Double-checked locking: lock-free once the instance exists
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
         if self._initialized:
             return
 
-        self._initialized = True
+        with self._instance_lock:
+            if self._initialized:
+                return
+            self._setup()
+            self._initialized = True
+
+    def _setup(self) -> None:
+        """Read configuration and create per-instance state (runs once)."""
         self.rag_service = None
         self.lineage_service = None
         self.adrs_loaded = False
@@ -72,6 +152,26 @@ class AgentContextManager:
         self.data_dir = Path(os.getenv("RAG_DATA_DIR", "/app/data"))
         self.adr_dir = Path(os.getenv("ADR_DIR", "/app/docs/adrs"))
         self.drop_dir = Path(os.getenv("RAG_DROP_DIR", "/app/data/rag-drop"))
+        self.airflow_url = os.getenv("AIRFLOW_API_URL", "http://localhost:8888")
+        self.airflow_auth = (
+            os.getenv("AIRFLOW_API_USER", "admin"),
+            os.getenv("AIRFLOW_API_PASSWORD", "admin"),
+        )
+        self._http_client = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Short-lived DAG list cache keyed on (tags, include_paused)
+        self._dag_cache_ttl = float(os.getenv("DAG_CACHE_TTL", "60"))
+        self._dag_list_cache: Dict[Tuple[Tuple[str, ...], bool], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Lowercased scoring text and token set per dag_id, built when DAGs are listed
+        self._dag_terms: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+        self._rag_cache = QueryCache()
+        self._semantic_cache = SemanticQueryCache()
+        self._high_confidence_tau = float(os.getenv("RAG_HIGH_CONFIDENCE_TAU", "0.85"))
+        # Indexed document_chunks.json, reloaded only when the file changes
+        self._chunks_cache: Optional[List[Tuple[Dict[str, Any], str]]] = None
+        self._chunks_mtime = 0
+        self._title_postings: Dict[str, array] = {}
+        self._content_postings: Dict[str, array] = {}
 
     async def initialize(
         self,
@@ -127,6 +227,18 @@ class AgentContextManager:
         logger.info("No pre-processed documents found - preparing documents...")
         await self._prepare_documents()
 
+    async def reload_adrs(self) -> None:
+        """
+        Re-check ADRs and drop cached RAG results.
+
+        _ensure_adrs_loaded() returns early when Qdrant or the chunks file
+        already has documents, so the caches are cleared here as well;
+        otherwise updated documents would not show until RAG_CACHE_TTL.
+        """
+        self.adrs_loaded = False
+        await self._ensure_adrs_loaded()
+        self.invalidate_rag_cache()
+
     async def _prepare_documents(self) -> None:
         """Prepare documents for RAG ingestion using DropDirectoryScanner."""
         try:
@@ -138,10 +250,12 @@ class AgentContextManager:
             )
             files_processed, chunks_generated = scanner.scan_and_process()
             logger.info(f"Scanner processed {files_processed} files, generated {chunks_generated} chunks")
+            self.invalidate_rag_cache()
 
             if chunks_generated > 0 and hasattr(self.rag_service, "rebuild_collection"):
                 logger.info("Rebuilding RAG collection with new documents...")
                 await self.rag_service.rebuild_collection()
+                self.invalidate_rag_cache()
 
             self.adrs_loaded = chunks_generated > 0
 
@@ -158,7 +272,9 @@ class AgentContextManager:
         Query RAG for relevant documents.
 
         Uses Qdrant vector search if available, falls back to keyword search
-        on the document_chunks.json file.
+        on the document_chunks.json file. Results are served from an
+        in-process LRU + TTL cache when the same query repeats, and from a
+        semantic cache when a near-duplicate query was answered recently.
 
         Args:
             query: Search query
@@ -168,6 +284,53 @@ class AgentContextManager:
         Returns:
             RAGContext with retrieved documents
         """
+        cache_key = make_query_key(query, top_k, document_types)
+        cached = self._rag_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        scope = cache_key[1:]
+        embedding = await self._embed_query(query)
+        if embedding is not None:
+            cached = self._semantic_cache.get(embedding, scope)
+            if cached is not None:
+                self._rag_cache.put(cache_key, cached)
+                return cached
+
+        rag_context = await self._search_rag(query, top_k, document_types)
+        if rag_context.total_results > 0:
+            self._rag_cache.put(cache_key, rag_context)
+            if embedding is not None:
+                self._semantic_cache.put(cache_key, embedding, rag_context, scope)
+        return rag_context
+
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed a query for the semantic cache if the RAG service supports it."""
+        if not self._semantic_cache.enabled or not hasattr(self.rag_service, "embed"):
+            return None
+
+        try:
+            embedding = self.rag_service.embed(query)
+            if inspect.isawaitable(embedding):
+                embedding = await embedding
+            return list(embedding) if embedding is not None else None
+        except Exception as e:
+            logger.debug(f"Query embedding failed, skipping semantic cache: {e}")
+            return None
+
+    def invalidate_rag_cache(self) -> None:
+        """Drop all cached RAG results after the document set changes."""
+        self._rag_cache.invalidate()
+        self._semantic_cache.invalidate()
+        self._chunks_cache = None
+
+    async def _search_rag(
+        self,
+        query: str,
+        top_k: int = 5,
+        document_types: Optional[List[str]] = None,
+    ) -> RAGContext:
+        """Run an uncached RAG query against Qdrant or the keyword fallback."""
         # Try Qdrant first if available and has documents
         if self.rag_service:
             try:
@@ -200,44 +363,18 @@ class AgentContextManager:
     ) -> RAGContext:
         """Simple keyword-based search on document chunks."""
         try:
-            chunks_file = self.data_dir / "rag-docs" / "document_chunks.json"
-            if not chunks_file.exists():
+            chunks = self._load_chunks()
+            if not chunks:
                 return RAGContext(contexts=[], sources=[], scores=[], total_results=0)
 
-            with open(chunks_file, "r", encoding="utf-8") as f:
-                chunks = json.load(f)
-
             # Normalize query for matching
             query_terms = set(query.lower().split())
 
-            # Score each chunk by keyword relevance
-            scored_chunks = []
-            for chunk in chunks:
-                # Filter by document type if specified
-                doc_type = chunk.get("metadata", {}).get("document_type", "")
-                if document_types and doc_type not in document_types:
-                    continue
-
-                content = chunk.get("content", "").lower()
-                title = chunk.get("title", "").lower()
-
-                # Simple scoring: count matching terms
-                content_terms = set(content.split())
-                title_terms = set(title.split())
-
-                # Weight title matches higher
-                title_matches = len(query_terms & title_terms)
-                content_matches = len(query_terms & content_terms)
-
-                score = (title_matches * 3) + content_matches
-                if score > 0:
-                    # Normalize score to 0-1 range
-                    normalized_score = min(score / (len(query_terms) * 3), 1.0)
-                    scored_chunks.append((chunk, normalized_score))
-
-            # Sort by score and take top_k
-            scored_chunks.sort(key=lambda x: x[1], reverse=True)
-            top_chunks = scored_chunks[:top_k]
+            max_score = len(query_terms) * 3
+            top_chunks = []
+            for idx, score in self._score_chunks(query_terms, chunks, top_k, document_types):
+                # Normalize score to 0-1 range
+                top_chunks.append((chunks[idx][0], min(score / max_score, 1.0)))
 
             contexts = [c[0].get("content", "") for c in top_chunks]
             sources = [c[0].get("source_file", "") for c in top_chunks]
@@ -254,6 +391,103 @@ class AgentContextManager:
             logger.error(f"Keyword search failed: {e}")
             return RAGContext(contexts=[], sources=[], scores=[], total_results=0)
 
+    def _score_chunks(
+        self,
+        query_terms: set,
+        chunks: List[Tuple[Dict[str, Any], str]],
+        top_k: int,
+        document_types: Optional[List[str]] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Score chunks containing a query term and return the top_k (index, score) pairs.
+
+        Title matches weigh 3 and content matches 1; ties keep file order.
+        Scores are accumulated with a vectorized NumPy scatter-add over the
+        posting lists when NumPy is installed, otherwise with a Counter.
+        """
+        if top_k <= 0:
+            return []
+
+        if NUMPY_AVAILABLE:
+            np = _numpy()
+            scores = np.zeros(len(chunks), dtype=np.int32)
+            for term in query_terms:
+                postings = self._title_postings.get(term)
+                if postings is not None:
+                    scores[np.frombuffer(postings, dtype=np.intc)] += 3
+                postings = self._content_postings.get(term)
+                if postings is not None:
+                    scores[np.frombuffer(postings, dtype=np.intc)] += 1
+
+            candidates = np.flatnonzero(scores)
+            if document_types:
+                allowed = np.fromiter((chunks[i][1] in document_types for i in candidates), dtype=bool, count=len(candidates))
+                candidates = candidates[allowed]
+            candidate_scores = scores[candidates]
+
+            # Partition down to the top_k score threshold before sorting
+            if len(candidates) > top_k:
+                kth = len(candidates) - top_k
+                threshold = np.partition(candidate_scores, kth)[kth]
+                keep = candidate_scores >= threshold
+                candidates, candidate_scores = candidates[keep], candidate_scores[keep]
+
+            order = np.lexsort((candidates, -candidate_scores))[:top_k]
+            return [(int(candidates[i]), int(candidate_scores[i])) for i in order]
+
+        counts: Counter = Counter()
+        for term in query_terms:
+            for idx in self._title_postings.get(term, ()):
+                counts[idx] += 3
+            for idx in self._content_postings.get(term, ()):
+                counts[idx] += 1
+
+        scored = ((idx, score) for idx, score in counts.items() if not document_types or chunks[idx][1] in document_types)
+        return heapq.nlargest(top_k, scored, key=lambda x: (x[1], -x[0]))
+
+    def _load_chunks(self) -> List[Tuple[Dict[str, Any], str]]:
+        """
+        Load document_chunks.json and build an inverted keyword index.
+
+        The parsed chunks and the title/content posting lists (term -> chunk
+        indices) are cached and only rebuilt when the file's modification
+        time changes, so keyword queries do no file I/O or tokenization and
+        only touch chunks containing a query term.
+
+        Returns:
+            List of (chunk, document_type) indexed by posting list entries
+        """
+        chunks_file = self.data_dir / "rag-docs" / "document_chunks.json"
+        try:
+            stat = os.stat(chunks_file)
+        except OSError:
+            self._chunks_cache = None
+            return []
+
+        if self._chunks_cache is not None and stat.st_mtime_ns == self._chunks_mtime:
+            return self._chunks_cache
+
+        chunks: List[Dict[str, Any]] = []
+        if stat.st_size > 0:
+            with open(chunks_file, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    chunks = json.loads(mm[:])
+
+        title_postings: Dict[str, array] = {}
+        content_postings: Dict[str, array] = {}
+        for idx, chunk in enumerate(chunks):
+            for term in set(chunk.get("title", "").lower().split()):
+                title_postings.setdefault(term, array("i")).append(idx)
+            for term in set(chunk.get("content", "").lower().split()):
+                content_postings.setdefault(term, array("i")).append(idx)
+
+        self._title_postings = title_postings
+        self._content_postings = content_postings
+        self._chunks_cache = [(chunk, chunk.get("metadata", {}).get("document_type", "")) for chunk in chunks]
+        self._chunks_mtime = stat.st_mtime_ns
+        logger.debug(f"Indexed {len(self._chunks_cache)} chunks ({len(content_postings)} terms) from {chunks_file}")
+        return self._chunks_cache
+
     async def query_lineage(
         self,
         job_name: Optional[str] = None,
@@ -307,8 +541,8 @@ class AgentContextManager:
             return LineageContext(
                 recent_runs=runs[:limit],
                 success_rate=success_rate,
-                error_patterns=list(set(error_patterns))[:5],
-                successful_patterns=list(set(successful_patterns))[:5],
+                error_patterns=_unique_first(error_patterns, 5),
+                successful_patterns=_unique_first(successful_patterns, 5),
             )
 
         except Exception as e:
@@ -320,6 +554,33 @@ class AgentContextManager:
                 successful_patterns=[],
             )
 
+    def _get_http_client(self):
+        """
+        Return the shared Airflow API client, creating it on first use.
+
+        Pooled connections belong to the event loop that opened them, so a
+        fresh client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            import httpx
+
+            self._http_client = httpx.AsyncClient(
+                base_url=self.airflow_url,
+                auth=self.airflow_auth,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            )
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the shared Airflow API client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_client_loop = None
+
     async def query_available_dags(
         self,
         tags: Optional[List[str]] = None,
@@ -329,7 +590,8 @@ class AgentContextManager:
         Query Airflow API for available DAGs.
 
         This provides dynamic discovery of DAG capabilities without
-        requiring static documentation that can go stale.
+        requiring static documentation that can go stale. Results are
+        cached for DAG_CACHE_TTL seconds (default: 60).
 
         Args:
             tags: Filter by tags (e.g., ["vm", "qubinode-pipelines"])
@@ -338,51 +600,55 @@ class AgentContextManager:
         Returns:
             List of DAGs with metadata (dag_id, description, tags, params)
         """
-        import httpx
-
-        airflow_url = os.getenv("AIRFLOW_API_URL", "http://localhost:8888")
-        airflow_user = os.getenv("AIRFLOW_API_USER", "admin")
-        airflow_pass = os.getenv("AIRFLOW_API_PASSWORD", "admin")
+        cache_key = (tuple(sorted(tags or ())), include_paused)
+        cached = self._dag_list_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._dag_cache_ttl:
+            return list(cached[1])
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{airflow_url}/api/v1/dags",
-                    auth=(airflow_user, airflow_pass),
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = self._get_http_client()
+            response = await client.get("/api/v1/dags")
+            response.raise_for_status()
+            data = response.json()
+
+            dags = []
+            for dag in data.get("dags", []):
+                # Skip paused DAGs unless requested
+                if dag.get("is_paused") and not include_paused:
+                    continue
+
+                dag_tags = [t.get("name") for t in dag.get("tags", [])]
 
-                dags = []
-                for dag in data.get("dags", []):
-                    # Skip paused DAGs unless requested
-                    if dag.get("is_paused") and not include_paused:
+                # Filter by tags if specified
+                if tags:
+                    if not any(t in dag_tags for t in tags):
                         continue
 
-                    dag_tags = [t.get("name") for t in dag.get("tags", [])]
-
-                    # Filter by tags if specified
-                    if tags:
-                        if not any(t in dag_tags for t in tags):
-                            continue
-
-                    dags.append(
-                        {
-                            "dag_id": dag.get("dag_id"),
-                            "description": dag.get("description"),
-                            "tags": dag_tags,
-                            "is_paused": dag.get("is_paused", False),
-                            "file_token": dag.get("file_token"),
-                        }
-                    )
+                dags.append(
+                    {
+                        "dag_id": dag.get("dag_id"),
+                        "description": dag.get("description"),
+                        "tags": dag_tags,
+                        "is_paused": dag.get("is_paused", False),
+                        "file_token": dag.get("file_token"),
+                    }
+                )
 
-                logger.info(f"Found {len(dags)} available DAGs")
-                return dags
+            logger.info(f"Found {len(dags)} available DAGs")
+            for dag in dags:
+                self._dag_terms[dag["dag_id"]] = _dag_terms(dag)
+            self._dag_list_cache[cache_key] = (time.monotonic(), dags)
+            return list(dags)
 
         except Exception as e:
             logger.warning(f"Failed to query Airflow DAGs: {e}")
             return []
 
+    def invalidate_dag_cache(self) -> None:
+        """Drop cached DAG lists, e.g. after DAGs are deployed or changed."""
+        self._dag_list_cache.clear()
+        self._dag_terms.clear()
+
     async def get_dag_details(self, dag_id: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific DAG including parameters.
@@ -393,38 +659,41 @@ class AgentContextManager:
         Returns:
             DAG details including description, tags, and parameters
         """
-        import httpx
-
-        airflow_url = os.getenv("AIRFLOW_API_URL", "http://localhost:8888")
-        airflow_user = os.getenv("AIRFLOW_API_USER", "admin")
-        airflow_pass = os.getenv("AIRFLOW_API_PASSWORD", "admin")
-
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Get DAG details
-                response = await client.get(
-                    f"{airflow_url}/api/v1/dags/{dag_id}/details",
-                    auth=(airflow_user, airflow_pass),
-                )
-                response.raise_for_status()
-                dag = response.json()
-
-                return {
-                    "dag_id": dag.get("dag_id"),
-                    "description": dag.get("description"),
-                    "doc_md": dag.get("doc_md"),  # Markdown documentation
-                    "tags": [t.get("name") for t in dag.get("tags", [])],
-                    "params": dag.get("params", {}),
-                    "is_paused": dag.get("is_paused", False),
-                    "schedule_interval": dag.get("schedule_interval"),
-                    "file_loc": dag.get("fileloc"),
-                }
+            # Get DAG details
+            client = self._get_http_client()
+            response = await client.get(f"/api/v1/dags/{dag_id}/details")
+            response.raise_for_status()
+            dag = response.json()
+
+            return {
+                "dag_id": dag.get("dag_id"),
+                "description": dag.get("description"),
+                "doc_md": dag.get("doc_md"),  # Markdown documentation
+                "tags": [t.get("name") for t in dag.get("tags", [])],
+                "params": dag.get("params", {}),
+                "is_paused": dag.get("is_paused", False),
+                "schedule_interval": dag.get("schedule_interval"),
+                "file_loc": dag.get("fileloc"),
+            }
 
         except Exception as e:
             logger.warning(f"Failed to get DAG details for {dag_id}: {e}")
             return None
 
-    async def find_dag_for_task(self, task_description: str) -> List[Dict[str, Any]]:
+    async def get_dag_details_batch(self, dag_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get details for several DAGs concurrently over the shared client.
+
+        Args:
+            dag_ids: DAG IDs to query
+
+        Returns:
+            DAG details in the same order as dag_ids (None for failed lookups)
+        """
+        return list(await asyncio.gather(*(self.get_dag_details(dag_id) for dag_id in dag_ids)))
+
+    async def find_dag_for_task(self, task_description: str, include_details: bool = False) -> List[Dict[str, Any]]:
         """
         Find DAGs that can help accomplish a task.
 
@@ -433,11 +702,17 @@ class AgentContextManager:
 
         Args:
             task_description: What the user wants to accomplish
+            include_details: Fetch full details (params, docs) for the top matches
 
         Returns:
             List of matching DAGs with relevance scores
         """
         task_lower = task_description.lower()
+        task_words = set(task_lower.split())
+
+        # Boost weights for keywords present in the task, found in one regex pass
+        task_keywords = set(_TASK_KEYWORD_RE.findall(task_lower))
+        task_boosts = {kw: weight for kw, _, _, weight in _DAG_BOOST_RULES if kw in task_keywords}
 
         # Get all active DAGs
         all_dags = await self.query_available_dags(include_paused=False)
@@ -445,32 +720,16 @@ class AgentContextManager:
         # Score each DAG by relevance
         scored_dags = []
         for dag in all_dags:
-            score = 0
-            dag_text = f"{dag.get('description', '')} {' '.join(dag.get('tags', []))}".lower()
-
-            # Check for keyword matches
-            task_words = set(task_lower.split())
-            dag_words = set(dag_text.split())
+            dag_text, dag_words = self._dag_terms.get(dag.get("dag_id")) or _dag_terms(dag)
 
             # Common infrastructure terms to match
             matches = task_words & dag_words
             score = len(matches)
 
             # Boost for specific patterns
-            if "vm" in task_lower and "vm" in dag_text:
-                score += 3
-            if "centos" in task_lower and ("centos" in dag_text or "generic" in dag.get("dag_id", "")):
-                score += 3
-            if "rhel" in task_lower and "rhel" in dag_text:
-                score += 3
-            if "openshift" in task_lower and "ocp" in dag.get("dag_id", ""):
-                score += 3
-            if "freeipa" in task_lower and "freeipa" in dag.get("dag_id", ""):
-                score += 5
-            if "deploy" in task_lower and "deployment" in dag.get("dag_id", ""):
-                score += 2
-            if "create" in task_lower and ("create" in dag_text or "deploy" in dag_text):
-                score += 2
+            if task_boosts:
+                for kw in _dag_boost_hits(dag.get("dag_id") or "", dag_text):
+                    score += task_boosts.get(kw, 0)
 
             if score > 0:
                 scored_dags.append(
@@ -480,9 +739,15 @@ class AgentContextManager:
                     }
                 )
 
-        # Sort by relevance
-        scored_dags.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return scored_dags[:5]  # Top 5 matches
+        # Top 5 matches by relevance
+        top_dags = heapq.nlargest(5, scored_dags, key=lambda x: x["relevance_score"])
+
+        if include_details and top_dags:
+            details = await self.get_dag_details_batch([dag["dag_id"] for dag in top_dags])
+            for dag, dag_details in zip(top_dags, details):
+                dag["details"] = dag_details
+
+        return top_dags
 
     async def get_context_for_task(
         self,
@@ -502,14 +767,22 @@ class AgentContextManager:
 
         Returns:
             Combined context dict with 'rag', 'lineage', and 'dags' keys
+
+        When the RAG query is already cached with a score at or above
+        RAG_HIGH_CONFIDENCE_TAU, DAG discovery is skipped ('dags.skipped').
         """
+        # Skip DAG discovery when a cached RAG answer is already high-confidence
+        cached_rag = self._rag_cache.peek(make_query_key(task_description, 10))
+        skip_dags = include_dags and cached_rag is not None and bool(cached_rag.scores) and max(cached_rag.scores) >= self._high_confidence_tau
+        run_dags = include_dags and not skip_dags
+
         # Query RAG in parallel with lineage and DAGs
         rag_task = self.query_rag(task_description, top_k=10)
 
         tasks = [rag_task]
         if include_lineage:
             tasks.append(self.query_lineage())
-        if include_dags:
+        if run_dags:
             tasks.append(self.find_dag_for_task(task_description))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -527,7 +800,7 @@ class AgentContextManager:
             lineage_context = results[1]
 
         dag_matches = []
-        if include_dags:
+        if run_dags:
             dag_idx = 2 if include_lineage else 1
             if len(results) > dag_idx and not isinstance(results[dag_idx], Exception):
                 dag_matches = results[dag_idx]
@@ -548,6 +821,7 @@ class AgentContextManager:
             "dags": {
                 "matches": dag_matches,
                 "total_matches": len(dag_matches),
+                "skipped": skip_dags,
             },
         }
 
@@ -560,8 +834,15 @@ class AgentContextManager:
             "adrs_loaded": self.adrs_loaded,
             "project_root": str(self.project_root),
             "data_dir": str(self.data_dir),
+            "rag_cache": self.get_cache_stats(),
         }
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the RAG query caches."""
+        stats = self._rag_cache.stats()
+        stats["semantic"] = self._semantic_cache.stats()
+        return stats
+
 
 # Singleton instance
 agent_context = AgentContextManager()
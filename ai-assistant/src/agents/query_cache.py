@@ -0,0 +1,248 @@
+"""
+Query Cache: In-process LRU + TTL cache for agent RAG queries.
+
+Agent workloads repeat the same natural-language prompts frequently, so
+caching the resulting RAGContext avoids repeated Qdrant searches and
+keyword scans over document_chunks.json.
+
+A second, semantic tier matches near-duplicate prompts ("list vms" vs
+"show me the vms") by cosine similarity of query embeddings. It needs a
+RAG service with an embed() method; QdrantRAGService provides one, so with
+MockRAGService or the keyword fallback only the exact tier is used.
+
+Configuration (environment):
+- RAG_CACHE_SIZE: Maximum number of cached queries (default: 256, 0 disables)
+- RAG_CACHE_TTL: Entry lifetime in seconds (default: 300)
+- RAG_SEMANTIC_CACHE: Enable the semantic tier (default: true)
+- RAG_SEMANTIC_CACHE_SIZE: Maximum number of semantic entries (default: 40)
+- RAG_SEMANTIC_TAU: Cosine similarity threshold for a hit (default: 0.92)
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_SEMANTIC_CACHE_SIZE = 40
+DEFAULT_SEMANTIC_TAU = 0.92
+
+
+def make_query_key(
+    query: str,
+    top_k: int,
+    document_types: Optional[Iterable[str]] = None,
+) -> Tuple[str, int, Tuple[str, ...]]:
+    """Build a normalized cache key for a RAG query."""
+    return (query.strip().lower(), top_k, tuple(sorted(document_types or ())))
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with per-entry TTL expiry.
+
+    Entries are kept in an OrderedDict in recency order; expired entries
+    are dropped lazily when they are looked up.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        if max_size is None:
+            max_size = int(os.getenv("RAG_CACHE_SIZE", str(DEFAULT_CACHE_SIZE)))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("RAG_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
+
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key without touching recency or stats."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop a single entry, or the whole cache when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _normalize(vector: Sequence[float]) -> Optional[List[float]]:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return None
+    return [v / norm for v in vector]
+
+
+class SemanticQueryCache:
+    """
+    Thread-safe similarity cache keyed on query embeddings.
+
+    Holds the last N (embedding, value) pairs per scope (e.g. top_k and
+    document type filter) and returns the best match whose cosine
+    similarity reaches the configured threshold.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        if max_size is None:
+            max_size = int(os.getenv("RAG_SEMANTIC_CACHE_SIZE", str(DEFAULT_SEMANTIC_CACHE_SIZE)))
+        if threshold is None:
+            threshold = float(os.getenv("RAG_SEMANTIC_TAU", str(DEFAULT_SEMANTIC_TAU)))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("RAG_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
+        if enabled is None:
+            enabled = os.getenv("RAG_SEMANTIC_CACHE", "true").lower() in ("true", "1", "yes", "on")
+
+        self.max_size = max(0, max_size)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._enabled = enabled
+        self._entries: "OrderedDict[Hashable, Tuple[float, Hashable, List[float], Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled and self.max_size > 0
+
+    def get(self, embedding: Sequence[float], scope: Hashable = None) -> Optional[Any]:
+        """Return the closest cached value within scope, or None below threshold."""
+        if not self.enabled:
+            return None
+
+        query_vec = _normalize(embedding)
+        if query_vec is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            best_key = None
+            best_sim = self.threshold
+            for key, (stored_at, entry_scope, vec, _) in list(self._entries.items()):
+                if now - stored_at > self.ttl_seconds:
+                    del self._entries[key]
+                    continue
+                if entry_scope != scope or len(vec) != len(query_vec):
+                    continue
+                sim = sum(a * b for a, b in zip(query_vec, vec))
+                if sim >= best_sim:
+                    best_key, best_sim = key, sim
+
+            if best_key is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(best_key)
+            self._hits += 1
+            return self._entries[best_key][3]
+
+    def put(self, key: Hashable, embedding: Sequence[float], value: Any, scope: Hashable = None) -> None:
+        """Store value with its query embedding, evicting the least recently used entry."""
+        if not self.enabled:
+            return
+
+        vec = _normalize(embedding)
+        if vec is None:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), scope, vec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all semantic entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "threshold": self.threshold,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -12,13 +12,24 @@ Supported file types:
 - .txt -> split by double-newline paragraphs (document_type: "text")
 """
 
+import functools
 import hashlib
 import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -27,44 +38,54 @@ SUPPORTED_EXTENSIONS = {".md", ".yml", ".yaml", ".rst", ".txt"}
 # Minimum character length for a chunk to be included
 MIN_CHUNK_LENGTH = 50
 
+# Below this many files, chunking stays sequential even with DROP_SCAN_WORKERS set
+MIN_FILES_FOR_POOL = 8
+
+# Chunk ID hash: "blake2b" (default) or "md5" for IDs matching older scans
+CHUNK_ID_ALGO = os.getenv("CHUNK_ID_ALGO", "blake2b").lower()
+
+# ADR files match adr-*.md pattern
+_ADR_RE = re.compile(r"adr-\d+", re.IGNORECASE)
+
+_SUFFIX_TO_TYPE = {
+    ".yml": "config",
+    ".yaml": "config",
+    ".rst": "documentation",
+    ".txt": "text",
+}
+
 
 def _classify_document_type(path: Path) -> str:
     """Determine document_type from file path and extension."""
-    suffix = path.suffix.lower()
+    return _classify_suffix_and_stem(path.suffix.lower(), path.stem)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_suffix_and_stem(suffix: str, stem: str) -> str:
+    """Memoized document_type lookup keyed on (suffix, stem)."""
     if suffix == ".md":
-        # ADR files match adr-*.md pattern
-        if re.match(r"adr-\d+", path.stem, re.IGNORECASE):
-            return "adr"
-        return "markdown"
-    if suffix in (".yml", ".yaml"):
-        return "config"
-    if suffix == ".rst":
-        return "documentation"
-    if suffix == ".txt":
-        return "text"
-    return "unknown"
-
-
-def _chunk_markdown(content: str) -> List[Tuple[str, str]]:
-    """Split markdown by # headers. Returns list of (title, section_content)."""
-    lines = content.split("\n")
-    sections: List[Tuple[str, str]] = []
+        return "adr" if _ADR_RE.match(stem) else "markdown"
+    return _SUFFIX_TO_TYPE.get(suffix, "unknown")
+
+
+def _chunk_markdown(content: str) -> Iterator[Tuple[str, str]]:
+    """Split markdown by # headers. Yields (title, section_content) tuples."""
     current_title = None
     current_content: List[str] = []
+    append = current_content.append
 
-    for line in lines:
+    for line in content.split("\n"):
         if line.startswith("#"):
             if current_content:
-                sections.append((current_title, "\n".join(current_content)))
+                yield current_title, "\n".join(current_content)
             current_title = line.lstrip("#").strip()
             current_content = [line]
+            append = current_content.append
         else:
-            current_content.append(line)
+            append(line)
 
     if current_content:
-        sections.append((current_title, "\n".join(current_content)))
-
-    return sections
+        yield current_title, "\n".join(current_content)
 
 
 def _chunk_by_paragraphs(content: str) -> List[Tuple[str, str]]:
@@ -78,10 +99,113 @@ def _chunk_whole_file(content: str, filename: str) -> List[Tuple[str, str]]:
     return [(filename, content.strip())]
 
 
+def _iter_supported_files(src_dir: Path) -> Iterator[Tuple[str, str]]:
+    """Walk src_dir once with os.scandir, yielding (extension, path) for supported files.
+
+    Symlinked directories are not descended into; symlinked files are included.
+    """
+    stack = [str(src_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in SUPPORTED_EXTENSIONS and entry.is_file():
+                            yield ext, entry.path
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot scan directory: {e}")
+
+
+def _scan_workers() -> int:
+    """Number of chunking threads (DROP_SCAN_WORKERS, default: 1, sequential)."""
+    try:
+        return max(int(os.getenv("DROP_SCAN_WORKERS", "1")), 1)
+    except ValueError:
+        return 1
+
+
 def _chunk_id(relative_path: str, section_index: int, title: str) -> str:
     """Generate a stable chunk ID from path, index, and title."""
-    raw = f"{relative_path}_{section_index}_{title}"
-    return hashlib.md5(raw.encode()).hexdigest()
+    raw = f"{relative_path}_{section_index}_{title}".encode("utf-8")
+    if CHUNK_ID_ALGO == "md5":
+        return hashlib.md5(raw).hexdigest()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def chunk_file(filepath: Path, source_dir: Path, created_at: Optional[str] = None) -> List[Dict]:
+    """Read and chunk a single file. Returns list of chunk dicts.
+
+    created_at is shared by every chunk; scan_and_process passes one timestamp for
+    the whole scan.
+    """
+    try:
+        content = filepath.read_text(encoding="utf-8")
+    except Exception as e:
+        logger.warning(f"Cannot read {filepath}: {e}")
+        return []
+
+    if created_at is None:
+        created_at = datetime.now().isoformat()
+
+    relative_path = str(filepath.relative_to(source_dir))
+    doc_type = _classify_document_type(filepath)
+    suffix = filepath.suffix.lower()
+
+    # Choose chunking strategy
+    if suffix == ".md":
+        raw_chunks = _chunk_markdown(content)
+    elif suffix in (".yml", ".yaml"):
+        raw_chunks = _chunk_whole_file(content, filepath.name)
+    else:
+        # .rst and .txt
+        raw_chunks = _chunk_by_paragraphs(content)
+
+    chunks: List[Dict] = []
+    for i, (title, section_content) in enumerate(raw_chunks):
+        section_content = section_content.strip()
+        if len(section_content) < MIN_CHUNK_LENGTH:
+            continue
+
+        chunk_title = title or filepath.stem
+        cid = _chunk_id(relative_path, i, chunk_title)
+        word_count = len(section_content.split())
+
+        chunks.append(
+            {
+                "id": cid,
+                "source_file": relative_path,
+                "title": chunk_title,
+                "content": section_content,
+                "chunk_type": suffix.lstrip("."),
+                "metadata": {
+                    "source_file": relative_path,
+                    "document_type": doc_type,
+                    "section_index": i,
+                    "word_count": word_count,
+                    "created_at": created_at,
+                },
+                "word_count": word_count,
+                "created_at": created_at,
+            }
+        )
+
+    return chunks
+
+
+def _write_chunks_json(chunks_file: Path, chunks: List[Dict]) -> None:
+    """Write chunks as a compact JSON array, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        chunks_file.write_bytes(orjson.dumps(chunks, option=orjson.OPT_APPEND_NEWLINE))
+        return
+
+    with open(chunks_file, "w", encoding="utf-8") as f:
+        json.dump(chunks, f, ensure_ascii=False, separators=(",", ":"))
 
 
 class DropDirectoryScanner:
@@ -102,61 +226,33 @@ class DropDirectoryScanner:
             if not src_dir.is_dir():
                 logger.debug(f"Source directory does not exist: {src_dir}")
                 continue
-            for ext in sorted(SUPPORTED_EXTENSIONS):
-                for filepath in sorted(src_dir.rglob(f"*{ext}")):
-                    if filepath.is_file():
-                        results.append((filepath, src_dir))
+            # Group by extension, then path, for a deterministic chunk order.
+            # Path objects compare part by part, so "a/x.md" sorts before "a-b/x.md".
+            found = sorted((ext, Path(path)) for ext, path in _iter_supported_files(src_dir))
+            results.extend((path, src_dir) for _, path in found)
         return results
 
-    def chunk_file(self, filepath: Path, source_dir: Path) -> List[Dict]:
+    def chunk_file(self, filepath: Path, source_dir: Path, created_at: Optional[str] = None) -> List[Dict]:
         """Read and chunk a single file. Returns list of chunk dicts."""
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except Exception as e:
-            logger.warning(f"Cannot read {filepath}: {e}")
-            return []
-
-        relative_path = str(filepath.relative_to(source_dir))
-        doc_type = _classify_document_type(filepath)
-        suffix = filepath.suffix.lower()
-
-        # Choose chunking strategy
-        if suffix == ".md":
-            raw_chunks = _chunk_markdown(content)
-        elif suffix in (".yml", ".yaml"):
-            raw_chunks = _chunk_whole_file(content, filepath.name)
-        else:
-            # .rst and .txt
-            raw_chunks = _chunk_by_paragraphs(content)
+        return chunk_file(filepath, source_dir, created_at)
 
-        chunks: List[Dict] = []
-        for i, (title, section_content) in enumerate(raw_chunks):
-            if len(section_content.strip()) < MIN_CHUNK_LENGTH:
-                continue
+    def _chunk_all(self, discovered: List[Tuple[Path, Path]], created_at: str) -> List[List[Dict]]:
+        """Chunk discovered files in order.
 
-            chunk_title = title or filepath.stem
-            cid = _chunk_id(relative_path, i, chunk_title)
+        Chunking is CPU-bound Python, so it runs sequentially by default.
+        DROP_SCAN_WORKERS > 1 opts into a thread pool, which only helps when
+        file reads are slow (e.g. network mounts). Threads rather than
+        processes: scans run inside the ai-assistant server, where forking
+        a threaded process can deadlock the children.
+        """
+        workers = _scan_workers()
+        if workers <= 1 or len(discovered) < MIN_FILES_FOR_POOL:
+            return [self.chunk_file(filepath, source_dir, created_at) for filepath, source_dir in discovered]
 
-            chunks.append(
-                {
-                    "id": cid,
-                    "source_file": relative_path,
-                    "title": chunk_title,
-                    "content": section_content.strip(),
-                    "chunk_type": suffix.lstrip("."),
-                    "metadata": {
-                        "source_file": relative_path,
-                        "document_type": doc_type,
-                        "section_index": i,
-                        "word_count": len(section_content.split()),
-                        "created_at": datetime.now().isoformat(),
-                    },
-                    "word_count": len(section_content.split()),
-                    "created_at": datetime.now().isoformat(),
-                }
-            )
-
-        return chunks
+        filepaths = [filepath for filepath, _ in discovered]
+        source_dirs = [source_dir for _, source_dir in discovered]
+        with ThreadPoolExecutor(max_workers=min(workers, len(discovered))) as executor:
+            return list(executor.map(self.chunk_file, filepaths, source_dirs, repeat(created_at)))
 
     def scan_and_process(self) -> Tuple[int, int]:
         """Scan all source dirs, chunk files, and write document_chunks.json.
@@ -169,9 +265,9 @@ class DropDirectoryScanner:
 
         all_chunks: List[Dict] = []
         files_processed = 0
+        created_at = datetime.now().isoformat()
 
-        for filepath, source_dir in discovered:
-            chunks = self.chunk_file(filepath, source_dir)
+        for chunks in self._chunk_all(discovered, created_at):
             if chunks:
                 all_chunks.extend(chunks)
                 files_processed += 1
@@ -180,8 +276,7 @@ class DropDirectoryScanner:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         chunks_file = self.output_dir / "document_chunks.json"
 
-        with open(chunks_file, "w", encoding="utf-8") as f:
-            json.dump(all_chunks, f, indent=2, ensure_ascii=False)
+        _write_chunks_json(chunks_file, all_chunks)
 
         logger.info(f"Wrote {len(all_chunks)} chunks from {files_processed} files to {chunks_file}")
         return files_processed, len(all_chunks)
@@ -131,6 +131,14 @@ async def lifespan(app: FastAPI):
     if ai_service:
         await ai_service.cleanup()
 
+    if PYDANTICAI_AVAILABLE:
+        try:
+            agent_ctx = await get_agent_context()
+            if agent_ctx:
+                await agent_ctx.close()
+        except Exception as e:
+            logger.warning(f"Agent context shutdown failed: {e}")
+
     logger.info("Shutdown complete")
 
 
@@ -1056,9 +1064,8 @@ async def reload_orchestrator_context():
         raise HTTPException(status_code=503, detail="Agent context not initialized")
 
     try:
-        # Force reload of ADRs
-        agent_ctx.adrs_loaded = False
-        await agent_ctx._ensure_adrs_loaded()
+        # Force reload of ADRs and drop cached RAG results
+        await agent_ctx.reload_adrs()
 
         return {
             "success": True,
@@ -5,8 +5,10 @@ Based on ADR-0027: CPU-Based AI Deployment Assistant Architecture
 Optimized for CentOS Stream 10 / RHEL environments
 """
 
+import asyncio
 import json
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -60,6 +62,8 @@ class QdrantRAGService:
         # - CPU performance: ~30ms vs ~45ms (faster!)
         self.model_name = "BAAI/bge-small-en-v1.5"
         self.documents_loaded = False
+        # Recent embed() results, reused by search_documents() for the same query
+        self._query_vectors: "OrderedDict[str, List[float]]" = OrderedDict()
 
         # Create directories
         self.vector_db_dir.mkdir(parents=True, exist_ok=True)
@@ -107,6 +111,24 @@ class QdrantRAGService:
             pass
         return 0
 
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embed a query with the FastEmbed model used for search"""
+        if not self.client:
+            return None
+
+        vector = await asyncio.to_thread(self._embed_sync, text)
+        self._query_vectors[text] = vector
+        self._query_vectors.move_to_end(text)
+        while len(self._query_vectors) > 32:
+            self._query_vectors.popitem(last=False)
+        return vector
+
+    def _embed_sync(self, text: str) -> List[float]:
+        # The client caches one model instance per name and embeds
+        # models.Document queries with it, so this loads no second copy.
+        model = self.client._get_or_init_model(self.model_name)
+        return [float(x) for x in next(iter(model.query_embed(text)))]
+
     async def _build_collection_from_documents(self) -> None:
         """Build Qdrant collection from processed document chunks"""
         try:
@@ -225,10 +247,12 @@ class QdrantRAGService:
                     ]
                 )
 
-            # Perform semantic search using FastEmbed
+            # Perform semantic search using FastEmbed, reusing the vector
+            # if embed() was just called for this query
+            query_vector = self._query_vectors.get(query)
             search_results = self.client.query_points(
                 collection_name=self.collection_name,
-                query=models.Document(text=query, model=self.model_name),
+                query=query_vector if query_vector is not None else models.Document(text=query, model=self.model_name),
                 query_filter=query_filter,
                 limit=n_results,
                 with_payload=True,
@@ -0,0 +1,366 @@
+"""
+Tests for agents/context.py - Shared RAG and lineage context for agents.
+
+Tests cover:
+- Keyword search fallback over document_chunks.json
+- Chunk loading, inverted index and reload on file change
+- Lineage pattern extraction
+- Airflow DAG discovery
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Set test mode
+os.environ["TEST_MODE"] = "true"
+
+from agents import context as context_module
+from agents.context import AgentContextManager
+
+
+def _chunk(title, content, doc_type="adr", source="adr-0001.md"):
+    return {
+        "id": title,
+        "source_file": source,
+        "title": title,
+        "content": content,
+        "metadata": {"document_type": doc_type},
+    }
+
+
+def _write_chunks(data_dir, chunks):
+    rag_docs = data_dir / "rag-docs"
+    rag_docs.mkdir(parents=True, exist_ok=True)
+    chunks_file = rag_docs / "document_chunks.json"
+    chunks_file.write_text(json.dumps(chunks))
+    return chunks_file
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = object.__new__(AgentContextManager)
+    manager._initialized = False
+    AgentContextManager.__init__(manager)
+    manager.data_dir = tmp_path
+    return manager
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def scoring_backend(request):
+    if request.param and not context_module.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    with patch.object(context_module, "NUMPY_AVAILABLE", request.param):
+        yield request.param
+
+
+@pytest.mark.usefixtures("scoring_backend")
+class TestKeywordSearch:
+    """Tests for the keyword search fallback."""
+
+    @pytest.mark.asyncio
+    async def test_missing_chunks_file(self, manager):
+        ctx = await manager._keyword_search("freeipa")
+        assert ctx.total_results == 0
+
+    @pytest.mark.asyncio
+    async def test_title_matches_rank_higher(self, manager):
+        _write_chunks(
+            manager.data_dir,
+            [
+                _chunk("Networking", "freeipa uses dns for service discovery", source="a.md"),
+                _chunk("FreeIPA deployment", "identity management server", source="b.md"),
+            ],
+        )
+
+        ctx = await manager._keyword_search("freeipa")
+
+        assert ctx.total_results == 2
+        assert ctx.sources == ["b.md", "a.md"]
+        assert ctx.scores[0] > ctx.scores[1]
+
+    @pytest.mark.asyncio
+    async def test_document_type_filter(self, manager):
+        _write_chunks(
+            manager.data_dir,
+            [
+                _chunk("FreeIPA", "freeipa adr", doc_type="adr", source="adr.md"),
+                _chunk("FreeIPA", "freeipa config", doc_type="config", source="cfg.yml"),
+            ],
+        )
+
+        ctx = await manager._keyword_search("freeipa", document_types=["config"])
+
+        assert ctx.sources == ["cfg.yml"]
+
+    @pytest.mark.asyncio
+    async def test_top_k_limits_results(self, manager):
+        _write_chunks(manager.data_dir, [_chunk(f"vm {i}", "vm content", source=f"{i}.md") for i in range(10)])
+
+        ctx = await manager._keyword_search("vm", top_k=3)
+
+        assert ctx.total_results == 3
+        assert ctx.sources == ["0.md", "1.md", "2.md"]
+
+    @pytest.mark.asyncio
+    async def test_top_k_ranks_across_ties(self, manager):
+        chunks = [_chunk("other", "vm", source=f"low{i}.md") for i in range(5)]
+        chunks += [_chunk("vm", "vm disk", source=f"high{i}.md") for i in range(3)]
+        _write_chunks(manager.data_dir, chunks)
+
+        ctx = await manager._keyword_search("vm disk", top_k=4)
+
+        assert ctx.sources == ["high0.md", "high1.md", "high2.md", "low0.md"]
+
+
+class TestLoadChunks:
+    """Tests for cached chunk loading."""
+
+    def test_chunks_cached_until_file_changes(self, manager):
+        chunks_file = _write_chunks(manager.data_dir, [_chunk("One", "first")])
+
+        first = manager._load_chunks()
+        assert manager._load_chunks() is first
+
+        chunks_file.write_text(json.dumps([_chunk("One", "first"), _chunk("Two", "second")]))
+        stat = os.stat(chunks_file)
+        os.utime(chunks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert len(manager._load_chunks()) == 2
+
+    def test_builds_inverted_index(self, manager):
+        _write_chunks(
+            manager.data_dir,
+            [
+                _chunk("FreeIPA Server", "Identity Management"),
+                _chunk("Step CA", "certificate management", doc_type="config"),
+            ],
+        )
+
+        chunks = manager._load_chunks()
+
+        assert [doc_type for _, doc_type in chunks] == ["adr", "config"]
+        assert list(manager._title_postings["freeipa"]) == [0]
+        assert list(manager._content_postings["management"]) == [0, 1]
+        assert "certificate" not in manager._title_postings
+
+
+class TestQueryLineage:
+    """Tests for lineage pattern extraction."""
+
+    @pytest.mark.asyncio
+    async def test_patterns_deduplicated_in_order(self, manager):
+        runs = [{"state": "FAILED", "error": f"error {i % 3}"} for i in range(10)]
+        runs += [{"state": "COMPLETE", "job": f"job{i}"} for i in range(8)]
+        manager.lineage_service = MagicMock()
+        manager.lineage_service.get_recent_runs = AsyncMock(return_value=runs)
+
+        ctx = await manager.query_lineage(limit=20)
+
+        assert ctx.error_patterns == ["error 0", "error 1", "error 2"]
+        assert ctx.successful_patterns == ["job0", "job1", "job2", "job3", "job4"]
+
+
+def _airflow_handler(request):
+    if request.url.path == "/api/v1/dags":
+        return httpx.Response(
+            200,
+            json={
+                "dags": [
+                    {"dag_id": "freeipa_deployment", "description": "Deploy FreeIPA", "tags": [{"name": "freeipa"}], "is_paused": False},
+                    {"dag_id": "generic_vm_deployment", "description": "Create a VM", "tags": [{"name": "vm"}], "is_paused": False},
+                    {"dag_id": "paused_dag", "description": "Paused", "tags": [], "is_paused": True},
+                ]
+            },
+        )
+    dag_id = request.url.path.split("/")[4]
+    return httpx.Response(200, json={"dag_id": dag_id, "description": f"{dag_id} details", "tags": [], "params": {}})
+
+
+@pytest.fixture
+async def airflow_manager(manager):
+    manager.airflow_requests = []
+
+    def handler(request):
+        manager.airflow_requests.append(request)
+        return _airflow_handler(request)
+
+    manager._http_client = httpx.AsyncClient(base_url="http://airflow.test", transport=httpx.MockTransport(handler))
+    manager._http_client_loop = asyncio.get_running_loop()
+    return manager
+
+
+class TestAirflowDiscovery:
+    """Tests for DAG discovery through the Airflow API."""
+
+    @pytest.mark.asyncio
+    async def test_query_available_dags_skips_paused(self, airflow_manager):
+        dags = await airflow_manager.query_available_dags()
+
+        assert [d["dag_id"] for d in dags] == ["freeipa_deployment", "generic_vm_deployment"]
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self, airflow_manager):
+        client = airflow_manager._http_client
+
+        await airflow_manager.query_available_dags()
+        details = await airflow_manager.get_dag_details("freeipa_deployment")
+
+        assert details["dag_id"] == "freeipa_deployment"
+        assert airflow_manager._http_client is client
+        assert len(airflow_manager.airflow_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self, airflow_manager):
+        client = airflow_manager._http_client
+
+        await airflow_manager.close()
+
+        assert client.is_closed
+        assert airflow_manager._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_client_created_lazily_with_config(self, manager):
+        manager.airflow_url = "http://airflow.example:8888"
+        manager.airflow_auth = ("user", "secret")
+
+        client = manager._get_http_client()
+
+        assert str(client.base_url) == "http://airflow.example:8888"
+        assert manager._get_http_client() is client
+
+    def test_new_event_loop_gets_new_client(self, manager):
+        async def get_client():
+            return manager._get_http_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_dag_list_cached_within_ttl(self, airflow_manager):
+        first = await airflow_manager.query_available_dags()
+        second = await airflow_manager.query_available_dags()
+
+        assert second == first
+        assert len(airflow_manager.airflow_requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_dag_list_cache_keyed_on_arguments(self, airflow_manager):
+        await airflow_manager.query_available_dags()
+        dags = await airflow_manager.query_available_dags(include_paused=True)
+
+        assert len(dags) == 3
+        assert len(airflow_manager.airflow_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_dag_list_cache_expires_and_invalidates(self, airflow_manager):
+        await airflow_manager.query_available_dags()
+        airflow_manager.invalidate_dag_cache()
+        await airflow_manager.query_available_dags()
+        assert len(airflow_manager.airflow_requests) == 2
+
+        airflow_manager._dag_cache_ttl = 0
+        await airflow_manager.query_available_dags()
+        assert len(airflow_manager.airflow_requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_find_dag_for_task_applies_boosts(self, airflow_manager):
+        matches = await airflow_manager.find_dag_for_task("deploy freeipa server")
+
+        assert matches[0]["dag_id"] == "freeipa_deployment"
+        # "deploy"/"freeipa" word matches (2) + freeipa boost (5) + deployment boost (2)
+        assert matches[0]["relevance_score"] == 9
+        assert matches[1]["dag_id"] == "generic_vm_deployment"
+        assert matches[1]["relevance_score"] == 2
+
+    @pytest.mark.asyncio
+    async def test_dag_terms_precomputed_when_listing(self, airflow_manager):
+        dags = await airflow_manager.query_available_dags()
+
+        text, words = airflow_manager._dag_terms["freeipa_deployment"]
+        assert text == "deploy freeipa freeipa"
+        assert words == frozenset({"deploy", "freeipa"})
+        # Precomputed terms stay out of the returned DAG records
+        assert set(dags[0]) == {"dag_id", "description", "tags", "is_paused", "file_token"}
+
+    @pytest.mark.asyncio
+    async def test_find_dag_for_task_no_matches(self, airflow_manager):
+        assert await airflow_manager.find_dag_for_task("reticulate splines") == []
+
+    @pytest.mark.asyncio
+    async def test_get_dag_details_batch_preserves_order(self, airflow_manager):
+        details = await airflow_manager.get_dag_details_batch(["b_dag", "a_dag"])
+
+        assert [d["dag_id"] for d in details] == ["b_dag", "a_dag"]
+
+    @pytest.mark.asyncio
+    async def test_find_dag_for_task_with_details(self, airflow_manager):
+        matches = await airflow_manager.find_dag_for_task("deploy freeipa server", include_details=True)
+
+        assert matches[0]["details"]["dag_id"] == "freeipa_deployment"
+        assert all("details" in m for m in matches)
+
+
+class TestGetContextForTask:
+    """Tests for combined task context."""
+
+    @pytest.mark.asyncio
+    async def test_skips_dag_discovery_on_high_confidence_cache_hit(self, airflow_manager):
+        result = MagicMock(content="doc", source_file="adr-0001.md", score=0.95)
+        airflow_manager.rag_service = MagicMock(spec=["search_documents"])
+        airflow_manager.rag_service.search_documents = AsyncMock(return_value=[result])
+
+        first = await airflow_manager.get_context_for_task("deploy freeipa", include_lineage=False)
+        second = await airflow_manager.get_context_for_task("deploy freeipa", include_lineage=False)
+
+        assert first["dags"]["skipped"] is False
+        assert first["dags"]["total_matches"] > 0
+        assert second["dags"]["skipped"] is True
+        assert second["dags"]["matches"] == []
+        assert second["rag"]["total_results"] == 1
+        assert len(airflow_manager.airflow_requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_cache_hit_still_discovers_dags(self, airflow_manager):
+        result = MagicMock(content="doc", source_file="adr-0001.md", score=0.2)
+        airflow_manager.rag_service = MagicMock(spec=["search_documents"])
+        airflow_manager.rag_service.search_documents = AsyncMock(return_value=[result])
+
+        await airflow_manager.get_context_for_task("deploy freeipa", include_lineage=False)
+        second = await airflow_manager.get_context_for_task("deploy freeipa", include_lineage=False)
+
+        assert second["dags"]["skipped"] is False
+        assert second["dags"]["total_matches"] > 0
+
+
+class TestSingleton:
+    """Tests for the thread-safe singleton."""
+
+    def test_concurrent_construction_returns_one_instance(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(AgentContextManager, "_instance", None)
+        setup_calls = []
+        original_setup = AgentContextManager._setup
+
+        def counting_setup(self):
+            setup_calls.append(self)
+            original_setup(self)
+
+        monkeypatch.setattr(AgentContextManager, "_setup", counting_setup)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: AgentContextManager(), range(32)))
+
+        assert all(inst is instances[0] for inst in instances)
+        assert len(setup_calls) == 1
+        assert instances[0]._initialized is True
@@ -0,0 +1,234 @@
+"""
+Tests for agents/query_cache.py - LRU + TTL cache for agent RAG queries.
+
+Tests cover:
+- Key normalization
+- LRU eviction and TTL expiry
+- Invalidation and stats
+- Semantic (embedding similarity) tier
+- AgentContextManager.query_rag cache integration
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Set test mode
+os.environ["TEST_MODE"] = "true"
+
+from agents.query_cache import QueryCache, SemanticQueryCache, make_query_key
+from agents.context import AgentContextManager
+
+
+class TestMakeQueryKey:
+    """Tests for cache key normalization."""
+
+    def test_normalizes_case_and_whitespace(self):
+        assert make_query_key("  List VMs ", 5) == make_query_key("list vms", 5)
+
+    def test_document_types_order_insensitive(self):
+        assert make_query_key("q", 5, ["config", "adr"]) == make_query_key("q", 5, ["adr", "config"])
+
+    def test_top_k_is_part_of_key(self):
+        assert make_query_key("q", 5) != make_query_key("q", 10)
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_get_miss_returns_none(self):
+        cache = QueryCache(max_size=4, ttl_seconds=60)
+        assert cache.get("missing") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_put_and_get(self):
+        cache = QueryCache(max_size=4, ttl_seconds=60)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_lru_eviction(self):
+        cache = QueryCache(max_size=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        cache = QueryCache(max_size=4, ttl_seconds=10)
+        with patch("agents.query_cache.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("agents.query_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = QueryCache(max_size=4, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_peek_does_not_count_or_reorder(self):
+        cache = QueryCache(max_size=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.peek("a") == 1
+        assert cache.peek("missing") is None
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["misses"] == 0
+
+        cache.put("c", 3)  # "a" is still least recently used
+        assert cache.peek("a") is None
+
+    def test_zero_size_disables_cache(self):
+        cache = QueryCache(max_size=0, ttl_seconds=60)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+
+    def test_env_configuration(self):
+        with patch.dict(os.environ, {"RAG_CACHE_SIZE": "7", "RAG_CACHE_TTL": "12.5"}):
+            cache = QueryCache()
+        assert cache.max_size == 7
+        assert cache.ttl_seconds == 12.5
+
+
+class TestSemanticQueryCache:
+    """Tests for SemanticQueryCache."""
+
+    def test_similar_embedding_hits(self):
+        cache = SemanticQueryCache(max_size=4, threshold=0.9, ttl_seconds=60, enabled=True)
+        cache.put("list vms", [1.0, 0.0, 0.1], "ctx", scope=(5, ()))
+        assert cache.get([1.0, 0.0, 0.0], scope=(5, ())) == "ctx"
+
+    def test_dissimilar_embedding_misses(self):
+        cache = SemanticQueryCache(max_size=4, threshold=0.9, ttl_seconds=60, enabled=True)
+        cache.put("list vms", [1.0, 0.0], "ctx")
+        assert cache.get([0.0, 1.0]) is None
+
+    def test_scope_must_match(self):
+        cache = SemanticQueryCache(max_size=4, threshold=0.9, ttl_seconds=60, enabled=True)
+        cache.put("list vms", [1.0, 0.0], "ctx", scope=(5, ()))
+        assert cache.get([1.0, 0.0], scope=(10, ())) is None
+
+    def test_bounded_size(self):
+        cache = SemanticQueryCache(max_size=2, threshold=0.9, ttl_seconds=60, enabled=True)
+        for i in range(3):
+            cache.put(i, [1.0, float(i)], i)
+        assert len(cache) == 2
+
+    def test_disabled_is_noop(self):
+        cache = SemanticQueryCache(max_size=4, threshold=0.9, ttl_seconds=60, enabled=False)
+        cache.put("q", [1.0], "ctx")
+        assert cache.get([1.0]) is None
+
+
+class TestQueryRagCaching:
+    """Tests for query_rag cache integration."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = object.__new__(AgentContextManager)
+        manager._initialized = False
+        with patch.dict(os.environ, {"RAG_CACHE_SIZE": "16", "RAG_CACHE_TTL": "60"}):
+            AgentContextManager.__init__(manager)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_hits_cache(self, manager):
+        result = MagicMock(content="doc", source_file="adr-0001.md", score=0.9)
+        manager.rag_service = MagicMock(spec=["search_documents"])
+        manager.rag_service.search_documents = AsyncMock(return_value=[result])
+
+        first = await manager.query_rag("Deploy FreeIPA")
+        second = await manager.query_rag("deploy freeipa ")
+
+        assert second is first
+        assert manager.rag_service.search_documents.await_count == 1
+        assert manager.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_query_hits_semantic_cache(self, manager):
+        result = MagicMock(content="doc", source_file="adr-0001.md", score=0.9)
+        embeddings = {"list vms": [1.0, 0.0], "show me the vms": [0.99, 0.05]}
+        manager.rag_service = MagicMock(spec=["search_documents", "embed"])
+        manager.rag_service.search_documents = AsyncMock(return_value=[result])
+        manager.rag_service.embed = MagicMock(side_effect=lambda q: embeddings[q])
+
+        first = await manager.query_rag("list vms")
+        second = await manager.query_rag("show me the vms")
+
+        assert second is first
+        assert manager.rag_service.search_documents.await_count == 1
+        assert manager.get_cache_stats()["semantic"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_qdrant_service_embed_feeds_semantic_cache(self, manager, tmp_path):
+        """QdrantRAGService.embed() enables the semantic tier and its vector is reused for search."""
+        from qdrant_rag_service import QdrantRAGService
+
+        embeddings = {"list vms": [1.0, 0.0], "show me the vms": [0.99, 0.05]}
+        model = MagicMock()
+        model.query_embed = MagicMock(side_effect=lambda q: iter([embeddings[q]]))
+        point = MagicMock(id=1, score=0.9, payload={"original_id": "c1", "content": "doc", "source_file": "adr-0001.md"})
+
+        service = QdrantRAGService(data_dir=str(tmp_path))
+        service.client = MagicMock()
+        service.client._get_or_init_model = MagicMock(return_value=model)
+        service.client.query_points = MagicMock(return_value=MagicMock(points=[point]))
+        service.documents_loaded = True
+        manager.rag_service = service
+
+        first = await manager.query_rag("list vms")
+        second = await manager.query_rag("show me the vms")
+
+        assert second is first
+        assert first.sources == ["adr-0001.md"]
+        assert service.client.query_points.call_count == 1
+        assert service.client.query_points.call_args.kwargs["query"] == [1.0, 0.0]
+        assert model.query_embed.call_count == 2
+        assert manager.get_cache_stats()["semantic"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reload_forces_fresh_search(self, manager):
+        """Reloading when documents are already loaded still drops cached results."""
+        result = MagicMock(content="doc", source_file="adr-0001.md", score=0.9)
+        manager.rag_service = MagicMock(spec=["search_documents", "_get_document_count"])
+        manager.rag_service.search_documents = AsyncMock(return_value=[result])
+        manager.rag_service._get_document_count = MagicMock(return_value=10)
+
+        await manager.query_rag("deploy freeipa")
+        await manager.reload_adrs()
+        await manager.query_rag("deploy freeipa")
+
+        assert manager.adrs_loaded is True
+        assert manager.rag_service.search_documents.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_results_not_cached(self, manager, tmp_path):
+        manager.rag_service = None
+        manager.data_dir = tmp_path
+
+        ctx = await manager.query_rag("nothing here")
+
+        assert ctx.total_results == 0
+        assert manager.get_cache_stats()["size"] == 0
+
+    def test_status_includes_cache_stats(self, manager):
+        manager.rag_service = None
+        manager.lineage_service = None
+        status = manager.get_status()
+        assert "rag_cache" in status
+        assert status["rag_cache"]["max_size"] == 16
@@ -3,32 +3,88 @@ Deterministic keyword/regex intent classifier.
 
 No AI models used. Classification is based on keyword matching and
 regex patterns for each IntentCategory.
+
+When google-re2 is installed, all regex patterns are compiled into a
+single RE2 set and matched in one linear-time scan; otherwise each
+pattern is searched with the standard library ``re`` module.
 """
 
+import logging
 import re
-from typing import List, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from .models import IntentCategory, ParsedIntent
 
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+logger = logging.getLogger("intent-parser.classifier")
+
+
+# Number of distinct normalized inputs whose classification is cached
+_CLASSIFY_CACHE_SIZE = 2048
 
 # Each category maps to (keywords, regex_patterns, priority_boost)
-# keywords: list of keyword sets - matching ANY set scores +1
+# keywords: list of keyword sets - each set whose words ALL appear scores +1
+# keyword_pairs (optional): (first_words, second_words) - each pair of one
+#   word from each set that both appear scores +1
 # regex_patterns: compiled regex patterns - each match scores +2
 # priority_boost: static priority boost for disambiguation (only applied if base score > 0)
 
-_CATEGORY_RULES: dict = {}
+# Keyword word -> (its bit, keyword-set bitmasks anchored on it); see _build_keyword_index
+_KeywordIndex = Dict[str, Tuple[int, List[Tuple[IntentCategory, int]]]]
+
+# Words for keyword matching: runs of word characters, optionally hyphenated
+_WORD_RE = re.compile(r"\w+(?:-\w+)*")
+
+# The only non-ASCII characters re.IGNORECASE matches against ASCII
+# letters. str.lower() leaves "ſ" and "ı" alone and turns "İ" into "i"
+# plus a combining dot, so fold them first.
+_RE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+# Shared pattern fragments
+_VM = r"(?:vm|virtual\s+machine)"
+_VMS = r"(?:vms?|virtual\s+machines?)"
+_DAG = r"(?:dag|workflow)"
+_DAGS = r"(?:dags?|workflows?)"
+_A_NEW = r"(?:a\s+)?(?:new\s+)?"
 
 
-def _kw(*words: str) -> re.Pattern:
-    """Build a regex that matches if ALL words appear (in any order)."""
-    parts = [rf"(?=.*\b{re.escape(w)}\b)" for w in words]
-    return re.compile("".join(parts), re.IGNORECASE)
+@lru_cache(maxsize=512)
+def _c(src: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """
+    Compile a pattern once; identical sources share one Pattern object.
+
+    Patterns keep re.IGNORECASE even though ASCII input is lowercased:
+    non-ASCII input is matched as is, and re folds characters such as
+    "ſ" (long s) onto ASCII letters, which str.lower() leaves alone.
+    """
+    return re.compile(src, flags)
+
+
+def _safe_esc(word: str) -> str:
+    """Escape a literal for a regex, skipping plain ASCII words that need none."""
+    return word if word.isascii() and word.isalnum() else re.escape(word)
 
 
+@lru_cache(maxsize=256)
+def _kw(*words: str) -> FrozenSet[str]:
+    """Build a keyword set that matches if ALL words appear (in any order)."""
+    return frozenset(w.lower() for w in words)
+
+
+@lru_cache(maxsize=256)
 def _any_kw(*words: str) -> re.Pattern:
     """Build a regex that matches if ANY word appears."""
-    escaped = [re.escape(w) for w in words]
-    return re.compile(r"\b(?:" + "|".join(escaped) + r")\b", re.IGNORECASE)
+    escaped = [_safe_esc(w) for w in words]
+    return _c(r"\b(?:" + "|".join(escaped) + r")\b")
 
 
 def _build_rules() -> dict:
@@ -45,9 +101,9 @@ def _build_rules() -> dict:
             _kw("all", "vm"),
         ],
         "patterns": [
-            re.compile(r"\blist\s+(?:all\s+)?(?:vms?|virtual\s+machines?)\b", re.I),
-            re.compile(r"\bshow\s+(?:(?:me\s+)?(?:the\s+)?)?(?:all\s+)?(?:vms?|virtual\s+machines?)\b", re.I),
-            re.compile(r"\bwhat\s+vms?\b", re.I),
+            _c(rf"\blist\s+(?:all\s+)?{_VMS}\b"),
+            _c(rf"\bshow\s+(?:(?:me\s+)?(?:the\s+)?)?(?:all\s+)?{_VMS}\b"),
+            _c(r"\bwhat\s+vms?\b"),
         ],
         "boost": 0,
     }
@@ -60,9 +116,9 @@ def _build_rules() -> dict:
             _kw("status", "vm"),
         ],
         "patterns": [
-            re.compile(r"\b(?:info|details?|describe|status)\s+(?:about\s+|for\s+|of\s+)?(?:vm|virtual\s+machine)\s+\w+", re.I),
-            re.compile(r"\bvm\s+(?:info|details?|status)\b", re.I),
-            re.compile(r"\btell\s+me\s+about\s+(?:vm|virtual\s+machine)\s+\w+", re.I),
+            _c(rf"\b(?:info|details?|describe|status)\s+(?:about\s+|for\s+|of\s+)?{_VM}\s+\w+"),
+            _c(r"\bvm\s+(?:info|details?|status)\b"),
+            _c(rf"\btell\s+me\s+about\s+{_VM}\s+\w+"),
         ],
         "boost": 1,
     }
@@ -79,12 +135,12 @@ def _build_rules() -> dict:
             _kw("create", "virtual"),
         ],
         "patterns": [
-            re.compile(r"\b(?:create|make|launch)\s+(?:a\s+)?(?:new\s+)?(?:vm|virtual\s+machine)\b", re.I),
-            re.compile(r"\bspin\s+up\s+(?:a\s+)?(?:(?:new|the)\s+)?(?:vm|virtual\s+machine|server)\b", re.I),
-            re.compile(r"\bdeploy\s+(?:a\s+)?(?:new\s+)?(?:vm|virtual\s+machine)\b", re.I),
-            re.compile(r"\bprovision\s+(?:a\s+)?(?:new\s+)?(?:vm|virtual\s+machine)\b", re.I),
+            _c(rf"\b(?:create|make|launch)\s+{_A_NEW}{_VM}\b"),
+            _c(r"\bspin\s+up\s+(?:a\s+)?(?:(?:new|the)\s+)?(?:vm|virtual\s+machine|server)\b"),
+            _c(rf"\bdeploy\s+{_A_NEW}{_VM}\b"),
+            _c(rf"\bprovision\s+{_A_NEW}{_VM}\b"),
             # "create a centos vm", "make a rhel vm" — word between article and vm
-            re.compile(r"^(?:create|make|launch)\s+(?:a\s+)?\w+\s+vm\b", re.I),
+            _c(r"^(?:create|make|launch)\s+(?:a\s+)?\w+\s+vm\b"),
         ],
         "boost": 0,
     }
@@ -97,8 +153,8 @@ def _build_rules() -> dict:
             _kw("terminate", "vm"),
         ],
         "patterns": [
-            re.compile(r"\b(?:delete|remove|destroy|terminate)\s+(?:the\s+)?(?:vm|virtual\s+machine)\s+\w+", re.I),
-            re.compile(r"\b(?:delete|remove|destroy|terminate)\s+\w+\s+vm\b", re.I),
+            _c(rf"\b(?:delete|remove|destroy|terminate)\s+(?:the\s+)?{_VM}\s+\w+"),
+            _c(r"\b(?:delete|remove|destroy|terminate)\s+\w+\s+vm\b"),
         ],
         "boost": 0,
     }
@@ -112,10 +168,10 @@ def _build_rules() -> dict:
             _kw("can", "create", "vm"),
         ],
         "patterns": [
-            re.compile(r"\bpre-?flight\b", re.I),
-            re.compile(r"\bcheck\s+(?:before|if)\s+(?:i\s+can\s+)?creat", re.I),
-            re.compile(r"\bcan\s+i\s+create\s+(?:a\s+)?vm", re.I),
-            re.compile(r"\bvalidate\s+(?:vm\s+)?(?:creation|deployment|provisioning)\b", re.I),
+            _c(r"\bpre-?flight\b"),
+            _c(r"\bcheck\s+(?:before|if)\s+(?:i\s+can\s+)?creat"),
+            _c(r"\bcan\s+i\s+create\s+(?:a\s+)?vm"),
+            _c(r"\bvalidate\s+(?:vm\s+)?(?:creation|deployment|provisioning)\b"),
         ],
         "boost": 2,
     }
@@ -132,9 +188,9 @@ def _build_rules() -> dict:
             _kw("all", "dag"),
         ],
         "patterns": [
-            re.compile(r"\blist\s+(?:all\s+)?(?:dags?|workflows?)\b", re.I),
-            re.compile(r"\bshow\s+(?:\w+\s+)?(?:dags?|workflows?)\b", re.I),
-            re.compile(r"\bwhat\s+(?:dags?|workflows?)\b", re.I),
+            _c(rf"\blist\s+(?:all\s+)?{_DAGS}\b"),
+            _c(rf"\bshow\s+(?:\w+\s+)?{_DAGS}\b"),
+            _c(rf"\bwhat\s+{_DAGS}\b"),
         ],
         "boost": 0,
     }
@@ -146,8 +202,8 @@ def _build_rules() -> dict:
             _kw("describe", "dag"),
         ],
         "patterns": [
-            re.compile(r"\b(?:info|details?|describe)\s+(?:about\s+|for\s+|of\s+)?(?:dag|workflow)\s+\w+", re.I),
-            re.compile(r"\bdag\s+(?:info|details?)\b", re.I),
+            _c(rf"\b(?:info|details?|describe)\s+(?:about\s+|for\s+|of\s+)?{_DAG}\s+\w+"),
+            _c(r"\bdag\s+(?:info|details?)\b"),
         ],
         "boost": 1,
     }
@@ -166,32 +222,33 @@ def _build_rules() -> dict:
         _kw("run", "workflow"),
         _kw("start", "workflow"),
     ]
-    # Add "deploy/install/set up <service>" AND "destroy/delete <service>" keywords
-    for svc_kw in _deploy_kws:
-        dag_trigger_keywords.append(_kw("deploy", svc_kw))
-        dag_trigger_keywords.append(_kw("install", svc_kw))
-        dag_trigger_keywords.append(_kw("destroy", svc_kw))
-        dag_trigger_keywords.append(_kw("delete", svc_kw))
-        dag_trigger_keywords.append(_kw("remove", svc_kw))
-        dag_trigger_keywords.append(_kw("teardown", svc_kw))
+    # "deploy/install <service>" AND "destroy/delete <service>": every
+    # (verb, service) pair present scores like its own _kw(verb, service)
+    dag_trigger_pairs = [
+        (
+            _kw("deploy", "install", "destroy", "delete", "remove", "teardown"),
+            _kw(*_deploy_kws),
+        )
+    ]
 
     # Build pattern alternation from service keywords for regex matching
     # Only use keywords >= 3 chars to avoid false positives
-    _svc_names = "|".join(re.escape(k) for k in _deploy_kws if len(k) >= 3)
+    _svc_names = "|".join(_safe_esc(k) for k in _deploy_kws if len(k) >= 3)
 
     dag_trigger_patterns = [
-        re.compile(r"\b(?:trigger|run|execute|start)\s+(?:the\s+)?(?:dag|workflow)\s+\w+", re.I),
-        re.compile(r"\b(?:trigger|run|execute|start)\s+(?:the\s+)?\w+\s+(?:dag|workflow)\b", re.I),
+        _c(rf"\b(?:trigger|run|execute|start)\s+(?:the\s+)?{_DAG}\s+\w+"),
+        _c(rf"\b(?:trigger|run|execute|start)\s+(?:the\s+)?\w+\s+{_DAG}\b"),
     ]
     if _svc_names:
-        dag_trigger_patterns.append(re.compile(rf"\bdeploy\s+(?:a\s+)?(?:new\s+)?(?:{_svc_names})\b", re.I))
-        dag_trigger_patterns.append(re.compile(rf"\b(?:destroy|delete|remove|teardown)\s+(?:the\s+)?(?:{_svc_names})\b", re.I))
-        dag_trigger_patterns.append(re.compile(rf"\binstall\s+(?:a\s+)?(?:new\s+)?(?:{_svc_names})\b", re.I))
+        dag_trigger_patterns.append(_c(rf"\bdeploy\s+{_A_NEW}(?:{_svc_names})\b"))
+        dag_trigger_patterns.append(_c(rf"\b(?:destroy|delete|remove|teardown)\s+(?:the\s+)?(?:{_svc_names})\b"))
+        dag_trigger_patterns.append(_c(rf"\binstall\s+{_A_NEW}(?:{_svc_names})\b"))
         # "set up <service>" only as imperative (start of input, not in a question)
-        dag_trigger_patterns.append(re.compile(rf"^(?:please\s+)?set\s+up\s+(?:a\s+)?(?:new\s+)?(?:{_svc_names})\b", re.I))
+        dag_trigger_patterns.append(_c(rf"^(?:please\s+)?set\s+up\s+{_A_NEW}(?:{_svc_names})\b"))
 
     rules[IntentCategory.DAG_TRIGGER] = {
         "keywords": dag_trigger_keywords,
+        "keyword_pairs": dag_trigger_pairs,
         "patterns": dag_trigger_patterns,
         "boost": 0,
     }
@@ -206,10 +263,10 @@ def _build_rules() -> dict:
             _kw("find", "document"),
         ],
         "patterns": [
-            re.compile(r"\b(?:search|query)\s+(?:the\s+)?(?:rag|knowledge\s+base|docs?|documentation)\b", re.I),
-            re.compile(r"\bfind\s+(?:docs?|documentation|information)\s+(?:about|on|for)\b", re.I),
-            re.compile(r"\bhow\s+(?:do|to|can)\s+(?:i|we)\b", re.I),
-            re.compile(r"\blookup\s+\w+", re.I),
+            _c(r"\b(?:search|query)\s+(?:the\s+)?(?:rag|knowledge\s+base|docs?|documentation)\b"),
+            _c(r"\bfind\s+(?:docs?|documentation|information)\s+(?:about|on|for)\b"),
+            _c(r"\bhow\s+(?:do|to|can)\s+(?:i|we)\b"),
+            _c(r"\blookup\s+\w+"),
         ],
         "boost": 0,
     }
@@ -222,9 +279,9 @@ def _build_rules() -> dict:
             _kw("import", "document"),
         ],
         "patterns": [
-            re.compile(r"\b(?:ingest|index)\s+(?:the\s+)?(?:docs?|documents?|content)\b", re.I),
-            re.compile(r"\badd\s+(?:\w+\s+)?(?:to\s+)?(?:rag|knowledge\s+base)\b", re.I),
-            re.compile(r"\badd\s+(?:the\s+)?(?:docs?|documents?)\b", re.I),
+            _c(r"\b(?:ingest|index)\s+(?:the\s+)?(?:docs?|documents?|content)\b"),
+            _c(r"\badd\s+(?:\w+\s+)?(?:to\s+)?(?:rag|knowledge\s+base)\b"),
+            _c(r"\badd\s+(?:the\s+)?(?:docs?|documents?)\b"),
         ],
         "boost": 1,
     }
@@ -237,9 +294,9 @@ def _build_rules() -> dict:
             _kw("document", "count"),
         ],
         "patterns": [
-            re.compile(r"\brag\s+(?:stats|statistics|status)\b", re.I),
-            re.compile(r"\bhow\s+many\s+documents?\b", re.I),
-            re.compile(r"\bknowledge\s+base\s+(?:stats?|statistics?|info|status)\b", re.I),
+            _c(r"\brag\s+(?:stats|statistics|status)\b"),
+            _c(r"\bhow\s+many\s+documents?\b"),
+            _c(r"\bknowledge\s+base\s+(?:stats?|statistics?|info|status)\b"),
         ],
         "boost": 1,
     }
@@ -254,10 +311,10 @@ def _build_rules() -> dict:
             _kw("service", "status"),
         ],
         "patterns": [
-            re.compile(r"\b(?:system|airflow|service)\s+(?:status|health)\b", re.I),
-            re.compile(r"\bis\s+(?:the\s+)?(?:system|airflow|everything)\s+(?:running|up|ok|healthy)\b", re.I),
-            re.compile(r"\bcheck\s+(?:system\s+)?(?:health|status)\b", re.I),
-            re.compile(r"\b(?:health|status)\s+check\b", re.I),
+            _c(r"\b(?:system|airflow|service)\s+(?:status|health)\b"),
+            _c(r"\bis\s+(?:the\s+)?(?:system|airflow|everything)\s+(?:running|up|ok|healthy)\b"),
+            _c(r"\bcheck\s+(?:system\s+)?(?:health|status)\b"),
+            _c(r"\b(?:health|status)\s+check\b"),
         ],
         "boost": 0,
     }
@@ -270,9 +327,9 @@ def _build_rules() -> dict:
             _kw("capabilities"),
         ],
         "patterns": [
-            re.compile(r"\b(?:system|qubinode)\s+(?:info|information|overview)\b", re.I),
-            re.compile(r"\btell\s+me\s+about\s+(?:the\s+)?(?:system|qubinode|architecture)\b", re.I),
-            re.compile(r"\bwhat\s+(?:capabilities|features)\s+(?:do\s+you|does\s+(?:this|it))\s+have\b", re.I),
+            _c(r"\b(?:system|qubinode)\s+(?:info|information|overview)\b"),
+            _c(r"\btell\s+me\s+about\s+(?:the\s+)?(?:system|qubinode|architecture)\b"),
+            _c(r"\bwhat\s+(?:capabilities|features)\s+(?:do\s+you|does\s+(?:this|it))\s+have\b"),
         ],
         "boost": 0,
     }
@@ -290,12 +347,15 @@ def _build_rules() -> dict:
             _kw("failing"),
         ],
         "patterns": [
-            re.compile(r"\b(?:diagnose|troubleshoot|debug|fix)\s+", re.I),
-            re.compile(r"\b(?:is|not)\s+(?:working|responding|running)\b", re.I),
-            re.compile(r"\bis\s+(?:broken|down)\b", re.I),
-            re.compile(r"\bwhy\s+(?:is|did|does)\s+.+?\s+(?:fail|error|crash|hang)", re.I),
-            re.compile(r"\bsomething\s+(?:is\s+)?(?:wrong|broken)\b", re.I),
-            re.compile(r"\b(?:error|failure|problem|issue)\s+(?:in|with|during)\b", re.I),
+            _c(r"\b(?:diagnose|troubleshoot|debug|fix)\s+"),
+            _c(r"\b(?:is|not)\s+(?:working|responding|running)\b"),
+            _c(r"\bis\s+(?:broken|down)\b"),
+            # Same matches as "\s+.+?\s+", but the middle either starts and
+            # ends on non-space or is one blank, so a long whitespace run is
+            # not split three ways (cubic backtracking under plain ``re``).
+            _c(r"\bwhy\s+(?:is|did|does)\s+(?:\S(?:.*?\S)?|[^\S\n])\s+(?:fail|error|crash|hang)"),
+            _c(r"\bsomething\s+(?:is\s+)?(?:wrong|broken)\b"),
+            _c(r"\b(?:error|failure|problem|issue)\s+(?:in|with|during)\b"),
         ],
         "boost": 0,
     }
@@ -308,9 +368,9 @@ def _build_rules() -> dict:
             _kw("similar", "errors"),
         ],
         "patterns": [
-            re.compile(r"\b(?:troubleshooting|past|previous)\s+(?:history|solutions?|fixes?|attempts?)\b", re.I),
-            re.compile(r"\bhas\s+this\s+(?:been\s+)?(?:solved|fixed)\s+before\b", re.I),
-            re.compile(r"\bsimilar\s+(?:errors?|issues?|problems?)\b", re.I),
+            _c(r"\b(?:troubleshooting|past|previous)\s+(?:history|solutions?|fixes?|attempts?)\b"),
+            _c(r"\bhas\s+this\s+(?:been\s+)?(?:solved|fixed)\s+before\b"),
+            _c(r"\bsimilar\s+(?:errors?|issues?|problems?)\b"),
         ],
         "boost": 2,
     }
@@ -323,9 +383,9 @@ def _build_rules() -> dict:
             _kw("log", "attempt"),
         ],
         "patterns": [
-            re.compile(r"\blog\s+(?:the\s+)?(?:troubleshooting|solution|attempt|fix)\b", re.I),
-            re.compile(r"\brecord\s+(?:the\s+)?(?:solution|fix|attempt)\b", re.I),
-            re.compile(r"\bsave\s+(?:the\s+)?(?:solution|fix)\b", re.I),
+            _c(r"\blog\s+(?:the\s+)?(?:troubleshooting|solution|attempt|fix)\b"),
+            _c(r"\brecord\s+(?:the\s+)?(?:solution|fix|attempt)\b"),
+            _c(r"\bsave\s+(?:the\s+)?(?:solution|fix)\b"),
         ],
         "boost": 2,
     }
@@ -339,9 +399,9 @@ def _build_rules() -> dict:
             _kw("downstream"),
         ],
         "patterns": [
-            re.compile(r"\b(?:dag\s+)?lineage\b", re.I),
-            re.compile(r"\b(?:upstream|downstream)\s+(?:of|for|deps?|dependencies)\b", re.I),
-            re.compile(r"\bwhat\s+(?:depends|relies)\s+on\b", re.I),
+            _c(r"\b(?:dag\s+)?lineage\b"),
+            _c(r"\b(?:upstream|downstream)\s+(?:of|for|deps?|dependencies)\b"),
+            _c(r"\bwhat\s+(?:depends|relies)\s+on\b"),
         ],
         "boost": 1,
     }
@@ -354,9 +414,9 @@ def _build_rules() -> dict:
             _kw("what", "affected"),
         ],
         "patterns": [
-            re.compile(r"\bblast\s+radius\b", re.I),
-            re.compile(r"\b(?:failure|impact)\s+(?:analysis|assessment)\b", re.I),
-            re.compile(r"\bwhat\s+(?:would\s+be\s+|is\s+)?affected\s+if\b", re.I),
+            _c(r"\bblast\s+radius\b"),
+            _c(r"\b(?:failure|impact)\s+(?:analysis|assessment)\b"),
+            _c(r"\bwhat\s+(?:would\s+be\s+|is\s+)?affected\s+if\b"),
         ],
         "boost": 2,
     }
@@ -368,9 +428,9 @@ def _build_rules() -> dict:
             _kw("how", "use"),
         ],
         "patterns": [
-            re.compile(r"^help$", re.I),
-            re.compile(r"\bhow\s+(?:do\s+i\s+)?use\s+(?:this|qubinode)\b", re.I),
-            re.compile(r"\bwhat\s+(?:can\s+)?(?:you|this)\s+do\b", re.I),
+            _c(r"^help$"),
+            _c(r"\bhow\s+(?:do\s+i\s+)?use\s+(?:this|qubinode)\b"),
+            _c(r"\bwhat\s+(?:can\s+)?(?:you|this)\s+do\b"),
         ],
         "boost": 0,
     }
@@ -378,62 +438,173 @@ def _build_rules() -> dict:
     return rules
 
 
+@lru_cache(maxsize=1)
 def _get_rules() -> dict:
     """Lazy-initialize rules."""
-    global _CATEGORY_RULES
-    if not _CATEGORY_RULES:
-        _CATEGORY_RULES = _build_rules()
-    return _CATEGORY_RULES
+    return _build_rules()
 
 
-def classify(text: str) -> ParsedIntent:
+def _build_keyword_index(rules: dict) -> _KeywordIndex:
     """
-    Classify natural language text into an IntentCategory.
+    Assign every keyword word a bit and index each keyword set's bitmask
+    under its least common word.
 
-    Returns a ParsedIntent with the best-matching category and confidence.
+    A keyword set can only match if that word is in the input, so classify
+    visits just the sets reachable from the input's own words, once each,
+    and tests each with a single AND against the input's word bitmask.
     """
-    if not text or not text.strip():
-        return ParsedIntent(
-            category=IntentCategory.UNKNOWN,
-            confidence=0.0,
-            raw_input=text or "",
-        )
+    counts = Counter(word for rule in rules.values() for required in rule["keywords"] for word in required)
+    bits = {word: 1 << i for i, word in enumerate(sorted(counts))}
+    index: _KeywordIndex = {word: (bit, []) for word, bit in bits.items()}
+    for category, rule in rules.items():
+        for required in rule["keywords"]:
+            anchor = min(required, key=lambda word: (counts[word], word))
+            mask = sum(bits[word] for word in required)
+            index[anchor][1].append((category, mask))
+    return index
+
+
+@lru_cache(maxsize=1)
+def _get_keyword_index() -> _KeywordIndex:
+    """Lazy-initialize the keyword index."""
+    return _build_keyword_index(_get_rules())
+
+
+def _build_pattern_set(rules: dict) -> Tuple[Optional["re2.Set"], List[IntentCategory]]:
+    """Compile every regex pattern into a single RE2 set, if RE2 is available."""
+    if not RE2_AVAILABLE:
+        return None, []
+
+    pattern_set = re2.Set.SearchSet()
+    owners: List[IntentCategory] = []
+    try:
+        for category, rule in rules.items():
+            for pattern in rule["patterns"]:
+                src = pattern.pattern
+                if pattern.flags & re.IGNORECASE:
+                    src = f"(?i){src}"
+                pattern_set.Add(src)
+                owners.append(category)
+        pattern_set.Compile()
+    except re2.error as e:
+        logger.warning(f"RE2 pattern set unavailable, using re: {e}")
+        return None, []
+    return pattern_set, owners
+
+
+# ASCII input that re and RE2 match differently: re's \s also matches
+# \x0b and \x1c-\x1f, and re's $ also matches before a trailing newline
+_RE2_MISMATCH = re.compile(r"[\x0b\x1c-\x1f]|\n\Z")
+
+
+@lru_cache(maxsize=1)
+def _get_pattern_set() -> Tuple[Optional["re2.Set"], List[IntentCategory]]:
+    """
+    Lazy-initialize the RE2 pattern set and the category owning each
+    pattern index (the set is None when RE2 is unavailable).
+    """
+    return _build_pattern_set(_get_rules())
 
-    text_clean = text.strip()
-    rules = _get_rules()
 
-    scores: List[Tuple[IntentCategory, float]] = []
+def _score_patterns(text: str, rules: dict) -> Dict[IntentCategory, float]:
+    """Score regex pattern matches (+2 each) per category."""
+    scores: Dict[IntentCategory, float] = {}
+
+    # RE2 word boundaries and classes are ASCII-only, so Unicode input,
+    # and ASCII input RE2 would read differently, goes through re to keep
+    # matching identical
+    pattern_set, owners = _get_pattern_set()
+    if pattern_set is not None and text.isascii() and not _RE2_MISMATCH.search(text):
+        for index in pattern_set.Match(text) or ():
+            scores[owners[index]] = scores.get(owners[index], 0.0) + 2.0
+        return scores
 
     for category, rule in rules.items():
-        base_score = 0.0
+        for pattern in rule["patterns"]:
+            if pattern.search(text):
+                scores[category] = scores.get(category, 0.0) + 2.0
+    return scores
 
-        # Check keyword patterns
-        for kw_pattern in rule["keywords"]:
-            if kw_pattern.search(text_clean):
-                base_score += 1.0
 
-        # Check regex patterns (weighted higher)
-        for pattern in rule["patterns"]:
-            if pattern.search(text_clean):
-                base_score += 2.0
+def _tokenize(text: str) -> FrozenSet[str]:
+    """
+    Split text into the set of lowercase words it contains.
+
+    Non-ASCII text is folded the way re.IGNORECASE compares it with the
+    ASCII keywords. Hyphenated words also contribute every contiguous sub-run, so
+    "step-ca-server" yields "step-ca" and "ca" as well as its own text,
+    mirroring what a word-boundary regex search would find.
+    """
+    folded = text.lower() if text.isascii() else text.translate(_RE_FOLD).lower()
+    tokens = set()
+    for word in _WORD_RE.findall(folded):
+        tokens.add(word)
+        if "-" in word:
+            parts = word.split("-")
+            for i in range(len(parts)):
+                for j in range(i + 1, len(parts) + 1):
+                    tokens.add("-".join(parts[i:j]))
+    return frozenset(tokens)
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _classify_cached(text_clean: str) -> ParsedIntent:
+    """
+    Score stripped text against every category.
+
+    Keywords are lowercase and patterns case-insensitive, so ASCII text is
+    lowercased before caching and inputs differing only in case share an
+    entry. Other text is passed as is.
+    """
+    rules = _get_rules()
+
+    tokens = _tokenize(text_clean)
+
+    # Check keyword sets reachable from the input's words
+    keyword_index = _get_keyword_index()
+    token_mask = 0
+    candidates: List[Tuple[IntentCategory, int]] = []
+    for token in tokens:
+        entry = keyword_index.get(token)
+        if entry is not None:
+            token_mask |= entry[0]
+            candidates.extend(entry[1])
+
+    keyword_scores: Dict[IntentCategory, float] = {}
+    for category, mask in candidates:
+        if token_mask & mask == mask:
+            keyword_scores[category] = keyword_scores.get(category, 0.0) + 1.0
+
+    # Check regex patterns (weighted higher)
+    pattern_scores = _score_patterns(text_clean, rules)
+
+    # Track the best and runner-up scores; every real score is positive, so
+    # 0.0 means "no such category". Ties keep the earlier category.
+    best_category = IntentCategory.UNKNOWN
+    best_score = 0.0
+    second_score = 0.0
+
+    for category, rule in rules.items():
+        base_score = keyword_scores.get(category, 0.0) + pattern_scores.get(category, 0.0)
+        for first_words, second_words in rule.get("keyword_pairs", ()):
+            base_score += len(first_words & tokens) * len(second_words & tokens)
 
         # Only apply boost if there was a real match (keyword or pattern)
         if base_score > 0:
             score = base_score + rule["boost"] * 0.5
-            scores.append((category, score))
+            if score > best_score:
+                second_score = best_score
+                best_category, best_score = category, score
+            elif score > second_score:
+                second_score = score
 
-    if not scores:
+    if not best_score:
         return ParsedIntent(
             category=IntentCategory.UNKNOWN,
             confidence=0.0,
             raw_input=text_clean,
         )
 
-    # Sort by score descending
-    scores.sort(key=lambda x: x[1], reverse=True)
-
-    best_category, best_score = scores[0]
-
     # Require minimum score to avoid matching on noise
     if best_score < 1.0:
         return ParsedIntent(
@@ -448,8 +619,8 @@ def classify(text: str) -> ParsedIntent:
     confidence = min(best_score / max_possible, 1.0)
 
     # Boost confidence if clear winner (big gap to second)
-    if len(scores) >= 2:
-        gap = best_score - scores[1][1]
+    if second_score:
+        gap = best_score - second_score
         if gap >= 2.0:
             confidence = min(confidence + 0.1, 1.0)
 
@@ -458,3 +629,40 @@ def classify(text: str) -> ParsedIntent:
         confidence=round(confidence, 2),
         raw_input=text_clean,
     )
+
+
+def classify(text: str) -> ParsedIntent:
+    """
+    Classify natural language text into an IntentCategory.
+
+    Returns a ParsedIntent with the best-matching category and confidence.
+    """
+    if not text or not text.strip():
+        return ParsedIntent(
+            category=IntentCategory.UNKNOWN,
+            confidence=0.0,
+            raw_input=text or "",
+        )
+
+    text_clean = text.strip()
+    # str.lower() does not fold non-ASCII text the way re.IGNORECASE does
+    # ("İ" becomes two code points), so only ASCII keys are lowercased
+    key = text_clean.lower() if text_clean.isascii() else text_clean
+    # Callers may mutate the result, so hand out a copy of the cached intent
+    return _classify_cached(key).model_copy(update={"raw_input": text_clean}, deep=True)
+
+
+classify.cache_clear = _classify_cached.cache_clear
+
+
+def clear_caches() -> None:
+    """Drop built rules and cached results, e.g. after DAGs are added or removed."""
+    from .dag_registry import clear_caches as clear_registry_caches
+    from .entity_extractor import extract
+
+    clear_registry_caches()
+    extract.cache_clear()
+    _get_rules.cache_clear()
+    _get_keyword_index.cache_clear()
+    _get_pattern_set.cache_clear()
+    _classify_cached.cache_clear()
@@ -7,13 +7,26 @@ Scans airflow/dags/ at import time and builds:
 
 This means adding a new DAG file with proper tags/description automatically
 makes it discoverable by the intent parser — no code changes needed.
+
+Parsed metadata is cached on disk keyed by file mtime and size, so only
+new or changed DAG files are re-read on later starts.
+
+Configuration (environment):
+- AIRFLOW_DAGS_PATH: DAG directory to scan (default: autodetected)
+- DAG_REGISTRY_CACHE: Metadata cache file
+  (default: $XDG_CACHE_HOME/qubinode_navigator/dag_registry.json, empty disables)
 """
 
+import ast
+import json
 import logging
 import os
 import re
+import tempfile
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -46,6 +59,24 @@ _GENERIC_WORDS = frozenset(
 # Minimum tag/keyword length to avoid noise
 _MIN_KEYWORD_LEN = 2
 
+# dag_id parts must be longer and must not be filler words
+_MIN_DAG_ID_PART_LEN = 3
+_STOP_WORDS = frozenset({"the", "and", "for"})
+_EXCLUDED_DAG_ID_PARTS = _GENERIC_WORDS | _STOP_WORDS
+
+# Helper modules in the DAGs folder that never define a DAG
+_SKIP_FILES = frozenset({"dag_factory.py", "dag_helpers.py", "dag_loader.py", "dag_logging_mixin.py"})
+
+# Regex fallback for DAG metadata; each field is taken from its first match
+_DAG_CTOR_RE = re.compile(r"""DAG\s*\(\s*["']([^"']+)["']""")
+_DAG_ID_KW_RE = re.compile(r"""dag_id\s*=\s*["']([^"']+)["']""")
+_TAGS_RE = re.compile(r"tags\s*=\s*\[([^\]]+)\]")
+_DESCRIPTION_RE = re.compile(r"""description\s*=\s*["']([^"']+)["']""")
+_TAG_RE = re.compile(r"""["']([^"']+)["']""")
+
+# Bump whenever _parse_dag_metadata changes what it extracts
+_CACHE_VERSION = 2
+
 
 def _find_dags_path() -> Path:
     """Locate the airflow/dags directory."""
@@ -62,27 +93,62 @@ def _find_dags_path() -> Path:
     return Path("/app/airflow/dags")  # Default, may not exist
 
 
-def _parse_dag_metadata(file_path: Path) -> dict:
-    """Parse a DAG file and extract dag_id, tags, and description."""
+def _literal(node: ast.expr) -> Any:
+    """Evaluate a constant expression node, or return None if it is not one."""
     try:
-        content = file_path.read_text()
-    except Exception:
-        return {}
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
 
-    dag_id_m = re.search(r'DAG\s*\(\s*["\']([^"\']+)["\']', content)
-    if not dag_id_m:
-        dag_id_m = re.search(r'dag_id\s*=\s*["\']([^"\']+)["\']', content)
+
+def _is_dag_constructor(func: ast.expr) -> bool:
+    """Match ``DAG(...)`` and attribute forms such as ``models.DAG(...)``."""
+    return (isinstance(func, ast.Name) and func.id == "DAG") or (isinstance(func, ast.Attribute) and func.attr == "DAG")
+
+
+def _parse_dag_call(content: str) -> Optional[dict]:
+    """
+    Extract metadata from the first DAG(...) call with a literal dag_id.
+
+    Returns None if the source does not parse or has no such call, e.g.
+    DAGs built by a factory function.
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not _is_dag_constructor(node.func):
+            continue
+        kwargs = {kw.arg: kw.value for kw in node.keywords if kw.arg}
+        dag_id_node = node.args[0] if node.args else kwargs.get("dag_id")
+        dag_id = _literal(dag_id_node) if dag_id_node is not None else None
+        if not isinstance(dag_id, str) or not dag_id:
+            continue
+
+        tags = _literal(kwargs["tags"]) if "tags" in kwargs else None
+        description = _literal(kwargs["description"]) if "description" in kwargs else None
+        return {
+            "dag_id": dag_id,
+            "tags": [t for t in tags if isinstance(t, str)] if isinstance(tags, (list, tuple, set)) else [],
+            "description": description if isinstance(description, str) else "",
+        }
+    return None
+
+
+def _parse_dag_metadata_regex(content: str) -> dict:
+    """Regex fallback for DAG files the AST pass cannot resolve."""
+    dag_id_m = _DAG_CTOR_RE.search(content) or _DAG_ID_KW_RE.search(content)
     if not dag_id_m:
         return {}
 
     dag_id = dag_id_m.group(1)
 
-    tags_m = re.search(r"tags\s*=\s*\[([^\]]+)\]", content)
-    tags = []
-    if tags_m:
-        tags = re.findall(r'["\']([^"\']+)["\']', tags_m.group(1))
+    tags_m = _TAGS_RE.search(content)
+    tags = _TAG_RE.findall(tags_m.group(1)) if tags_m else []
 
-    desc_m = re.search(r'description\s*=\s*["\']([^"\']+)["\']', content)
+    desc_m = _DESCRIPTION_RE.search(content)
     description = desc_m.group(1) if desc_m else ""
 
     return {
@@ -92,6 +158,59 @@ def _parse_dag_metadata(file_path: Path) -> dict:
     }
 
 
+def _parse_dag_metadata(file_path: Path) -> dict:
+    """Parse a DAG file and extract dag_id, tags, and description."""
+    try:
+        content = file_path.read_text()
+    except Exception:
+        return {}
+
+    meta = _parse_dag_call(content)
+    if meta is None:
+        meta = _parse_dag_metadata_regex(content)
+    return meta
+
+
+def _cache_path() -> Optional[Path]:
+    """Return the metadata cache file, or None when caching is disabled."""
+    default = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "qubinode_navigator" / "dag_registry.json"
+    path = os.getenv("DAG_REGISTRY_CACHE", str(default))
+    return Path(path) if path else None
+
+
+def _load_cache(cache_path: Optional[Path], dags_path: Path) -> Dict[str, dict]:
+    """Load cached per-file metadata for dags_path, or {} if unusable."""
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION or data.get("dags_path") != str(dags_path):
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(cache_path: Optional[Path], dags_path: Path, files: Dict[str, dict]) -> None:
+    """Atomically write per-file metadata; failures only cost a re-parse."""
+    if cache_path is None:
+        return
+    payload = {"version": _CACHE_VERSION, "dags_path": str(dags_path), "files": files}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=".dag_registry.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write DAG registry cache {cache_path}: {e}")
+
+
 def scan_dags() -> List[dict]:
     """Scan all DAG files and return metadata list."""
     dags_path = _find_dags_path()
@@ -99,42 +218,65 @@ def scan_dags() -> List[dict]:
         logger.warning(f"DAGs path not found: {dags_path}")
         return []
 
-    skip_files = {"dag_factory.py", "dag_helpers.py", "dag_loader.py", "dag_logging_mixin.py"}
+    entries: List[Tuple[str, str, int, int]] = []
+    with os.scandir(dags_path) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".py") or name.startswith(("_", ".")) or name in _SKIP_FILES:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((name, entry.path, st.st_mtime_ns, st.st_size))
+    entries.sort()
+
+    cache_path = _cache_path()
+    cached = _load_cache(cache_path, dags_path)
+    files: Dict[str, dict] = {}
     results = []
-
-    for dag_file in sorted(dags_path.glob("*.py")):
-        if dag_file.name.startswith("_") or dag_file.name in skip_files:
-            continue
-        meta = _parse_dag_metadata(dag_file)
+    parsed = 0
+
+    for name, path, mtime_ns, size in entries:
+        hit = cached.get(name)
+        if isinstance(hit, dict) and hit.get("mtime_ns") == mtime_ns and hit.get("size") == size:
+            meta = hit.get("meta") or {}
+        else:
+            meta = _parse_dag_metadata(Path(path))
+            parsed += 1
+        files[name] = {"mtime_ns": mtime_ns, "size": size, "meta": meta}
         if meta:
             results.append(meta)
 
-    logger.info(f"DAG registry scanned {len(results)} DAGs from {dags_path}")
+    if parsed or files.keys() != cached.keys():
+        _save_cache(cache_path, dags_path, files)
+
+    logger.info(f"DAG registry scanned {len(results)} DAGs from {dags_path} ({parsed} parsed, {len(entries) - parsed} cached)")
     return results
 
 
+def _dag_id_keywords(dag_id: str) -> Set[str]:
+    """Meaningful parts of a dag_id, e.g. "vyos_router_deployment" -> {"vyos", "router"}."""
+    parts = set(dag_id.lower().split("_")) - _EXCLUDED_DAG_ID_PARTS
+    return {part for part in parts if len(part) >= _MIN_DAG_ID_PART_LEN}
+
+
+def _tag_keywords(tags: List[str]) -> Set[str]:
+    """Normalized tags that are specific enough to act as service keywords."""
+    cleaned = {tag.lower().strip() for tag in tags} - _GENERIC_WORDS
+    return {tag for tag in cleaned if len(tag) >= _MIN_KEYWORD_LEN}
+
+
 def _extract_service_keywords(dag: dict) -> Set[str]:
     """
-    Extract meaningful service keywords from a DAG's tags and description.
+    Extract meaningful service keywords from a DAG's tags and dag_id.
 
     These are words specific enough to identify this DAG when a user says
     "deploy <keyword>".
     """
-    keywords = set()
-
-    # From tags
-    for tag in dag.get("tags", []):
-        tag_clean = tag.lower().strip()
-        if tag_clean not in _GENERIC_WORDS and len(tag_clean) >= _MIN_KEYWORD_LEN:
-            keywords.add(tag_clean)
-
-    # From dag_id: split on _ and take meaningful parts
-    dag_id = dag.get("dag_id", "")
-    for part in dag_id.lower().split("_"):
-        if part not in _GENERIC_WORDS and len(part) >= 3 and part not in {"the", "and", "for"}:
-            keywords.add(part)
-
-    return keywords
+    return _tag_keywords(dag.get("tags", [])) | _dag_id_keywords(dag.get("dag_id", ""))
 
 
 def _load_manifest() -> List[dict]:
@@ -162,6 +304,21 @@ def _load_manifest() -> List[dict]:
     return results
 
 
+@lru_cache(maxsize=1)
+def _discover_dags() -> Tuple[dict, ...]:
+    """
+    Scan DAG files once per process, falling back to the static manifest.
+
+    Shared by build_service_dag_map and build_deploy_keywords so the DAG
+    folder is walked once rather than once per accessor.
+    """
+    dags = scan_dags()
+    if not dags:
+        logger.warning("No DAGs found via filesystem scan, using static manifest")
+        dags = _load_manifest()
+    return tuple(dags)
+
+
 def build_service_dag_map() -> Dict[str, str]:
     """
     Build a keyword -> dag_id mapping from all discovered DAGs.
@@ -183,33 +340,22 @@ def build_service_dag_map() -> Dict[str, str]:
     Falls back to the static manifest (dag_manifest.yaml) if no DAGs are
     found via filesystem scan.
     """
-    dags = scan_dags()
-    if not dags:
-        logger.warning("No DAGs found via filesystem scan, using static manifest")
-        dags = _load_manifest()
+    dags = _discover_dags()
     mapping: Dict[str, str] = {}
 
+    # Sort once and derive each DAG's keywords once for both passes
+    per_dag = [(dag["dag_id"], _dag_id_keywords(dag["dag_id"]), _tag_keywords(dag.get("tags", []))) for dag in sorted(dags, key=itemgetter("dag_id"))]
+
     # Two passes: first dag_id-derived keywords (strong signal), then tag keywords
     # Pass 1: keywords that appear in the dag_id itself
-    for dag in sorted(dags, key=lambda d: d["dag_id"]):
-        dag_id = dag["dag_id"]
-        dag_id_parts = set()
-        for part in dag_id.lower().split("_"):
-            if part not in _GENERIC_WORDS and len(part) >= 3 and part not in {"the", "and", "for"}:
-                dag_id_parts.add(part)
-
-        for kw in dag_id_parts:
-            if kw not in mapping:
-                mapping[kw] = dag_id
+    for dag_id, id_keywords, _ in per_dag:
+        for kw in id_keywords:
+            mapping.setdefault(kw, dag_id)
 
     # Pass 2: keywords from tags (only if not already claimed by a dag_id match)
-    for dag in sorted(dags, key=lambda d: d["dag_id"]):
-        dag_id = dag["dag_id"]
-        for tag in dag.get("tags", []):
-            tag_clean = tag.lower().strip()
-            if tag_clean not in _GENERIC_WORDS and len(tag_clean) >= _MIN_KEYWORD_LEN:
-                if tag_clean not in mapping:
-                    mapping[tag_clean] = dag_id
+    for dag_id, _, tag_keywords in per_dag:
+        for kw in tag_keywords:
+            mapping.setdefault(kw, dag_id)
 
     logger.info(f"DAG registry built {len(mapping)} service keyword mappings")
     return mapping
@@ -230,22 +376,20 @@ def build_deploy_keywords() -> List[str]:
     return sorted(service_map.keys())
 
 
-# Module-level cache (built once at import time)
-_service_dag_map: Dict[str, str] = {}
-_deploy_keywords: List[str] = []
-
-
+@lru_cache(maxsize=1)
 def get_service_dag_map() -> Dict[str, str]:
     """Get the cached service-to-DAG mapping."""
-    global _service_dag_map
-    if not _service_dag_map:
-        _service_dag_map = build_service_dag_map()
-    return _service_dag_map
+    return build_service_dag_map()
 
 
+@lru_cache(maxsize=1)
 def get_deploy_keywords() -> List[str]:
     """Get the cached list of deploy keywords."""
-    global _deploy_keywords
-    if not _deploy_keywords:
-        _deploy_keywords = build_deploy_keywords()
-    return _deploy_keywords
+    return sorted(get_service_dag_map())
+
+
+def clear_caches() -> None:
+    """Forget scanned DAGs and derived mappings so the next lookup rescans."""
+    _discover_dags.cache_clear()
+    get_service_dag_map.cache_clear()
+    get_deploy_keywords.cache_clear()
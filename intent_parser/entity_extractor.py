@@ -5,11 +5,145 @@ Uses regex patterns to extract structured parameters from user input
 based on the classified intent category.
 """
 
+import copy
+import json
 import re
+from functools import lru_cache
 from typing import Dict, Any
 
 from .models import IntentCategory
 
+_EXTRACT_CACHE_SIZE = 1024
+# Longer inputs are one-off pastes (logs, configs); don't let them fill the cache
+_MAX_CACHED_TEXT_LEN = 512
+
+# ---------------------------------------------------------------------------
+# Compiled patterns, grouped by the extractor that uses them
+# ---------------------------------------------------------------------------
+
+# key=value or key="value with spaces"
+_KEY_VALUE_RE = re.compile(r'\b(\w+)\s*=\s*(?:"([^"]+)"|(\S+))')
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+# VM name
+_VM_NAMED_RE = re.compile(r"\bvm\s+(?:named|called)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?", re.I)
+_VM_ACTION_NAME_RE = re.compile(
+    r"\b(?:info|details?|status|describe|delete|remove|destroy|terminate)\s+" r"(?:about\s+|for\s+|of\s+)?(?:the\s+)?(?:vm|virtual\s+machine)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
+    re.I,
+)
+_VM_INFO_NAME_RE = re.compile(r"\bvm\s+(?:info|details?|status)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?", re.I)
+_VM_NAME_BEFORE_VM_RE = re.compile(r"\b(?:delete|remove|destroy|terminate)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?\s+vm\b", re.I)
+_VM_ANY_NAME_RE = re.compile(r"\bvm\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?", re.I)
+_VM_NAME_SKIP_WORDS = frozenset(
+    {
+        "info",
+        "details",
+        "status",
+        "list",
+        "create",
+        "delete",
+        "named",
+        "called",
+        "is",
+        "the",
+        "a",
+        "an",
+        "with",
+        "name",
+        "image",
+        "memory",
+        "cpus",
+        "disk",
+    }
+)
+
+# VM create
+_IMAGE_RE = re.compile(r"\b(?:with\s+)?image\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?", re.I)
+_USING_IMAGE_RE = re.compile(r"\busing\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?\s+image\b", re.I)
+_MEMORY_GB_RE = re.compile(r"\b(\d+)\s*(?:gb|g)\s*(?:ram|memory|mem)?\b", re.I)
+_MEMORY_MB_RE = re.compile(r"\b(\d{3,})\s*(?:mb)?\s*(?:ram|memory|mem)\b", re.I)
+_MEMORY_AFTER_RE = re.compile(r"\bmemory\s+(\d+)\b", re.I)
+_CPUS_RE = re.compile(r"\b(\d+)\s*(?:cpus?|cores?|vcpus?)\b", re.I)
+_CPUS_AFTER_RE = re.compile(r"\bcpus?\s+(\d+)\b", re.I)
+_DISK_RE = re.compile(r"\b(\d+)\s*(?:gb|g)?\s*disk\b", re.I)
+_DISK_AFTER_RE = re.compile(r"\bdisk\s*(?:size)?\s+(\d+)\b", re.I)
+
+# DAG ID
+_DAG_INFO_ID_RE = re.compile(r"\b(?:dag|workflow)\s+(?:info|details?|status|describe)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?", re.I)
+_INFO_ABOUT_DAG_RE = re.compile(
+    r"\b(?:info|details?|describe)\s+(?:about\s+|for\s+|of\s+)?(?:dag|workflow)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?",
+    re.I,
+)
+_DAG_ANY_ID_RE = re.compile(r"\b(?:dag|workflow)\s+(?:named|called|id)?\s*[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?", re.I)
+_DAG_ID_SKIP_WORDS = frozenset(
+    {
+        "info",
+        "details",
+        "status",
+        "list",
+        "trigger",
+        "run",
+        "named",
+        "called",
+        "the",
+        "a",
+        "execute",
+        "start",
+        "describe",
+    }
+)
+
+# DAG trigger
+_TRIGGER_DAG_RE = re.compile(r"\b(?:trigger|run|execute|start)\s+(?:the\s+)?(?:dag|workflow)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?", re.I)
+_TRIGGER_ID_RE = re.compile(r"\b(?:trigger|run|execute|start)\s+(?:the\s+)?[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?", re.I)
+_TRIGGER_NAME_DAG_RE = re.compile(r"\b(?:trigger|run|execute|start)\s+[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?\s+(?:dag|workflow)\b", re.I)
+_DESTROY_VERB_RE = re.compile(r"\b(?:destroy|delete|remove|teardown|undeploy)\b")
+_DOMAIN_RE = re.compile(r"\b(?:with\s+)?domain\s+[\"']?([a-zA-Z0-9][a-zA-Z0-9.-]+\.[a-zA-Z]{2,})[\"']?", re.I)
+_TRIGGER_SKIP_WORDS = frozenset({"dag", "workflow", "the", "a"})
+_CONF_JSON_RE = re.compile(r"\b(?:conf|config|configuration)\s*=?\s*(\{[^}]+\})", re.I)
+
+# RAG
+_RAG_PREFIX_RE = re.compile(
+    r"^(?:search|query|find|lookup)\s+(?:the\s+)?(?:rag|knowledge\s+base|docs?|documentation)\s*(?:for|about)?\s*",
+    re.I,
+)
+_HOW_DO_I_RE = re.compile(r"\bhow\s+(?:do|to|can)\s+(?:i|we)\s+(.+)", re.I)
+_DOC_TYPES_RE = re.compile(r"\b(?:type|doc_type)\s*=\s*\[?([^\]]+)\]?", re.I)
+_LIMIT_RE = re.compile(r"\blimit\s*=?\s*(\d+)\b", re.I)
+_THRESHOLD_RE = re.compile(r"\bthreshold\s*=?\s*([\d.]+)\b", re.I)
+_DOC_TYPE_RE = re.compile(r"\b(?:type|doc_type)\s*=?\s*[\"']?(\w+)[\"']?", re.I)
+_SOURCE_RE = re.compile(r"\bsource\s*=?\s*[\"']?(/[^\s\"']+)[\"']?", re.I)
+
+# Troubleshooting
+_TROUBLESHOOT_PREFIX_RE = re.compile(r"^(?:diagnose|troubleshoot|debug|fix)\s+", re.I)
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_RESOURCE_RE = re.compile(r"\b(?:vm|dag|resource)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?", re.I)
+# The capture starts and ends on non-space so a long whitespace run is
+# tried as a terminator once, not once per character (quadratic)
+_FOR_PATTERN_RE = re.compile(r"\bfor\s+(\S(?:.*?\S)??)(?:\s+(?:in|from|limit)\b|[^\S\n]*$)", re.I)
+_COMPONENT_RE = re.compile(r"\bcomponent\s*=?\s*[\"']?(\w+)[\"']?", re.I)
+_ONLY_SUCCESSFUL_RE = re.compile(r"\b(?:(?:successful|success|solved|fixed)\s+only|only\s+(?:successful|success|solved|fixed))\b", re.I)
+_RESULT_SUCCESS_RE = re.compile(r"\bsuccess(?:ful)?\b", re.I)
+_RESULT_FAILED_RE = re.compile(r"\bfail(?:ed|ure)?\b", re.I)
+_RESULT_PARTIAL_RE = re.compile(r"\bpartial\b", re.I)
+
+# Component detection - ordered from most specific to most generic to
+# prevent generic keywords from matching first. Flattened to (keyword,
+# component) pairs so the first substring hit decides the component.
+_COMPONENTS = (
+    ("freeipa", ("freeipa", "ipa-server", "idm", "identity management")),
+    ("openshift", ("openshift", "ocp", "kubernetes", "k8s")),
+    ("vm", ("vm", "virtual machine", "virsh", "kcli")),
+    ("dag", ("dag", "airflow", "workflow")),
+    ("storage", ("disk", "storage", "space", "full")),
+    ("network", ("dns", "network", "connect", "resolve", "hostname")),
+)
+_COMPONENT_KEYWORDS = tuple((keyword, component) for component, keywords in _COMPONENTS for keyword in keywords)
+
+# Lineage
+_DEPTH_RE = re.compile(r"\bdepth\s*=?\s*(\d+)\b", re.I)
+_TASK_ID_RE = re.compile(r"\btask\s+(?:id\s+)?[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?", re.I)
+
 
 def extract(text: str, category: IntentCategory) -> Dict[str, Any]:
     """
@@ -17,6 +151,15 @@ def extract(text: str, category: IntentCategory) -> Dict[str, Any]:
 
     Returns a dict of extracted parameter names to values.
     """
+    if len(text) > _MAX_CACHED_TEXT_LEN:
+        return _extract(text, category)
+
+    # Callers may mutate the result (and nested conf), so hand out a copy
+    return {key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value for key, value in _extract_cached(text, category).items()}
+
+
+def _extract(text: str, category: IntentCategory) -> Dict[str, Any]:
+    """Run the category extractor and explicit key=value extraction."""
     # Category-specific extraction first
     extractors = {
         IntentCategory.VM_LIST: _extract_vm_list,
@@ -51,11 +194,20 @@ def extract(text: str, category: IntentCategory) -> Dict[str, Any]:
     return params
 
 
+_extract_cached = lru_cache(maxsize=_EXTRACT_CACHE_SIZE)(_extract)
+extract.cache_clear = _extract_cached.cache_clear
+
+
 def _extract_key_value_pairs(text: str) -> Dict[str, Any]:
     """Extract explicit key=value pairs from text."""
     params = {}
-    # Match: key=value or key="value with spaces"
-    for match in re.finditer(r'\b(\w+)\s*=\s*(?:"([^"]+)"|(\S+))', text):
+    if "=" not in text:
+        return params
+    if text.count("=") == 1:
+        matches = _match_single_pair(text)
+    else:
+        matches = _KEY_VALUE_RE.finditer(text)
+    for match in matches:
         key = match.group(1)
         value = match.group(2) if match.group(2) is not None else match.group(3)
         # Try to convert numeric values
@@ -63,12 +215,38 @@ def _extract_key_value_pairs(text: str) -> Dict[str, Any]:
     return params
 
 
+def _match_single_pair(text: str) -> tuple:
+    """
+    Match the only possible pair in text containing a single "=".
+
+    The key must be the word run just before the "=", so the pattern is
+    matched there once instead of being tried at every word of the text.
+    """
+    start = text.index("=")
+    while start and text[start - 1].isspace():
+        start -= 1
+    while start and (text[start - 1].isalnum() or text[start - 1] == "_"):
+        start -= 1
+    match = _KEY_VALUE_RE.match(text, start)
+    return (match,) if match else ()
+
+
 def _try_numeric(value: str) -> Any:
     """Try to convert a string to int or float."""
-    try:
+    if value.isdecimal():
         return int(value)
-    except ValueError:
-        pass
+
+    # After an optional sign, int() and float() need a digit or "." (or
+    # inf/nan), so plain words skip the exception path entirely
+    body = value.strip().lstrip("+-")
+    if not (body[:1].isdecimal() or body[:1] == "." or body.lower() in _FLOAT_WORDS):
+        return value
+
+    if "." not in body:
+        try:
+            return int(value)
+        except ValueError:
+            pass
     try:
         return float(value)
     except ValueError:
@@ -88,75 +266,43 @@ def _extract_vm_params(text: str) -> Dict[str, Any]:
     """Extract VM name from text."""
     params = {}
 
+    # Every pattern below needs "vm" except the "virtual machine" form
+    if "vm" not in text.lower():
+        m = _VM_ACTION_NAME_RE.search(text)
+        if m:
+            params["name"] = m.group(1)
+        return params
+
     # "vm named X" / "vm called X"
-    m = re.search(
-        r"\bvm\s+(?:named|called)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _VM_NAMED_RE.search(text)
     if m:
-        params["name"] = m.group(1).strip("\"'")
+        params["name"] = m.group(1)
         return params
 
     # "info/details/status/delete vm <name>"
-    m = re.search(
-        r"\b(?:info|details?|status|describe|delete|remove|destroy|terminate)\s+" r"(?:about\s+|for\s+|of\s+)?(?:the\s+)?(?:vm|virtual\s+machine)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _VM_ACTION_NAME_RE.search(text)
     if m:
-        params["name"] = m.group(1).strip("\"'")
+        params["name"] = m.group(1)
         return params
 
     # "vm info/status/details <name>" pattern
-    m = re.search(
-        r"\bvm\s+(?:info|details?|status)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _VM_INFO_NAME_RE.search(text)
     if m:
-        params["name"] = m.group(1).strip("\"'")
+        params["name"] = m.group(1)
         return params
 
     # "<action> <name> vm"
-    m = re.search(
-        r"\b(?:delete|remove|destroy|terminate)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?\s+vm\b",
-        text,
-        re.I,
-    )
+    m = _VM_NAME_BEFORE_VM_RE.search(text)
     if m:
-        params["name"] = m.group(1).strip("\"'")
+        params["name"] = m.group(1)
         return params
 
     # Last word that looks like a VM name after "vm"
-    m = re.search(
-        r"\bvm\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _VM_ANY_NAME_RE.search(text)
     if m:
-        name = m.group(1).strip("\"'")
+        name = m.group(1)
         # Filter out common non-name words
-        if name.lower() not in {
-            "info",
-            "details",
-            "status",
-            "list",
-            "create",
-            "delete",
-            "named",
-            "called",
-            "is",
-            "the",
-            "a",
-            "an",
-            "with",
-            "name",
-            "image",
-            "memory",
-            "cpus",
-            "disk",
-        }:
+        if name.lower() not in _VM_NAME_SKIP_WORDS:
             params["name"] = name
 
     return params
@@ -167,51 +313,43 @@ def _extract_vm_create(text: str) -> Dict[str, Any]:
     params = _extract_vm_params(text)
 
     # Image: "with image X" / "using X image" / "image=X"
-    m = re.search(
-        r"\b(?:with\s+)?image\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _IMAGE_RE.search(text)
     if m:
         params["image"] = m.group(1)
 
-    m = re.search(
-        r"\busing\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?\s+image\b",
-        text,
-        re.I,
-    )
+    m = _USING_IMAGE_RE.search(text)
     if m:
         params["image"] = m.group(1)
 
     # Memory: "4GB RAM" / "4096MB memory" / "4g memory" / "memory 4096"
-    m = re.search(r"\b(\d+)\s*(?:gb|g)\s*(?:ram|memory|mem)?\b", text, re.I)
+    m = _MEMORY_GB_RE.search(text)
     if m:
         params["memory"] = int(m.group(1)) * 1024  # Convert GB to MB
 
-    m = re.search(r"\b(\d{3,})\s*(?:mb)?\s*(?:ram|memory|mem)\b", text, re.I)
+    m = _MEMORY_MB_RE.search(text)
     if m:
         params["memory"] = int(m.group(1))
 
-    m = re.search(r"\bmemory\s+(\d+)\b", text, re.I)
+    m = _MEMORY_AFTER_RE.search(text)
     if m and "memory" not in params:
         val = int(m.group(1))
         params["memory"] = val if val >= 512 else val * 1024
 
     # CPUs: "2 cpus" / "4 cores" / "cpus 2"
-    m = re.search(r"\b(\d+)\s*(?:cpus?|cores?|vcpus?)\b", text, re.I)
+    m = _CPUS_RE.search(text)
     if m:
         params["cpus"] = int(m.group(1))
 
-    m = re.search(r"\bcpus?\s+(\d+)\b", text, re.I)
+    m = _CPUS_AFTER_RE.search(text)
     if m and "cpus" not in params:
         params["cpus"] = int(m.group(1))
 
     # Disk: "50GB disk" / "disk 50" / "50g disk"
-    m = re.search(r"\b(\d+)\s*(?:gb|g)?\s*disk\b", text, re.I)
+    m = _DISK_RE.search(text)
     if m:
         params["disk_size"] = int(m.group(1))
 
-    m = re.search(r"\bdisk\s*(?:size)?\s+(\d+)\b", text, re.I)
+    m = _DISK_AFTER_RE.search(text)
     if m and "disk_size" not in params:
         params["disk_size"] = int(m.group(1))
 
@@ -222,55 +360,31 @@ def _extract_dag_params(text: str) -> Dict[str, Any]:
     """Extract DAG ID from text."""
     params = {}
 
-    _skip_words = {
-        "info",
-        "details",
-        "status",
-        "list",
-        "trigger",
-        "run",
-        "named",
-        "called",
-        "the",
-        "a",
-        "execute",
-        "start",
-        "describe",
-    }
+    text_lower = text.lower()
+    if "dag" not in text_lower and "workflow" not in text_lower:
+        return params
 
     # "dag info/details/status <dag_id>" - command word then dag_id
-    m = re.search(
-        r"\b(?:dag|workflow)\s+(?:info|details?|status|describe)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _DAG_INFO_ID_RE.search(text)
     if m:
-        dag_id = m.group(1).strip("\"'")
-        if dag_id.lower() not in _skip_words:
+        dag_id = m.group(1)
+        if dag_id.lower() not in _DAG_ID_SKIP_WORDS:
             params["dag_id"] = dag_id
             return params
 
     # "info/details about dag <dag_id>"
-    m = re.search(
-        r"\b(?:info|details?|describe)\s+(?:about\s+|for\s+|of\s+)?(?:dag|workflow)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _INFO_ABOUT_DAG_RE.search(text)
     if m:
-        dag_id = m.group(1).strip("\"'")
-        if dag_id.lower() not in _skip_words:
+        dag_id = m.group(1)
+        if dag_id.lower() not in _DAG_ID_SKIP_WORDS:
             params["dag_id"] = dag_id
             return params
 
     # "dag <dag_id>" / "dag named <dag_id>" / "workflow <dag_id>"
-    m = re.search(
-        r"\b(?:dag|workflow)\s+(?:named|called|id)?\s*[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _DAG_ANY_ID_RE.search(text)
     if m:
-        dag_id = m.group(1).strip("\"'")
-        if dag_id.lower() not in _skip_words:
+        dag_id = m.group(1)
+        if dag_id.lower() not in _DAG_ID_SKIP_WORDS:
             params["dag_id"] = dag_id
 
     return params
@@ -280,54 +394,35 @@ def _extract_dag_trigger(text: str) -> Dict[str, Any]:
     """Extract DAG trigger parameters."""
     params = {}
 
-    _skip_words = {"dag", "workflow", "the", "a"}
-
     # Dynamic service-to-DAG-ID mapping built from scanning airflow/dags/
     from .dag_registry import get_service_dag_map
 
     _SERVICE_DAG_MAP = get_service_dag_map()
 
     # "trigger/run/execute dag <dag_id>"
-    m = re.search(
-        r"\b(?:trigger|run|execute|start)\s+(?:the\s+)?(?:dag|workflow)\s+" r"[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _TRIGGER_DAG_RE.search(text)
     if m:
-        dag_id = m.group(1).strip("\"'")
-        if dag_id.lower() not in _skip_words:
+        dag_id = m.group(1)
+        if dag_id.lower() not in _TRIGGER_SKIP_WORDS:
             params["dag_id"] = dag_id
 
     # "trigger <dag_id>" (no "dag" keyword)
     if "dag_id" not in params:
-        m = re.search(
-            r"\b(?:trigger|run|execute|start)\s+(?:the\s+)?[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?",
-            text,
-            re.I,
-        )
+        m = _TRIGGER_ID_RE.search(text)
         if m:
-            dag_id = m.group(1).strip("\"'")
-            if dag_id.lower() not in _skip_words:
+            dag_id = m.group(1)
+            if dag_id.lower() not in _TRIGGER_SKIP_WORDS:
                 params["dag_id"] = dag_id
 
     # "trigger <name> dag"
     if "dag_id" not in params:
-        m = re.search(
-            r"\b(?:trigger|run|execute|start)\s+[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?\s+(?:dag|workflow)\b",
-            text,
-            re.I,
-        )
+        m = _TRIGGER_NAME_DAG_RE.search(text)
         if m:
-            params["dag_id"] = m.group(1).strip("\"'")
-
-    # Detect deploy-synonym verbs (install, set up) for service lookup
-    # These are handled the same as "deploy" for entity extraction
-    _DEPLOY_VERBS = {"deploy", "install"}
+            params["dag_id"] = m.group(1)
 
     # Detect destroy/delete action from verb BEFORE dag_id extraction
-    _DESTROY_VERBS = {"destroy", "delete", "remove", "teardown", "undeploy"}
     text_lower = text.lower()
-    is_destroy = any(re.search(rf"\b{verb}\b", text_lower) for verb in _DESTROY_VERBS)
+    is_destroy = _DESTROY_VERB_RE.search(text_lower) is not None
 
     # Natural language: "deploy freeipa/idm/dns/vyos/keycloak ..."
     # Also handles: "destroy freeipa", "delete harbor", etc.
@@ -344,21 +439,15 @@ def _extract_dag_trigger(text: str) -> Dict[str, Any]:
 
     # Extract domain parameter: "with domain X" / "domain X" / "domain=X"
     if "dag_id" in params:
-        m = re.search(
-            r"\b(?:with\s+)?domain\s+[\"']?([a-zA-Z0-9][a-zA-Z0-9.-]+\.[a-zA-Z]{2,})[\"']?",
-            text,
-            re.I,
-        )
+        m = _DOMAIN_RE.search(text)
         if m:
-            domain = m.group(1).strip("\"'")
+            domain = m.group(1)
             params.setdefault("conf", {})
             params["conf"]["domain"] = domain
 
     # Try to extract JSON conf: "with config {...}" or "conf={...}"
-    m = re.search(r"\b(?:conf|config|configuration)\s*=?\s*(\{[^}]+\})", text, re.I)
+    m = _CONF_JSON_RE.search(text) if "{" in text else None
     if m:
-        import json
-
         try:
             params["conf"] = json.loads(m.group(1))
         except json.JSONDecodeError:
@@ -372,34 +461,30 @@ def _extract_rag_query(text: str) -> Dict[str, Any]:
     params = {}
 
     # The query is often the main text after removing the command prefix
-    cleaned = re.sub(
-        r"^(?:search|query|find|lookup)\s+(?:the\s+)?(?:rag|knowledge\s+base|docs?|documentation)\s*(?:for|about)?\s*",
-        "",
-        text,
-        flags=re.I,
-    ).strip()
+    m = _RAG_PREFIX_RE.match(text)
+    cleaned = text[m.end() :].strip() if m else text.strip()
 
     if cleaned and cleaned != text.strip():
         params["query"] = cleaned
     else:
         # "how do I ..." style questions become the query
-        m = re.search(r"\bhow\s+(?:do|to|can)\s+(?:i|we)\s+(.+)", text, re.I)
+        m = _HOW_DO_I_RE.search(text)
         if m:
             params["query"] = m.group(1).strip("?").strip()
 
     # doc_types filter
-    m = re.search(r"\b(?:type|doc_type)\s*=\s*\[?([^\]]+)\]?", text, re.I)
+    m = _DOC_TYPES_RE.search(text)
     if m:
         types = [t.strip().strip("'\"") for t in m.group(1).split(",")]
         params["doc_types"] = types
 
     # limit
-    m = re.search(r"\blimit\s*=?\s*(\d+)\b", text, re.I)
+    m = _LIMIT_RE.search(text)
     if m:
         params["limit"] = int(m.group(1))
 
     # threshold
-    m = re.search(r"\bthreshold\s*=?\s*([\d.]+)\b", text, re.I)
+    m = _THRESHOLD_RE.search(text)
     if m:
         params["threshold"] = float(m.group(1))
 
@@ -411,16 +496,12 @@ def _extract_rag_ingest(text: str) -> Dict[str, Any]:
     params = {}
 
     # doc_type
-    m = re.search(
-        r"\b(?:type|doc_type)\s*=?\s*[\"']?(\w+)[\"']?",
-        text,
-        re.I,
-    )
+    m = _DOC_TYPE_RE.search(text)
     if m:
         params["doc_type"] = m.group(1)
 
     # source path
-    m = re.search(r"\bsource\s*=?\s*[\"']?(/[^\s\"']+)[\"']?", text, re.I)
+    m = _SOURCE_RE.search(text)
     if m:
         params["source"] = m.group(1)
 
@@ -431,39 +512,25 @@ def _extract_troubleshoot(text: str) -> Dict[str, Any]:
     """Extract troubleshooting/diagnostic parameters."""
     params = {}
 
-    # Component detection - ordered from most specific to most generic
-    # to prevent generic keywords from matching first
-    components = [
-        ("freeipa", ["freeipa", "ipa-server", "idm", "identity management"]),
-        ("openshift", ["openshift", "ocp", "kubernetes", "k8s"]),
-        ("vm", ["vm", "virtual machine", "virsh", "kcli"]),
-        ("dag", ["dag", "airflow", "workflow"]),
-        ("storage", ["disk", "storage", "space", "full"]),
-        ("network", ["dns", "network", "connect", "resolve", "hostname"]),
-    ]
-
     text_lower = text.lower()
-    for component, keywords in components:
-        if any(kw in text_lower for kw in keywords):
+    for keyword, component in _COMPONENT_KEYWORDS:
+        if keyword in text_lower:
             params["component"] = component
             break
 
     # Extract symptom - the main description after the command word
-    cleaned = re.sub(r"^(?:diagnose|troubleshoot|debug|fix)\s+", "", text, flags=re.I).strip()
+    m = _TROUBLESHOOT_PREFIX_RE.match(text)
+    cleaned = text[m.end() :].strip() if m else text.strip()
     if cleaned and cleaned != text.strip():
         params["symptom"] = cleaned
 
     # Extract quoted error messages
-    m = re.search(r'["\']([^"\']+)["\']', text)
+    m = _QUOTED_RE.search(text)
     if m:
         params["error_message"] = m.group(1)
 
     # Extract resource names
-    m = re.search(
-        r"\b(?:vm|dag|resource)\s+[\"']?([a-zA-Z][a-zA-Z0-9._-]*)[\"']?",
-        text,
-        re.I,
-    )
+    m = _RESOURCE_RE.search(text)
     if m:
         name = m.group(1)
         if name.lower() not in {"is", "not", "the", "a", "named", "called"}:
@@ -477,21 +544,21 @@ def _extract_troubleshoot_history(text: str) -> Dict[str, Any]:
     params = {}
 
     # error_pattern from quoted text or after "for"
-    m = re.search(r'["\']([^"\']+)["\']', text)
+    m = _QUOTED_RE.search(text)
     if m:
         params["error_pattern"] = m.group(1)
     else:
-        m = re.search(r"\bfor\s+(.+?)(?:\s+(?:in|from|limit)\b|$)", text, re.I)
+        m = _FOR_PATTERN_RE.search(text)
         if m:
             params["error_pattern"] = m.group(1).strip()
 
     # component
-    m = re.search(r"\bcomponent\s*=?\s*[\"']?(\w+)[\"']?", text, re.I)
+    m = _COMPONENT_RE.search(text)
     if m:
         params["component"] = m.group(1)
 
     # only_successful
-    if re.search(r"\b(?:successful|success|solved|fixed)\s+only\b", text, re.I) or re.search(r"\bonly\s+(?:successful|success|solved|fixed)\b", text, re.I):
+    if _ONLY_SUCCESSFUL_RE.search(text):
         params["only_successful"] = True
 
     return params
@@ -502,11 +569,11 @@ def _extract_troubleshoot_log(text: str) -> Dict[str, Any]:
     params = {}
 
     # result: success/failed/partial
-    if re.search(r"\bsuccess(?:ful)?\b", text, re.I):
+    if _RESULT_SUCCESS_RE.search(text):
         params["result"] = "success"
-    elif re.search(r"\bfail(?:ed|ure)?\b", text, re.I):
+    elif _RESULT_FAILED_RE.search(text):
         params["result"] = "failed"
-    elif re.search(r"\bpartial\b", text, re.I):
+    elif _RESULT_PARTIAL_RE.search(text):
         params["result"] = "partial"
 
     return params
@@ -517,7 +584,7 @@ def _extract_lineage(text: str) -> Dict[str, Any]:
     params = _extract_dag_params(text)
 
     # depth
-    m = re.search(r"\bdepth\s*=?\s*(\d+)\b", text, re.I)
+    m = _DEPTH_RE.search(text)
     if m:
         params["depth"] = int(m.group(1))
 
@@ -529,7 +596,7 @@ def _extract_blast_radius(text: str) -> Dict[str, Any]:
     params = _extract_dag_params(text)
 
     # task_id
-    m = re.search(r"\btask\s+(?:id\s+)?[\"']?([a-zA-Z][a-zA-Z0-9_-]*)[\"']?", text, re.I)
+    m = _TASK_ID_RE.search(text)
     if m:
         task_id = m.group(1)
         if task_id.lower() not in {"id", "the", "a"}:
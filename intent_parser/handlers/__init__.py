@@ -15,3 +15,10 @@ def register_all_handlers() -> None:
     from . import vm, dag, rag, system, troubleshoot, lineage  # noqa: F401
 
     logger.info("All intent handlers registered")
+
+
+def preload_backend() -> None:
+    """Start importing the Airflow MCP backend in the background."""
+    from ._backend import preload
+
+    preload()
@@ -0,0 +1,89 @@
+"""
+Shared loader for the Airflow MCP backend.
+
+Adds airflow/scripts to sys.path and imports mcp_server_fastmcp for all
+handler modules. The import is deferred until a handler first needs a
+backend tool, so starting the intent parser does not pay for loading
+Airflow and its dependencies; servers can preload() it in the
+background instead. The result, including a failed import, is cached so
+the import is attempted only once.
+"""
+
+import logging
+import os
+import sys
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable, Optional
+
+logger = logging.getLogger("intent-parser.handlers.backend")
+
+_SCRIPTS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "airflow", "scripts"))
+_load_lock = threading.Lock()
+
+
+def _load_backend() -> Optional[ModuleType]:
+    """Return mcp_server_fastmcp, or None if it cannot be loaded."""
+    # Serialize with a preload() thread, so a request arriving mid-import
+    # waits for it instead of importing (or failing) a second time
+    with _load_lock:
+        return _import_backend()
+
+
+@lru_cache(maxsize=None)
+def _import_backend() -> Optional[ModuleType]:
+    if _SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, _SCRIPTS_DIR)
+    try:
+        import mcp_server_fastmcp
+    except ImportError as e:
+        logger.warning(f"Airflow MCP backend not available: {e}")
+        return None
+    logger.info("Airflow MCP backend loaded")
+    return mcp_server_fastmcp
+
+
+def _unwrap(tool_or_fn):
+    """
+    Return the async function behind an MCP tool.
+
+    Tools may be wrapped by @mcp.tool() as FunctionTool objects.
+    """
+    if callable(tool_or_fn):
+        return tool_or_fn
+    fn = getattr(tool_or_fn, "fn", None)
+    if fn and callable(fn):
+        return fn
+    raise TypeError(f"Cannot unwrap {type(tool_or_fn)}")
+
+
+@lru_cache(maxsize=None)
+def get_tool(name: str) -> Optional[Callable]:
+    """
+    Return the backend function for an MCP tool name.
+
+    Returns None when the backend could not be imported or does not
+    provide the tool. Results are cached, so handlers can call this on
+    every request.
+    """
+    backend = _load_backend()
+    if backend is None:
+        return None
+    tool = getattr(backend, name, None)
+    if tool is None:
+        logger.warning(f"Airflow MCP backend is missing tool {name!r}")
+        return None
+    return _unwrap(tool)
+
+
+def preload() -> threading.Thread:
+    """
+    Import the backend in a background thread.
+
+    Long-running servers call this at startup so the first request does
+    not wait for the import, without delaying startup itself.
+    """
+    thread = threading.Thread(target=_load_backend, name="airflow-backend-preload", daemon=True)
+    thread.start()
+    return thread
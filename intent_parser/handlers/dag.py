@@ -5,50 +5,20 @@ Delegates to existing functions from airflow/scripts/mcp_server_fastmcp.py.
 Falls back to Airflow REST API when running outside the Airflow container.
 """
 
+import asyncio
 import json
 import logging
 import os
 from typing import Dict, Optional
 
+import httpx
+
 from ..router import register
 from ..models import IntentCategory
+from ._backend import get_tool
 
 logger = logging.getLogger("intent-parser.handlers.dag")
 
-_backend_available = False
-try:
-    import sys
-
-    _scripts_dir = os.path.join(os.path.dirname(__file__), "..", "..", "airflow", "scripts")
-    _scripts_dir = os.path.normpath(_scripts_dir)
-    if _scripts_dir not in sys.path:
-        sys.path.insert(0, _scripts_dir)
-
-    from mcp_server_fastmcp import (
-        list_dags as _list_dags_tool,
-        get_dag_info as _get_dag_info_tool,
-        trigger_dag as _trigger_dag_tool,
-    )
-
-    # MCP tools may be wrapped by @mcp.tool() as FunctionTool objects.
-    # Extract the underlying async function if so.
-    def _unwrap(tool_or_fn):
-        if callable(tool_or_fn):
-            return tool_or_fn
-        fn = getattr(tool_or_fn, "fn", None)
-        if fn and callable(fn):
-            return fn
-        raise TypeError(f"Cannot unwrap {type(tool_or_fn)}")
-
-    _list_dags = _unwrap(_list_dags_tool)
-    _get_dag_info = _unwrap(_get_dag_info_tool)
-    _trigger_dag = _unwrap(_trigger_dag_tool)
-
-    _backend_available = True
-    logger.info("DAG backend functions loaded")
-except ImportError as e:
-    logger.warning(f"DAG backend not available: {e}")
-
 
 # --- Airflow REST API fallback ---
 # Used when the MCP backend returns "Airflow is not available"
@@ -58,78 +28,80 @@ _AIRFLOW_API_URL = os.getenv("AIRFLOW_API_URL", "http://localhost:8888")
 _AIRFLOW_USER = os.getenv("AIRFLOW_USER") or os.getenv("AIRFLOW_API_USER") or "admin"
 _AIRFLOW_PASS = os.getenv("AIRFLOW_PASSWORD") or os.getenv("AIRFLOW_API_PASSWORD") or "admin"
 
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared Airflow API client, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a
+    fresh client is created when called from a different loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            base_url=_AIRFLOW_API_URL,
+            auth=(_AIRFLOW_USER, _AIRFLOW_PASS),
+            timeout=10.0,
+        )
+        _http_client_loop = loop
+    return _http_client
+
 
 async def _http_list_dags() -> str:
     """List DAGs via Airflow REST API."""
-    import httpx
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{_AIRFLOW_API_URL}/api/v1/dags",
-                params={"limit": 50},
-                auth=(_AIRFLOW_USER, _AIRFLOW_PASS),
-            )
-            if resp.status_code != 200:
-                return f"Error: Airflow API returned {resp.status_code}"
-            data = resp.json()
-            dags = data.get("dags", [])
-            if not dags:
-                return "No DAGs found."
-            lines = ["Available DAGs:\n"]
-            for dag in dags:
-                paused = " (paused)" if dag.get("is_paused") else ""
-                lines.append(f"  - {dag['dag_id']}: {dag.get('description', 'No description')}{paused}")
-            return "\n".join(lines)
+        resp = await _get_http_client().get("/api/v1/dags", params={"limit": 50})
+        if resp.status_code != 200:
+            return f"Error: Airflow API returned {resp.status_code}"
+        data = resp.json()
+        dags = data.get("dags", [])
+        if not dags:
+            return "No DAGs found."
+        lines = ["Available DAGs:\n"]
+        for dag in dags:
+            paused = " (paused)" if dag.get("is_paused") else ""
+            lines.append(f"  - {dag['dag_id']}: {dag.get('description', 'No description')}{paused}")
+        return "\n".join(lines)
     except Exception as e:
         return f"Error listing DAGs via API: {e}"
 
 
 async def _http_get_dag_info(dag_id: str) -> str:
     """Get DAG info via Airflow REST API."""
-    import httpx
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{_AIRFLOW_API_URL}/api/v1/dags/{dag_id}",
-                auth=(_AIRFLOW_USER, _AIRFLOW_PASS),
-            )
-            if resp.status_code == 404:
-                return f"Error: DAG '{dag_id}' not found"
-            if resp.status_code != 200:
-                return f"Error: Airflow API returned {resp.status_code}"
-            dag = resp.json()
-            return (
-                f"DAG: {dag['dag_id']}\n"
-                f"Description: {dag.get('description', 'None')}\n"
-                f"Is Paused: {dag.get('is_paused', 'unknown')}\n"
-                f"Schedule: {dag.get('schedule_interval', 'None')}\n"
-                f"Tags: {', '.join(t.get('name', '') for t in dag.get('tags', []))}"
-            )
+        resp = await _get_http_client().get(f"/api/v1/dags/{dag_id}")
+        if resp.status_code == 404:
+            return f"Error: DAG '{dag_id}' not found"
+        if resp.status_code != 200:
+            return f"Error: Airflow API returned {resp.status_code}"
+        dag = resp.json()
+        return (
+            f"DAG: {dag['dag_id']}\n"
+            f"Description: {dag.get('description', 'None')}\n"
+            f"Is Paused: {dag.get('is_paused', 'unknown')}\n"
+            f"Schedule: {dag.get('schedule_interval', 'None')}\n"
+            f"Tags: {', '.join(t.get('name', '') for t in dag.get('tags', []))}"
+        )
     except Exception as e:
         return f"Error getting DAG info via API: {e}"
 
 
 async def _http_trigger_dag(dag_id: str, conf: Optional[dict] = None) -> str:
     """Trigger a DAG via Airflow REST API."""
-    import httpx
-
     try:
         body = {"conf": conf or {}}
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.post(
-                f"{_AIRFLOW_API_URL}/api/v1/dags/{dag_id}/dagRuns",
-                json=body,
-                auth=(_AIRFLOW_USER, _AIRFLOW_PASS),
-            )
-            if resp.status_code == 404:
-                return f"Error: DAG '{dag_id}' not found"
-            if resp.status_code not in (200, 201):
-                return f"Error: Airflow API returned {resp.status_code}: {resp.text}"
-            data = resp.json()
-            run_id = data.get("dag_run_id", "unknown")
-            return f"Successfully triggered DAG '{dag_id}'\nRun ID: {run_id}\nConf: {json.dumps(conf or {})}"
+        resp = await _get_http_client().post(f"/api/v1/dags/{dag_id}/dagRuns", json=body, timeout=15.0)
+        if resp.status_code == 404:
+            return f"Error: DAG '{dag_id}' not found"
+        if resp.status_code not in (200, 201):
+            return f"Error: Airflow API returned {resp.status_code}: {resp.text}"
+        data = resp.json()
+        run_id = data.get("dag_run_id", "unknown")
+        return f"Successfully triggered DAG '{dag_id}'\nRun ID: {run_id}\nConf: {json.dumps(conf or {})}"
     except Exception as e:
         return f"Error triggering DAG via API: {e}"
 
@@ -138,30 +110,27 @@ def _unavailable_msg(operation: str) -> str:
     return f"Error: DAG {operation} is not available. The Airflow MCP backend could not be loaded."
 
 
-async def _call_with_http_fallback(mcp_fn, http_fn, *args, **kwargs) -> str:
-    """Call MCP backend function, fall back to HTTP API if Airflow unavailable."""
-    if _backend_available:
-        result = await mcp_fn(*args, **kwargs)
+async def _call_with_http_fallback(tool_name: str, http_fn, **kwargs) -> str:
+    """Call MCP backend tool, fall back to HTTP API if Airflow unavailable."""
+    mcp_fn = get_tool(tool_name)
+    if mcp_fn is not None:
+        result = await mcp_fn(**kwargs)
         if isinstance(result, str) and "Airflow is not available" in result:
             logger.info("Airflow Python API unavailable, falling back to REST API")
-            return await http_fn(*args, **kwargs)
+            return await http_fn(**kwargs)
         return result
-    return await http_fn(*args, **kwargs)
+    return await http_fn(**kwargs)
 
 
 async def handle_dag_list(params: Dict) -> str:
-    return await _call_with_http_fallback(_list_dags if _backend_available else (lambda: ""), _http_list_dags)
+    return await _call_with_http_fallback("list_dags", _http_list_dags)
 
 
 async def handle_dag_info(params: Dict) -> str:
     dag_id = params.get("dag_id")
     if not dag_id:
         return "Error: DAG ID is required. Try: 'dag info <dag_id>'"
-    return await _call_with_http_fallback(
-        (lambda dag_id: _get_dag_info(dag_id=dag_id)) if _backend_available else (lambda dag_id: ""),
-        _http_get_dag_info,
-        dag_id,
-    )
+    return await _call_with_http_fallback("get_dag_info", _http_get_dag_info, dag_id=dag_id)
 
 
 async def handle_dag_trigger(params: Dict) -> str:
@@ -169,31 +138,23 @@ async def handle_dag_trigger(params: Dict) -> str:
     if not dag_id:
         return "Error: DAG ID is required. Try: 'trigger dag <dag_id>'"
 
-    # Run SSH pre-flight checks with auto-fix
     from ..ssh_preflight import run_ssh_preflight
-
-    preflight = await run_ssh_preflight()
-    preflight_report = preflight.format_report()
-
-    # VM SSH pre-flight (second hop)
     from ..vm_ssh_preflight import get_vm_for_dag, run_vm_ssh_preflight
 
+    # SSH pre-flight checks with auto-fix, plus the VM SSH second hop.
+    # They repair independent hops, so they run concurrently, but both
+    # may fix access the DAG relies on and must finish before the trigger.
     conf = params.get("conf")
-    vm_preflight_report = ""
+    preflights = [run_ssh_preflight()]
     vm_info = get_vm_for_dag(dag_id, conf)
     if vm_info:
         vm_name, ssh_user = vm_info
-        vm_preflight = await run_vm_ssh_preflight(vm_name, ssh_user)
-        vm_preflight_report = vm_preflight.format_report()
+        preflights.append(run_vm_ssh_preflight(vm_name, ssh_user))
+    preflight_results = await asyncio.gather(*preflights)
 
-    trigger_result = await _call_with_http_fallback(
-        (lambda dag_id, conf: _trigger_dag(dag_id=dag_id, conf=conf)) if _backend_available else (lambda dag_id, conf: ""),
-        _http_trigger_dag,
-        dag_id,
-        conf,
-    )
+    trigger_result = await _call_with_http_fallback("trigger_dag", _http_trigger_dag, dag_id=dag_id, conf=conf)
 
-    reports = [r for r in [preflight_report, vm_preflight_report] if r]
+    reports = [r for r in (result.format_report() for result in preflight_results) if r]
     if reports:
         return "\n\n".join(reports) + f"\n\n{trigger_result}"
     return trigger_result
@@ -9,52 +9,21 @@ from typing import Dict
 
 from ..router import register
 from ..models import IntentCategory
+from ._backend import get_tool
 
 logger = logging.getLogger("intent-parser.handlers.troubleshoot")
 
-_backend_available = False
-try:
-    import sys
-    import os
-
-    _scripts_dir = os.path.join(os.path.dirname(__file__), "..", "..", "airflow", "scripts")
-    _scripts_dir = os.path.normpath(_scripts_dir)
-    if _scripts_dir not in sys.path:
-        sys.path.insert(0, _scripts_dir)
-
-    from mcp_server_fastmcp import (
-        diagnose_issue as _diagnose_issue_tool,
-        get_troubleshooting_history as _get_troubleshooting_history_tool,
-        log_troubleshooting_attempt as _log_troubleshooting_attempt_tool,
-    )
-
-    def _unwrap(t):
-        if callable(t):
-            return t
-        fn = getattr(t, "fn", None)
-        if fn and callable(fn):
-            return fn
-        raise TypeError(f"Cannot unwrap {type(t)}")
-
-    _diagnose_issue = _unwrap(_diagnose_issue_tool)
-    _get_troubleshooting_history = _unwrap(_get_troubleshooting_history_tool)
-    _log_troubleshooting_attempt = _unwrap(_log_troubleshooting_attempt_tool)
-
-    _backend_available = True
-    logger.info("Troubleshooting backend functions loaded")
-except ImportError as e:
-    logger.warning(f"Troubleshooting backend not available: {e}")
-
 
 def _unavailable_msg(operation: str) -> str:
     return f"Error: Troubleshooting {operation} is not available. The Airflow MCP backend could not be loaded."
 
 
 async def handle_diagnose(params: Dict) -> str:
-    if not _backend_available:
+    diagnose_issue = get_tool("diagnose_issue")
+    if diagnose_issue is None:
         return _unavailable_msg("diagnose")
     symptom = params.get("symptom", params.get("query", "Unknown issue"))
-    return await _diagnose_issue(
+    return await diagnose_issue(
         symptom=symptom,
         component=params.get("component", "unknown"),
         error_message=params.get("error_message", ""),
@@ -63,9 +32,10 @@ async def handle_diagnose(params: Dict) -> str:
 
 
 async def handle_history(params: Dict) -> str:
-    if not _backend_available:
+    get_troubleshooting_history = get_tool("get_troubleshooting_history")
+    if get_troubleshooting_history is None:
         return _unavailable_msg("history")
-    return await _get_troubleshooting_history(
+    return await get_troubleshooting_history(
         error_pattern=params.get("error_pattern"),
         component=params.get("component"),
         only_successful=params.get("only_successful", False),
@@ -74,7 +44,8 @@ async def handle_history(params: Dict) -> str:
 
 
 async def handle_log(params: Dict) -> str:
-    if not _backend_available:
+    log_troubleshooting_attempt = get_tool("log_troubleshooting_attempt")
+    if log_troubleshooting_attempt is None:
         return _unavailable_msg("log")
     task = params.get("task")
     if not task:
@@ -85,7 +56,7 @@ async def handle_log(params: Dict) -> str:
     result = params.get("result")
     if result not in ("success", "failed", "partial"):
         return "Error: Result must be 'success', 'failed', or 'partial'."
-    return await _log_troubleshooting_attempt(
+    return await log_troubleshooting_attempt(
         task=task,
         solution=solution,
         result=result,
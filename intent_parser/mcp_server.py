@@ -46,6 +46,12 @@ from intent_parser import IntentParser  # noqa: E402
 
 parser = IntentParser()
 
+# Handlers import the Airflow backend on first use; start that import now
+# in the background so the first tool call does not wait for it
+from intent_parser.handlers import preload_backend  # noqa: E402
+
+preload_backend()
+
 logger.info("=" * 60)
 logger.info("Initializing FastMCP Intent Parser Server")
 logger.info(f"Port: {MCP_PORT}")
@@ -84,10 +90,8 @@ async def qubinode(intent: str) -> str:
     result = await parser.process(intent)
 
     if not result.success and result.suggestions:
-        output = result.output + "\n\n**Suggestions:**\n"
-        for suggestion in result.suggestions:
-            output += f"- {suggestion}\n"
-        return output
+        suggestions = "".join(f"- {suggestion}\n" for suggestion in result.suggestions)
+        return f"{result.output}\n\n**Suggestions:**\n{suggestions}"
 
     return result.output
 
@@ -11,11 +11,14 @@ Results are cached to avoid repeated checks on consecutive requests.
 Never blocks — can_proceed=True always.
 """
 
+import asyncio
 import logging
 import os
+import stat
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
@@ -29,7 +32,9 @@ logger = logging.getLogger("intent-parser.rag-preflight")
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def _get_config() -> Dict[str, any]:
+    """Read settings from the environment once; clear_cache() re-reads them."""
     return {
         "ai_assistant_url": os.getenv("AI_ASSISTANT_URL", "http://localhost:8080"),
         "qubinode_root": os.getenv("QUBINODE_ROOT", "/opt/qubinode_navigator"),
@@ -44,10 +49,16 @@ def _get_config() -> Dict[str, any]:
 
 _cache: Dict[str, tuple] = {}  # {"rag": (timestamp, PreflightResult)}
 
+# Run shared by callers that miss the cache while checks are in progress
+_inflight: Optional[asyncio.Task] = None
+
 
 def clear_cache() -> None:
-    """Clear the preflight cache (useful for testing)."""
+    """Clear the preflight cache and cached settings (useful for testing)."""
+    global _inflight
     _cache.clear()
+    _inflight = None
+    _get_config.cache_clear()
 
 
 def _get_cached(ttl: int) -> Optional[PreflightResult]:
@@ -55,33 +66,42 @@ def _get_cached(ttl: int) -> Optional[PreflightResult]:
     if entry is None:
         return None
     ts, result = entry
-    if time.time() - ts > ttl:
+    if time.monotonic() - ts > ttl:
         del _cache["rag"]
         return None
     return result
 
 
 def _set_cached(result: PreflightResult) -> None:
-    _cache["rag"] = (time.time(), result)
+    _cache["rag"] = (time.monotonic(), result)
 
 
 # ---------------------------------------------------------------------------
 # Individual checks
 # ---------------------------------------------------------------------------
 
+_DROP_EXTENSIONS = (".md", ".yml", ".yaml", ".rst", ".txt")
+
 
 def _check_adr_source_files(qubinode_root: str) -> PreflightCheck:
     """Check if ADR source files and drop-directory files exist."""
     adr_dir = Path(os.getenv("ADR_DIR", "/app/docs/adrs"))
     drop_dir = Path(os.getenv("RAG_DROP_DIR", "/app/data/rag-drop"))
 
-    adr_files = list(adr_dir.glob("adr-*.md")) if adr_dir.is_dir() else []
-    drop_files: list = []
+    # Only the counts are reported, so count names without building a
+    # list, and walk the drop tree once rather than once per extension
+    adr_count = 0
+    try:
+        with os.scandir(adr_dir) as entries:
+            adr_count = sum(1 for entry in entries if entry.name.startswith("adr-") and entry.name.endswith(".md"))
+    except OSError:
+        # Missing or unreadable: count as none, as Path.glob did
+        pass
+    drop_count = 0
     if drop_dir.is_dir():
-        for ext in (".md", ".yml", ".yaml", ".rst", ".txt"):
-            drop_files.extend(drop_dir.rglob(f"*{ext}"))
+        drop_count = sum(1 for path in drop_dir.rglob("*") if path.name.endswith(_DROP_EXTENSIONS))
 
-    total = len(adr_files) + len(drop_files)
+    total = adr_count + drop_count
     if total == 0:
         return PreflightCheck(
             name="adr_source_files",
@@ -92,7 +112,7 @@ def _check_adr_source_files(qubinode_root: str) -> PreflightCheck:
     return PreflightCheck(
         name="adr_source_files",
         status=CheckStatus.OK,
-        message=f"Found {len(adr_files)} ADRs + {len(drop_files)} drop files",
+        message=f"Found {adr_count} ADRs + {drop_count} drop files",
     )
 
 
@@ -100,14 +120,19 @@ def _check_chunks_file(rag_data_dir: str) -> PreflightCheck:
     """Check if the RAG document chunks file exists and is non-trivial."""
     chunks_path = Path(rag_data_dir) / "rag-docs" / "document_chunks.json"
 
-    if not chunks_path.is_file():
+    # One stat() answers existence, type and size
+    try:
+        st = chunks_path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         return PreflightCheck(
             name="chunks_file",
             status=CheckStatus.WARNING,
             message=f"Chunks file not found: {chunks_path}",
         )
 
-    size = chunks_path.stat().st_size
+    size = st.st_size
     if size < 100:  # Trivially small (empty JSON array or similar)
         return PreflightCheck(
             name="chunks_file",
@@ -243,8 +268,10 @@ async def run_rag_preflight(force: bool = False) -> PreflightResult:
     """Run RAG pre-flight checks, returning a PreflightResult.
 
     Results are cached for `RAG_PREFLIGHT_CACHE_TTL` seconds (default 300).
-    Pass force=True to bypass cache.
+    Pass force=True to bypass cache. Concurrent calls share one run, so
+    a burst of requests triggers at most one context reload.
     """
+    global _inflight
     cfg = _get_config()
 
     if not force:
@@ -253,24 +280,33 @@ async def run_rag_preflight(force: bool = False) -> PreflightResult:
             logger.debug("RAG preflight cache hit")
             return cached
 
-    checks: List[PreflightCheck] = []
+    # Tasks belong to the loop that created them, so a run from another
+    # loop is never joined. shield() keeps one cancelled caller from
+    # cancelling the run for the others.
+    task = _inflight
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_run_checks(cfg))
+        _inflight = task
+    else:
+        logger.debug("Joining in-flight RAG preflight")
+    return await asyncio.shield(task)
 
-    # Check 1: ADR source files on filesystem
-    adr_check = _check_adr_source_files(cfg["qubinode_root"])
-    checks.append(adr_check)
-
-    # Check 2: Chunks file
-    chunks_check = _check_chunks_file(cfg["rag_data_dir"])
-    checks.append(chunks_check)
-
-    needs_reload = chunks_check.status != CheckStatus.OK
 
+async def _run_checks(cfg: Dict[str, Any]) -> PreflightResult:
+    """Run all checks, cache and return the result."""
     async with httpx.AsyncClient(timeout=15.0) as client:
-        # Check 3: Document count from health endpoint
-        doc_check, health_needs_reload = await _check_rag_document_count(client, cfg["ai_assistant_url"])
-        checks.append(doc_check)
+        # Checks 1-3 are independent: the filesystem checks (ADR source
+        # files, chunks file) run in worker threads, since globbing a slow
+        # mount must not block the event loop, while the health endpoint
+        # is queried for the document count
+        adr_check, chunks_check, (doc_check, health_needs_reload) = await asyncio.gather(
+            asyncio.to_thread(_check_adr_source_files, cfg["qubinode_root"]),
+            asyncio.to_thread(_check_chunks_file, cfg["rag_data_dir"]),
+            _check_rag_document_count(client, cfg["ai_assistant_url"]),
+        )
+        checks: List[PreflightCheck] = [adr_check, chunks_check, doc_check]
 
-        needs_reload = needs_reload or health_needs_reload
+        needs_reload = chunks_check.status != CheckStatus.OK or health_needs_reload
 
         # Check 4: Auto-fix via reload (conditional)
         if needs_reload:
@@ -22,7 +22,7 @@ _handlers: Dict[IntentCategory, HandlerFunc] = {}
 def register(category: IntentCategory, handler: HandlerFunc) -> None:
     """Register a handler function for an intent category."""
     _handlers[category] = handler
-    logger.debug(f"Registered handler for {category.value}")
+    logger.debug("Registered handler for %s", category.value)
 
 
 def get_handler(category: IntentCategory) -> Optional[HandlerFunc]:
@@ -95,7 +95,7 @@ async def route(text: str) -> IntentResult:
             output=output,
         )
     except Exception as e:
-        logger.error(f"Handler error for {intent.category.value}: {e}", exc_info=True)
+        logger.error("Handler error for %s: %s", intent.category.value, e, exc_info=True)
         return IntentResult(
             success=False,
             output=f"Error executing '{intent.category.value}': {str(e)}",
@@ -15,6 +15,7 @@ import os
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -29,7 +30,7 @@ class CheckStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class PreflightCheck:
     name: str
     status: CheckStatus
@@ -37,7 +38,7 @@ class PreflightCheck:
     fix_applied: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PreflightResult:
     checks: List[PreflightCheck] = field(default_factory=list)
     can_proceed: bool = True  # Always True — warn but never block
@@ -79,7 +80,9 @@ class PreflightResult:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def _get_config() -> Dict[str, str]:
+    """Read settings from the environment once; clear_cache() re-reads them."""
     ssh_user = os.getenv("QUBINODE_SSH_USER", os.getenv("USER", "root"))
     ssh_key = os.getenv("QUBINODE_SSH_KEY_PATH", f"/home/{ssh_user}/.ssh/id_rsa")
     return {
@@ -98,11 +101,15 @@ def _get_config() -> Dict[str, str]:
 # ---------------------------------------------------------------------------
 
 _cache: Dict[str, tuple] = {}  # {conn_id: (timestamp, PreflightResult)}
+_inflight: Optional[asyncio.Task] = None
 
 
 def clear_cache() -> None:
-    """Clear the preflight cache (useful for testing)."""
+    """Clear the preflight cache and cached settings (useful for testing)."""
+    global _inflight
     _cache.clear()
+    _inflight = None
+    _get_config.cache_clear()
 
 
 def _get_cached(conn_id: str, ttl: int) -> Optional[PreflightResult]:
@@ -110,14 +117,14 @@ def _get_cached(conn_id: str, ttl: int) -> Optional[PreflightResult]:
     if entry is None:
         return None
     ts, result = entry
-    if time.time() - ts > ttl:
+    if time.monotonic() - ts > ttl:
         del _cache[conn_id]
         return None
     return result
 
 
 def _set_cached(conn_id: str, result: PreflightResult) -> None:
-    _cache[conn_id] = (time.time(), result)
+    _cache[conn_id] = (time.monotonic(), result)
 
 
 # ---------------------------------------------------------------------------
@@ -320,8 +327,10 @@ async def run_ssh_preflight(force: bool = False) -> PreflightResult:
     """Run SSH pre-flight checks, returning a PreflightResult.
 
     Results are cached for `SSH_PREFLIGHT_CACHE_TTL` seconds (default 300).
-    Pass force=True to bypass cache.
+    Pass force=True to bypass cache. Concurrent calls share one run, so
+    a burst of triggers creates or patches the connection at most once.
     """
+    global _inflight
     cfg = _get_config()
     conn_id = cfg["conn_id"]
 
@@ -331,6 +340,20 @@ async def run_ssh_preflight(force: bool = False) -> PreflightResult:
             logger.debug("SSH preflight cache hit for %s", conn_id)
             return cached
 
+    # Same coalescing as the RAG pre-flight: only join a run on this loop,
+    # and shield it from a cancelled caller
+    task = _inflight
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_run_checks(cfg))
+        _inflight = task
+    else:
+        logger.debug("Joining in-flight SSH preflight for %s", conn_id)
+    return await asyncio.shield(task)
+
+
+async def _run_checks(cfg: Dict[str, Any]) -> PreflightResult:
+    """Run all checks, cache and return the result."""
+    conn_id = cfg["conn_id"]
     checks: List[PreflightCheck] = []
     auth = (cfg["user"], cfg["password"])
 
@@ -10,10 +10,13 @@ Results are cached to avoid repeated HTTP calls on consecutive triggers.
 Never blocks — can_proceed=True always.
 """
 
+import asyncio
 import logging
 import os
 import time
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
@@ -55,7 +58,9 @@ def get_vm_for_dag(dag_id: str, conf: Optional[Dict] = None) -> Optional[Tuple[s
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def _get_config() -> Dict[str, str]:
+    """Read settings from the environment once; clear_cache() re-reads them."""
     mcp_url = os.getenv("MCP_SERVER_URL", "")
     if not mcp_url:
         # Fall back to QUBINODE_MCP_URL (may end with /sse); strip SSE path
@@ -71,12 +76,17 @@ def _get_config() -> Dict[str, str]:
 # Cache
 # ---------------------------------------------------------------------------
 
-_cache: Dict[str, tuple] = {}  # {vm_name: (timestamp, PreflightResult)}
+# VM names can come from trigger conf, so keep only the most recently used
+_MAX_CACHED_VMS = 256
+_cache: "OrderedDict[str, tuple]" = OrderedDict()  # {vm_name: (timestamp, PreflightResult)}
+_inflight: Dict[Tuple[str, str], asyncio.Task] = {}  # {(vm_name, ssh_user): running check}
 
 
 def clear_cache() -> None:
-    """Clear the preflight cache (useful for testing)."""
+    """Clear the preflight cache and cached settings (useful for testing)."""
     _cache.clear()
+    _inflight.clear()
+    _get_config.cache_clear()
 
 
 def _get_cached(vm_name: str, ttl: int) -> Optional[PreflightResult]:
@@ -84,14 +94,18 @@ def _get_cached(vm_name: str, ttl: int) -> Optional[PreflightResult]:
     if entry is None:
         return None
     ts, result = entry
-    if time.time() - ts > ttl:
+    if time.monotonic() - ts > ttl:
         del _cache[vm_name]
         return None
+    _cache.move_to_end(vm_name)
     return result
 
 
 def _set_cached(vm_name: str, result: PreflightResult) -> None:
-    _cache[vm_name] = (time.time(), result)
+    _cache[vm_name] = (time.monotonic(), result)
+    _cache.move_to_end(vm_name)
+    while len(_cache) > _MAX_CACHED_VMS:
+        _cache.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
@@ -148,7 +162,8 @@ async def run_vm_ssh_preflight(
     """Run VM SSH second-hop pre-flight via the MCP server endpoint.
 
     Results are cached for ``VM_SSH_PREFLIGHT_CACHE_TTL`` seconds (default 120).
-    Pass ``force=True`` to bypass cache.
+    Pass ``force=True`` to bypass cache. Concurrent calls for the same VM
+    and user share one run.
     """
     cfg = _get_config()
 
@@ -158,6 +173,26 @@ async def run_vm_ssh_preflight(
             logger.debug("VM SSH preflight cache hit for %s", vm_name)
             return cached
 
+    # Same coalescing as the RAG pre-flight, per VM: only join a run on
+    # this loop, and shield it from a cancelled caller
+    key = (vm_name, ssh_user)
+    task = _inflight.get(key)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_run_check(cfg, vm_name, ssh_user))
+        _inflight[key] = task
+        task.add_done_callback(partial(_discard_inflight, key))
+    else:
+        logger.debug("Joining in-flight VM SSH preflight for %s", vm_name)
+    return await asyncio.shield(task)
+
+
+def _discard_inflight(key: Tuple[str, str], task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+
+
+async def _run_check(cfg: Dict[str, Any], vm_name: str, ssh_user: str) -> PreflightResult:
+    """Ask the MCP server to check the VM, cache and return the result."""
     checks = []
     mcp_url = cfg["mcp_url"]
 
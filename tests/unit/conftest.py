@@ -0,0 +1,11 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_dag_registry_cache(monkeypatch):
+    """Keep DAG scans from writing the metadata cache under ~/.cache."""
+    monkeypatch.setenv("DAG_REGISTRY_CACHE", "")
@@ -0,0 +1,135 @@
+"""
+Tests for the DAG handler's Airflow REST API fallback.
+
+Uses httpx.MockTransport to serve Airflow API replies.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from intent_parser.handlers import dag
+
+
+@pytest.fixture
+def airflow_api(monkeypatch):
+    """Route the shared client through a mock transport and record requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"dag_run_id": "manual__1"})
+        if request.url.path.endswith("/dags"):
+            return httpx.Response(200, json={"dags": [{"dag_id": "freeipa_deployment", "description": "FreeIPA"}]})
+        return httpx.Response(404)
+
+    real_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(dag.httpx, "AsyncClient", make_client)
+    monkeypatch.setattr(dag, "_http_client", None)
+    monkeypatch.setattr(dag, "_http_client_loop", None)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_http_calls_share_one_client(airflow_api):
+    listing = await dag._http_list_dags()
+    info = await dag._http_get_dag_info("missing_dag")
+    triggered = await dag._http_trigger_dag("freeipa_deployment", {"action": "destroy"})
+
+    assert "freeipa_deployment: FreeIPA" in listing
+    assert info == "Error: DAG 'missing_dag' not found"
+    assert "Run ID: manual__1" in triggered
+    assert [r.url.path for r in airflow_api] == [
+        "/api/v1/dags",
+        "/api/v1/dags/missing_dag",
+        "/api/v1/dags/freeipa_deployment/dagRuns",
+    ]
+    assert all(r.headers["authorization"].startswith("Basic ") for r in airflow_api)
+    assert dag._get_http_client() is dag._get_http_client()
+
+
+def test_new_event_loop_gets_new_client(airflow_api):
+    async def get_client():
+        return dag._get_http_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+
+
+class _Report:
+    def __init__(self, text):
+        self.text = text
+
+    def format_report(self):
+        return self.text
+
+
+@pytest.mark.asyncio
+async def test_trigger_runs_preflights_concurrently_before_trigger(monkeypatch):
+    events = []
+    both_started = asyncio.Event()
+
+    async def ssh_preflight():
+        events.append("ssh start")
+        await both_started.wait()
+        events.append("ssh done")
+        return _Report("[SSH Pre-flight] All checks passed.")
+
+    async def vm_preflight(vm_name, ssh_user):
+        events.append("vm start")
+        both_started.set()
+        events.append("vm done")
+        return _Report("")
+
+    async def trigger(dag_id, conf):
+        events.append("trigger")
+        return f"Successfully triggered DAG '{dag_id}'"
+
+    monkeypatch.setattr("intent_parser.ssh_preflight.run_ssh_preflight", ssh_preflight)
+    monkeypatch.setattr("intent_parser.vm_ssh_preflight.run_vm_ssh_preflight", vm_preflight)
+    monkeypatch.setattr("intent_parser.vm_ssh_preflight.get_vm_for_dag", lambda dag_id, conf: ("freeipa", "cloud-user"))
+    monkeypatch.setattr(dag, "get_tool", lambda name: None)
+    monkeypatch.setattr(dag, "_http_trigger_dag", trigger)
+
+    result = await dag.handle_dag_trigger({"dag_id": "freeipa_deployment"})
+
+    assert events[:2] == ["ssh start", "vm start"]
+    assert events[-1] == "trigger"
+    assert result == "[SSH Pre-flight] All checks passed.\n\nSuccessfully triggered DAG 'freeipa_deployment'"
+
+
+@pytest.mark.asyncio
+async def test_backend_result_is_used_when_airflow_available(monkeypatch):
+    async def get_dag_info(dag_id):
+        return f"DAG: {dag_id}"
+
+    monkeypatch.setattr(dag, "get_tool", {"get_dag_info": get_dag_info}.get)
+
+    assert await dag.handle_dag_info({"dag_id": "freeipa_deployment"}) == "DAG: freeipa_deployment"
+
+
+@pytest.mark.asyncio
+async def test_backend_falls_back_to_http_when_airflow_unavailable(monkeypatch):
+    calls = []
+
+    async def trigger_dag(dag_id, conf):
+        calls.append(("mcp", dag_id, conf))
+        return "Error: Airflow is not available"
+
+    async def http_trigger_dag(dag_id, conf):
+        calls.append(("http", dag_id, conf))
+        return "triggered via API"
+
+    monkeypatch.setattr(dag, "get_tool", {"trigger_dag": trigger_dag}.get)
+
+    result = await dag._call_with_http_fallback("trigger_dag", http_trigger_dag, dag_id="d", conf={"a": 1})
+
+    assert result == "triggered via API"
+    assert calls == [("mcp", "d", {"a": 1}), ("http", "d", {"a": 1})]
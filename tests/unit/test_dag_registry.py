@@ -0,0 +1,185 @@
+"""
+Tests for the dynamic DAG registry.
+
+Uses a temporary DAGs folder and metadata cache file to validate
+scanning, on-disk caching, and the service keyword mapping.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from intent_parser import dag_registry
+
+
+FREEIPA_DAG = """
+from airflow import DAG
+
+dag = DAG(
+    "freeipa_deployment",
+    description="Deploy FreeIPA Identity Management",
+    tags=["qubinode", "freeipa", "identity"],
+)
+"""
+
+HARBOR_DAG = """
+dag = DAG(
+    dag_id="harbor_deployment",
+    description="Deploy Harbor registry",
+    tags=["harbor", "registry", "kcli-pipelines"],
+)
+"""
+
+
+@pytest.fixture
+def dags_dir(tmp_path, monkeypatch):
+    dags = tmp_path / "dags"
+    dags.mkdir()
+    (dags / "freeipa_deployment.py").write_text(FREEIPA_DAG)
+    (dags / "harbor_deployment.py").write_text(HARBOR_DAG)
+    (dags / "dag_helpers.py").write_text(FREEIPA_DAG)
+    (dags / "_private.py").write_text(FREEIPA_DAG)
+    (dags / "README.md").write_text("not a dag")
+    monkeypatch.setenv("AIRFLOW_DAGS_PATH", str(dags))
+    monkeypatch.setenv("DAG_REGISTRY_CACHE", str(tmp_path / "cache" / "dag_registry.json"))
+    dag_registry.clear_caches()
+    yield dags
+    dag_registry.clear_caches()
+
+
+# ---------------------------------------------------------------------------
+# scan_dags
+# ---------------------------------------------------------------------------
+
+
+def test_scan_dags_skips_helpers_and_private_files(dags_dir):
+    dags = dag_registry.scan_dags()
+    assert [d["dag_id"] for d in dags] == ["freeipa_deployment", "harbor_deployment"]
+    assert dags[0]["tags"] == ["qubinode", "freeipa", "identity"]
+    assert dags[1]["description"] == "Deploy Harbor registry"
+
+
+def test_scan_dags_writes_cache(dags_dir, tmp_path):
+    dag_registry.scan_dags()
+    cache = json.loads((tmp_path / "cache" / "dag_registry.json").read_text())
+    assert cache["dags_path"] == str(dags_dir)
+    assert sorted(cache["files"]) == ["freeipa_deployment.py", "harbor_deployment.py"]
+
+
+def test_scan_dags_reuses_cache_for_unchanged_files(dags_dir):
+    first = dag_registry.scan_dags()
+    with patch.object(dag_registry, "_parse_dag_metadata") as parse:
+        second = dag_registry.scan_dags()
+    parse.assert_not_called()
+    assert second == first
+
+
+def test_scan_dags_reparses_changed_files(dags_dir):
+    dag_registry.scan_dags()
+    (dags_dir / "harbor_deployment.py").write_text(HARBOR_DAG.replace("harbor_deployment", "harbor_v2_deployment"))
+    dags = dag_registry.scan_dags()
+    assert [d["dag_id"] for d in dags] == ["freeipa_deployment", "harbor_v2_deployment"]
+
+
+def test_scan_dags_ignores_corrupt_cache(dags_dir, tmp_path):
+    cache_file = tmp_path / "cache" / "dag_registry.json"
+    cache_file.parent.mkdir()
+    cache_file.write_text("{not json")
+    assert len(dag_registry.scan_dags()) == 2
+
+
+def test_scan_dags_without_cache(dags_dir, tmp_path, monkeypatch):
+    monkeypatch.setenv("DAG_REGISTRY_CACHE", "")
+    assert len(dag_registry.scan_dags()) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+# ---------------------------------------------------------------------------
+# Service keyword mapping
+# ---------------------------------------------------------------------------
+
+
+def test_build_service_dag_map(dags_dir):
+    mapping = dag_registry.build_service_dag_map()
+    assert mapping["freeipa"] == "freeipa_deployment"
+    assert mapping["identity"] == "freeipa_deployment"
+    assert mapping["harbor"] == "harbor_deployment"
+    assert "qubinode" not in mapping
+    assert "kcli-pipelines" not in mapping
+
+
+def test_map_and_keywords_share_one_scan(dags_dir):
+    with patch.object(dag_registry, "scan_dags", wraps=dag_registry.scan_dags) as scan:
+        dag_registry.build_service_dag_map()
+        dag_registry.build_deploy_keywords()
+    assert scan.call_count == 1
+
+
+def test_accessors_cache_until_cleared(dags_dir):
+    assert "harbor" in dag_registry.get_deploy_keywords()
+    (dags_dir / "harbor_deployment.py").unlink()
+    assert dag_registry.get_service_dag_map()["harbor"] == "harbor_deployment"
+
+    dag_registry.clear_caches()
+    assert "harbor" not in dag_registry.get_service_dag_map()
+    assert "harbor" not in dag_registry.get_deploy_keywords()
+
+
+def test_empty_registry_is_not_rebuilt(dags_dir):
+    with patch.object(dag_registry, "build_service_dag_map", return_value={}) as build:
+        assert dag_registry.get_service_dag_map() == {}
+        assert dag_registry.get_service_dag_map() == {}
+    assert build.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# _parse_dag_metadata
+# ---------------------------------------------------------------------------
+
+
+def test_parse_prefers_dag_constructor_id(tmp_path):
+    dag_file = tmp_path / "sync.py"
+    dag_file.write_text('trigger = Op(trigger_dag_id="other_dag")\ndag = DAG("real_dag", tags=["sync"])\n')
+    meta = dag_registry._parse_dag_metadata(dag_file)
+    assert meta == {"dag_id": "real_dag", "tags": ["sync"], "description": ""}
+
+
+def test_parse_without_dag_returns_empty(tmp_path):
+    helper = tmp_path / "helper.py"
+    helper.write_text('description = "shared helper"\n')
+    assert dag_registry._parse_dag_metadata(helper) == {}
+
+
+def test_parse_handles_quotes_and_implicit_concatenation(tmp_path):
+    dag_file = tmp_path / "certs.py"
+    dag_file.write_text('dag = models.DAG(\n    dag_id="certs",\n    description="Let\'s Encrypt "\n    "certificates",\n    tags=("tls", 3),\n)\n')
+    meta = dag_registry._parse_dag_metadata(dag_file)
+    assert meta == {"dag_id": "certs", "tags": ["tls"], "description": "Let's Encrypt certificates"}
+
+
+def test_parse_ignores_param_descriptions(tmp_path):
+    dag_file = tmp_path / "dns.py"
+    dag_file.write_text('params = {"ttl": Param(1, description="TTL")}\ndag = DAG("dns", description="DNS", params=params)\n')
+    assert dag_registry._parse_dag_metadata(dag_file)["description"] == "DNS"
+
+
+def test_parse_falls_back_to_regex_on_syntax_error(tmp_path):
+    dag_file = tmp_path / "broken.py"
+    dag_file.write_text('dag = DAG("broken_dag", tags=["x"]\nif:\n')
+    assert dag_registry._parse_dag_metadata(dag_file)["dag_id"] == "broken_dag"
+
+
+# ---------------------------------------------------------------------------
+# Keyword extraction
+# ---------------------------------------------------------------------------
+
+
+def test_dag_id_keywords_drop_generic_and_short_parts():
+    assert dag_registry._dag_id_keywords("vyos_router_deployment") == {"vyos", "router"}
+    assert dag_registry._dag_id_keywords("ocp_for_the_ci") == {"ocp"}
+
+
+def test_extract_service_keywords_combines_tags_and_dag_id():
+    dag = {"dag_id": "step_ca_deployment", "tags": ["Step-CA", "qubinode", "x"]}
+    assert dag_registry._extract_service_keywords(dag) == {"step-ca", "step"}
@@ -231,3 +231,205 @@ def test_empty_dirs_produce_zero_chunks(tmp_path):
     chunks_file = tmp_path / "out" / "document_chunks.json"
     assert chunks_file.exists()
     assert json.loads(chunks_file.read_text()) == []
+
+
+# ---------------------------------------------------------------------------
+# Test 11: Classify non-markdown types by extension
+# ---------------------------------------------------------------------------
+
+
+def test_classify_by_extension():
+    """Non-markdown files are classified by extension, case-insensitively."""
+    assert _classify_document_type(Path("config.yml")) == "config"
+    assert _classify_document_type(Path("config.YAML")) == "config"
+    assert _classify_document_type(Path("index.rst")) == "documentation"
+    assert _classify_document_type(Path("notes.txt")) == "text"
+    assert _classify_document_type(Path("ADR-0001.MD")) == "adr"
+    assert _classify_document_type(Path("script.py")) == "unknown"
+
+
+# ---------------------------------------------------------------------------
+# Test 12: One timestamp per scan
+# ---------------------------------------------------------------------------
+
+
+def test_chunks_share_scan_timestamp(tmp_path):
+    """All chunks from a single scan share the same created_at value."""
+    src = tmp_path / "docs"
+    src.mkdir()
+    content = "\n\n".join(f"Paragraph {i} with enough content to pass the minimum character length." for i in range(5))
+    (src / "notes.txt").write_text(content)
+
+    scanner = DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "out")
+    scanner.scan_and_process()
+
+    chunks = json.loads((tmp_path / "out" / "document_chunks.json").read_text())
+    timestamps = {c["created_at"] for c in chunks} | {c["metadata"]["created_at"] for c in chunks}
+    assert len(chunks) == 5
+    assert len(timestamps) == 1
+
+
+# ---------------------------------------------------------------------------
+# Test 13: Parallel chunking matches sequential output
+# ---------------------------------------------------------------------------
+
+
+def test_parallel_chunking_matches_sequential(tmp_path, monkeypatch):
+    """Thread-pool chunking yields the same chunks, in order, as a sequential scan."""
+    src = tmp_path / "docs"
+    src.mkdir()
+    for i in range(12):
+        (src / f"doc{i:02d}.md").write_text(f"# Doc {i}\n\nDocument {i} body with enough content to pass the minimum length filter.")
+
+    monkeypatch.setenv("DROP_SCAN_WORKERS", "1")
+    DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "seq").scan_and_process()
+    monkeypatch.setenv("DROP_SCAN_WORKERS", "4")
+    files_processed, chunks_generated = DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "par").scan_and_process()
+
+    sequential = json.loads((tmp_path / "seq" / "document_chunks.json").read_text())
+    parallel = json.loads((tmp_path / "par" / "document_chunks.json").read_text())
+
+    assert files_processed == 12
+    assert chunks_generated == 12
+    assert [c["id"] for c in parallel] == [c["id"] for c in sequential]
+    assert [c["content"] for c in parallel] == [c["content"] for c in sequential]
+
+
+# ---------------------------------------------------------------------------
+# Test 14: Output is identical with and without orjson
+# ---------------------------------------------------------------------------
+
+
+def test_stdlib_json_fallback(tmp_path, monkeypatch):
+    """Chunks written without orjson parse to the same data."""
+    import drop_directory_scanner
+
+    src = tmp_path / "docs"
+    src.mkdir()
+    (src / "adr-0001.md").write_text("# ADR 0001 – Überblick\n\nNon-ASCII content with enough characters to be included as a chunk.")
+
+    DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "default").scan_and_process()
+    monkeypatch.setattr(drop_directory_scanner, "ORJSON_AVAILABLE", False)
+    DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "stdlib").scan_and_process()
+
+    default = json.loads((tmp_path / "default" / "document_chunks.json").read_text(encoding="utf-8"))
+    stdlib = json.loads((tmp_path / "stdlib" / "document_chunks.json").read_text(encoding="utf-8"))
+
+    assert [c["title"] for c in stdlib] == ["ADR 0001 – Überblick"]
+    assert [c["content"] for c in default] == [c["content"] for c in stdlib]
+
+
+# ---------------------------------------------------------------------------
+# Test 15: Markdown chunking handles preamble and CRLF line endings
+# ---------------------------------------------------------------------------
+
+
+def test_chunk_markdown_preamble_and_crlf(tmp_path):
+    """Text before the first header is its own untitled section; CRLF is normalized on read."""
+    from drop_directory_scanner import _chunk_markdown, chunk_file
+
+    sections = list(_chunk_markdown("Intro line\n# Title One\nBody one\n## Title Two\nBody two\n"))
+
+    assert sections == [
+        (None, "Intro line"),
+        ("Title One", "# Title One\nBody one"),
+        ("Title Two", "## Title Two\nBody two\n"),
+    ]
+
+    doc = tmp_path / "crlf.md"
+    doc.write_bytes(b"# Title One\r\nBody one has enough words to be kept as a chunk.\r\n")
+    chunks = chunk_file(doc, tmp_path)
+    assert [c["content"] for c in chunks] == ["# Title One\nBody one has enough words to be kept as a chunk."]
+
+
+def test_chunk_markdown_splits_on_newline_only():
+    """Form feeds and Unicode line separators stay inside their line."""
+    from drop_directory_scanner import _chunk_markdown
+
+    sections = list(_chunk_markdown("# Title\nPage one\x0c# Not a header\u2028# Nor this\n"))
+
+    assert sections == [("Title", "# Title\nPage one\x0c# Not a header\u2028# Nor this\n")]
+
+
+# ---------------------------------------------------------------------------
+# Test 16: Chunk IDs are stable 128-bit hashes
+# ---------------------------------------------------------------------------
+
+
+def test_chunk_id_algorithms(monkeypatch):
+    """Chunk IDs default to BLAKE2b-128 and can be switched back to MD5."""
+    import hashlib
+
+    import drop_directory_scanner
+    from drop_directory_scanner import _chunk_id
+
+    monkeypatch.setattr(drop_directory_scanner, "CHUNK_ID_ALGO", "blake2b")
+    cid = _chunk_id("adr-0001.md", 0, "Title")
+    assert cid == _chunk_id("adr-0001.md", 0, "Title")
+    assert cid == hashlib.blake2b(b"adr-0001.md_0_Title", digest_size=16).hexdigest()
+    assert len(cid) == 32
+
+    monkeypatch.setattr(drop_directory_scanner, "CHUNK_ID_ALGO", "md5")
+    assert _chunk_id("adr-0001.md", 0, "Title") == hashlib.md5(b"adr-0001.md_0_Title").hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Test 17: Discovery order is deterministic and extensions are case-insensitive
+# ---------------------------------------------------------------------------
+
+
+def test_discover_order_and_extension_case(tmp_path):
+    """Files are grouped by extension then path; upper-case extensions are found."""
+    src = tmp_path / "docs"
+    (src / "sub").mkdir(parents=True)
+    (src / "b.md").write_text("# B")
+    (src / "sub" / "a.md").write_text("# A")
+    (src / "notes.txt").write_text("notes")
+    (src / "README.MD").write_text("# Readme")
+    (src / "image.png").write_bytes(b"\x89PNG")
+
+    scanner = DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "out")
+    names = [f[0].relative_to(src).as_posix() for f in scanner.discover_files()]
+
+    assert names == ["README.MD", "b.md", "sub/a.md", "notes.txt"]
+
+
+def test_discover_orders_paths_by_component(tmp_path):
+    """A directory sorts before a sibling whose name it prefixes, as rglob order did."""
+    src = tmp_path / "docs"
+    (src / "a").mkdir(parents=True)
+    (src / "a-b").mkdir()
+    (src / "a" / "x.md").write_text("# A")
+    (src / "a-b" / "x.md").write_text("# AB")
+
+    scanner = DropDirectoryScanner(source_dirs=[src], output_dir=tmp_path / "out")
+    names = [f[0].relative_to(src).as_posix() for f in scanner.discover_files()]
+
+    assert names == ["a/x.md", "a-b/x.md"]
+
+
+# ---------------------------------------------------------------------------
+# Test 18: Pooled chunking dispatches through the chunk_file method
+# ---------------------------------------------------------------------------
+
+
+def test_parallel_chunking_uses_chunk_file_override(tmp_path, monkeypatch):
+    """A subclass overriding chunk_file is honoured when DROP_SCAN_WORKERS > 1."""
+    src = tmp_path / "docs"
+    src.mkdir()
+    for i in range(12):
+        (src / f"doc{i:02d}.md").write_text(f"# Doc {i}\n\nDocument {i} body with enough content to pass the minimum length filter.")
+
+    class TaggingScanner(DropDirectoryScanner):
+        def chunk_file(self, filepath, source_dir, created_at=None):
+            chunks = super().chunk_file(filepath, source_dir, created_at)
+            for chunk in chunks:
+                chunk["metadata"]["tagged"] = True
+            return chunks
+
+    monkeypatch.setenv("DROP_SCAN_WORKERS", "4")
+    TaggingScanner(source_dirs=[src], output_dir=tmp_path / "out").scan_and_process()
+
+    chunks = json.loads((tmp_path / "out" / "document_chunks.json").read_text())
+    assert len(chunks) == 12
+    assert all(c["metadata"]["tagged"] for c in chunks)
@@ -165,6 +165,17 @@ class TestTroubleshootEntityExtraction:
         )
         assert params.get("only_successful") is True
 
+    def test_history_error_pattern_stops_at_keyword(self):
+        params = extract(
+            "search history for disk full   errors  from yesterday",
+            IntentCategory.TROUBLESHOOT_HISTORY,
+        )
+        assert params.get("error_pattern") == "disk full   errors"
+
+    def test_history_error_pattern_long_whitespace(self):
+        params = extract("history for x" + " " * 5000 + "\nz", IntentCategory.TROUBLESHOOT_HISTORY)
+        assert "error_pattern" not in params
+
 
 class TestLineageEntityExtraction:
     """Test lineage parameter extraction."""
@@ -245,3 +256,54 @@ class TestKeyValueExtraction:
         params = extract("image=rhel9", IntentCategory.VM_CREATE)
         assert params["image"] == "rhel9"
         assert isinstance(params["image"], str)
+
+    def test_numeric_forms(self):
+        params = extract("ratio=0.5 offset=-3 scale=1e3 size=.5 tag=v1.2 name=7zip", IntentCategory.VM_CREATE)
+        assert params["ratio"] == 0.5
+        assert params["offset"] == -3 and isinstance(params["offset"], int)
+        assert params["scale"] == 1000.0
+        assert params["size"] == 0.5
+        assert params["tag"] == "v1.2"
+        assert params["name"] == "7zip"
+
+    def test_single_pair_forms(self):
+        assert extract('vm name = "my test vm" now', IntentCategory.VM_CREATE)["name"] == "my test vm"
+        assert extract("vm memory =  4096", IntentCategory.VM_CREATE)["memory"] == 4096
+        assert "x" not in extract("vm - = x", IntentCategory.VM_CREATE)
+
+
+class TestExtractCache:
+    """Test caching of extraction results."""
+
+    def test_repeated_text_hits_cache(self):
+        from intent_parser.entity_extractor import _extract_cached
+
+        extract.cache_clear()
+        extract("create vm named test01", IntentCategory.VM_CREATE)
+        params = extract("create vm named test01", IntentCategory.VM_CREATE)
+        assert params["name"] == "test01"
+        assert _extract_cached.cache_info().hits == 1
+
+    def test_results_are_independent_copies(self):
+        first = extract("destroy freeipa with domain example.com", IntentCategory.DAG_TRIGGER)
+        first["conf"]["domain"] = "mutated"
+        first["extra"] = True
+        second = extract("destroy freeipa with domain example.com", IntentCategory.DAG_TRIGGER)
+        assert second["conf"]["domain"] == "example.com"
+        assert "extra" not in second
+
+    def test_long_text_is_not_cached(self):
+        from intent_parser.entity_extractor import _MAX_CACHED_TEXT_LEN, _extract_cached
+
+        extract.cache_clear()
+        text = "create vm named big " + "x" * _MAX_CACHED_TEXT_LEN
+        assert extract(text, IntentCategory.VM_CREATE)["name"] == "big"
+        assert _extract_cached.cache_info().currsize == 0
+
+    def test_classifier_clear_caches_drops_results(self):
+        from intent_parser.classifier import clear_caches
+        from intent_parser.entity_extractor import _extract_cached
+
+        extract("deploy freeipa", IntentCategory.DAG_TRIGGER)
+        clear_caches()
+        assert _extract_cached.cache_info().currsize == 0
@@ -0,0 +1,71 @@
+"""
+Tests for the shared Airflow MCP backend loader used by the handlers.
+"""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from intent_parser.handlers import _backend, vm
+
+
+async def _list_vms():
+    return "vms"
+
+
+@pytest.fixture(autouse=True)
+def _clear_tool_cache():
+    _backend.get_tool.cache_clear()
+    yield
+    _backend.get_tool.cache_clear()
+
+
+def test_get_tool_returns_function(monkeypatch):
+    monkeypatch.setattr(_backend, "_load_backend", lambda: SimpleNamespace(list_vms=_list_vms))
+    assert _backend.get_tool("list_vms") is _list_vms
+
+
+def test_get_tool_unwraps_mcp_tools(monkeypatch):
+    monkeypatch.setattr(_backend, "_load_backend", lambda: SimpleNamespace(list_vms=SimpleNamespace(fn=_list_vms)))
+    assert _backend.get_tool("list_vms") is _list_vms
+
+
+def test_get_tool_missing_tool(monkeypatch):
+    monkeypatch.setattr(_backend, "_load_backend", lambda: SimpleNamespace(list_vms=_list_vms))
+    assert _backend.get_tool("diagnose_issue") is None
+
+
+def test_get_tool_without_backend(monkeypatch):
+    monkeypatch.setattr(_backend, "_load_backend", lambda: None)
+    assert _backend.get_tool("list_vms") is None
+
+
+def test_backend_import_is_attempted_once(monkeypatch):
+    _backend._import_backend.cache_clear()
+    monkeypatch.setitem(sys.modules, "mcp_server_fastmcp", None)
+    try:
+        _backend.preload().join(timeout=5)
+        assert _backend._load_backend() is None
+        assert _backend._import_backend.cache_info().misses == 1
+    finally:
+        _backend._import_backend.cache_clear()
+
+
+def test_get_tool_is_cached(monkeypatch):
+    loads = []
+    monkeypatch.setattr(_backend, "_load_backend", lambda: loads.append(1) or SimpleNamespace(list_vms=_list_vms))
+    assert _backend.get_tool("list_vms") is _backend.get_tool("list_vms")
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_uses_backend_tool(monkeypatch):
+    monkeypatch.setattr(vm, "get_tool", {"list_vms": _list_vms}.get)
+    assert await vm.handle_vm_list({}) == "vms"
+
+
+@pytest.mark.asyncio
+async def test_handler_reports_unavailable_backend(monkeypatch):
+    monkeypatch.setattr(vm, "get_tool", lambda name: None)
+    assert "not available" in await vm.handle_vm_list({})
@@ -357,3 +357,134 @@ class TestEdgeCases:
         text = "  list vms  "
         result = classify(text)
         assert result.raw_input == text.strip()
+
+    def test_keywords_match_whole_words(self):
+        from intent_parser.classifier import _kw, _tokenize
+
+        tokens = _tokenize("Deploy the step-ca-server\nnow")
+        assert _kw("deploy", "now") <= tokens
+        assert _kw("step-ca") <= tokens
+        assert _kw("ca", "server") <= tokens
+        assert not _kw("dep") <= tokens
+        assert not _kw("vm") <= _tokenize("vm_01")
+
+    def test_keyword_index_holds_each_keyword_set_once(self):
+        from intent_parser.classifier import _get_keyword_index, _get_rules
+
+        index = _get_keyword_index()
+        indexed = [(bit, mask) for bit, entries in index.values() for _, mask in entries]
+        assert len(indexed) == sum(len(rule["keywords"]) for rule in _get_rules().values())
+        assert all(bit & mask for bit, mask in indexed)
+
+    def test_keyword_masks_cover_required_words(self):
+        from intent_parser.classifier import _get_keyword_index
+
+        index = _get_keyword_index()
+        list_vm = index["list"][0] | index["vm"][0]
+        assert (IntentCategory.VM_LIST, list_vm) in index["list"][1] + index["vm"][1]
+
+
+class TestPatternBackends:
+    """The RE2 pattern set must score exactly like the re fallback."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "list all vms",
+            "why is the freeipa deployment failing with an error",
+            "create a centos vm",
+            "please set up harbor",
+            "what would be affected if dns fails",
+            "help",
+            "why\x0bis the vm failing",
+            "list\x1fall vms",
+            "what\x0bwould be affected if dns fails",
+            "help\n",
+        ],
+    )
+    def test_re2_matches_re(self, text, monkeypatch):
+        from intent_parser import classifier
+
+        if not classifier.RE2_AVAILABLE:
+            pytest.skip("google-re2 not installed")
+
+        rules = classifier._get_rules()
+        with_re2 = classifier._score_patterns(text, rules)
+        monkeypatch.setattr(classifier, "_get_pattern_set", lambda: (None, []))
+        assert classifier._score_patterns(text, rules) == with_re2
+
+    @pytest.mark.parametrize(
+        "text, category",
+        [
+            ("li\u017ft vms", IntentCategory.VM_LIST),
+            ("\u017fhow dags", IntentCategory.DAG_LIST),
+            ("\u017fearch rag for dns", IntentCategory.RAG_QUERY),
+        ],
+    )
+    def test_patterns_fold_case_like_re_ignorecase(self, text, category):
+        """Long s ("\u017f") folds to "s" under re.IGNORECASE but not str.lower()."""
+        assert classify(text).category == category
+
+    @pytest.mark.parametrize(
+        "text, category",
+        [
+            ("l\u0130st vms", IntentCategory.VM_LIST),
+            ("vm \u0130nfo foo", IntentCategory.VM_INFO),
+            ("deploy free\u0130pa", IntentCategory.DAG_TRIGGER),
+            ("l\u0131st vms", IntentCategory.VM_LIST),
+            ("\u0130NGEST DOCUMENTS", IntentCategory.RAG_INGEST),
+        ],
+    )
+    def test_dotted_and_dotless_i_fold_like_re_ignorecase(self, text, category):
+        """"\u0130".lower() is two code points; re.IGNORECASE matches it as "i"."""
+        assert classify(text).category == category
+
+    def test_tokens_fold_like_re_ignorecase(self):
+        from intent_parser.classifier import _tokenize
+
+        assert {"list", "vms", "ask"} <= _tokenize("L\u0130\u017fT vms \u0131\u017f A\u017f\u212a")
+
+    def test_re_fallback_long_whitespace_does_not_backtrack(self, monkeypatch):
+        from intent_parser import classifier
+
+        monkeypatch.setattr(classifier, "_get_pattern_set", lambda: (None, []))
+        rules = classifier._get_rules()
+        scores = classifier._score_patterns("why is" + " " * 2000 + "x", rules)
+        assert scores.get(IntentCategory.TROUBLESHOOT_DIAGNOSE, 0) == 0
+        scores = classifier._score_patterns("why is  the   vm  \n  hanging", rules)
+        assert scores[IntentCategory.TROUBLESHOOT_DIAGNOSE] >= 1
+
+
+class TestClassifyCache:
+    """Test caching of classification results."""
+
+    def test_case_variants_share_cache_entry(self):
+        from intent_parser.classifier import _classify_cached
+
+        classify.cache_clear()
+        first = classify("List VMs")
+        second = classify("list vms")
+        assert first.category == second.category == IntentCategory.VM_LIST
+        assert second.raw_input == "list vms"
+        assert _classify_cached.cache_info().hits == 1
+
+    def test_results_are_independent_copies(self):
+        first = classify("list vms")
+        first.entities["name"] = "mutated"
+        assert classify("list vms").entities == {}
+
+    def test_clear_caches_drops_cached_results(self):
+        from intent_parser.classifier import _classify_cached, clear_caches
+
+        classify("list vms")
+        clear_caches()
+        assert _classify_cached.cache_info().currsize == 0
+        assert classify("list vms").category == IntentCategory.VM_LIST
+
+    def test_deploy_service_pairs_use_registry_keywords(self):
+        from intent_parser.classifier import _get_rules
+        from intent_parser.dag_registry import get_deploy_keywords
+
+        verbs, services = _get_rules()[IntentCategory.DAG_TRIGGER]["keyword_pairs"][0]
+        assert {"deploy", "teardown"} <= verbs
+        assert services == set(get_deploy_keywords())
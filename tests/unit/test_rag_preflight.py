@@ -5,8 +5,12 @@ Uses mocked httpx responses and filesystem to validate all 4 checks,
 auto-fix logic, and caching.
 """
 
+import asyncio
 import json
+import os
+import threading
 import time
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -161,6 +165,43 @@ async def test_adr_dir_missing_warning(tmp_path):
     assert result.can_proceed is True
 
 
+@pytest.mark.asyncio
+async def test_adr_dir_unreadable_warning(tmp_path, monkeypatch):
+    """An unreadable ADR directory counts as empty instead of failing the run."""
+    adr_dir = tmp_path / "docs" / "adrs"
+    adr_dir.mkdir(parents=True)
+    chunks_dir = tmp_path / "data" / "rag-docs"
+    chunks_dir.mkdir(parents=True)
+    (chunks_dir / "document_chunks.json").write_text(json.dumps([{"id": 1}] * 50))
+
+    real_scandir = os.scandir
+
+    def scandir(path="."):
+        if Path(path) == adr_dir:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    client = _make_mock_client(
+        get=AsyncMock(return_value=_mock_response(200, _health_json(10, True))),
+    )
+
+    with _patch_httpx_client(client), patch.dict(
+        "os.environ",
+        {
+            "QUBINODE_ROOT": str(tmp_path),
+            "RAG_DATA_DIR": str(tmp_path / "data"),
+            "ADR_DIR": str(adr_dir),
+            "RAG_DROP_DIR": str(tmp_path / "drop"),
+        },
+    ):
+        result = await run_rag_preflight(force=True)
+
+    adr_check = [c for c in result.checks if c.name == "adr_source_files"][0]
+    assert adr_check.status == CheckStatus.WARNING
+    assert len(result.checks) == 3
+
+
 # ---------------------------------------------------------------------------
 # Test 3: ADR directory empty -> WARNING
 # ---------------------------------------------------------------------------
@@ -498,3 +539,77 @@ async def test_ai_assistant_unreachable(tmp_path):
     doc_check = [c for c in result.checks if c.name == "rag_document_count"][0]
     assert doc_check.status == CheckStatus.WARNING
     assert "Cannot reach" in doc_check.message
+
+
+# ---------------------------------------------------------------------------
+# Test 14: Settings are read once until the cache is cleared
+# ---------------------------------------------------------------------------
+
+
+def test_config_read_once_until_cleared(monkeypatch):
+    """Env changes are picked up only after clear_cache()."""
+    from intent_parser.rag_preflight import _get_config
+
+    assert _get_config()["ai_assistant_url"] == "http://ai:8080"
+    monkeypatch.setenv("AI_ASSISTANT_URL", "http://other:8080")
+    assert _get_config()["ai_assistant_url"] == "http://ai:8080"
+
+    clear_cache()
+    assert _get_config()["ai_assistant_url"] == "http://other:8080"
+
+
+# ---------------------------------------------------------------------------
+# Test 15: Filesystem checks overlap the health request
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_filesystem_checks_overlap_health_request():
+    """Filesystem checks run in worker threads while the health GET is pending."""
+    health_started = threading.Event()
+    overlapped = []
+
+    def fs_check(path):
+        overlapped.append(health_started.wait(timeout=2))
+        return PreflightCheck(name="fs", status=CheckStatus.OK, message="ok")
+
+    async def health_get(url):
+        health_started.set()
+        return _mock_response(200, _health_json(10, True))
+
+    client = _make_mock_client(get=AsyncMock(side_effect=health_get))
+
+    with _patch_httpx_client(client), patch("intent_parser.rag_preflight._check_adr_source_files", fs_check), patch(
+        "intent_parser.rag_preflight._check_chunks_file", fs_check
+    ):
+        result = await run_rag_preflight(force=True)
+
+    assert overlapped == [True, True]
+    assert [c.name for c in result.checks] == ["fs", "fs", "rag_document_count"]
+
+
+# ---------------------------------------------------------------------------
+# Test 16: Concurrent runs are coalesced
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_share_one_check(tmp_path):
+    """Callers that miss the cache together share a single run."""
+    release = asyncio.Event()
+
+    async def health_get(url):
+        await release.wait()
+        return _mock_response(200, _health_json(10, True))
+
+    client = _make_mock_client(get=AsyncMock(side_effect=health_get))
+
+    with _patch_httpx_client(client), patch.dict("os.environ", {"ADR_DIR": str(tmp_path), "RAG_DATA_DIR": str(tmp_path)}):
+        first = asyncio.ensure_future(run_rag_preflight())
+        second = asyncio.ensure_future(run_rag_preflight(force=True))
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+    assert client.get.call_count == 1
+    assert results[0] is results[1]
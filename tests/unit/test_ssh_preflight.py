@@ -4,6 +4,7 @@ Tests for the SSH pre-flight checks module.
 Uses mocked httpx responses to validate all 4 checks, auto-fix logic, and caching.
 """
 
+import asyncio
 import json
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -253,6 +254,55 @@ async def test_cache_expired(monkeypatch):
     client.get.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# Test: Concurrent runs are coalesced
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_share_one_check():
+    """Triggers that miss the cache together share a single run."""
+    release = asyncio.Event()
+
+    async def conn_get(url, auth):
+        await release.wait()
+        return _mock_response(404)
+
+    client = _make_mock_client(
+        get=AsyncMock(side_effect=conn_get),
+        post=AsyncMock(return_value=_mock_response(200, {"status": True})),
+    )
+
+    with _patch_httpx_client(client):
+        first = asyncio.ensure_future(run_ssh_preflight())
+        second = asyncio.ensure_future(run_ssh_preflight(force=True))
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+    assert client.get.call_count == 1
+    # One connection create plus one connection test, not two of each
+    assert client.post.call_count == 2
+    assert results[0] is results[1]
+
+
+# ---------------------------------------------------------------------------
+# Test: Settings are read once until the cache is cleared
+# ---------------------------------------------------------------------------
+
+
+def test_config_read_once_until_cleared(monkeypatch):
+    """Env changes are picked up only after clear_cache()."""
+    from intent_parser.ssh_preflight import _get_config
+
+    assert _get_config()["conn_id"] == "localhost_ssh"
+    monkeypatch.setenv("QUBINODE_SSH_CONN_ID", "other_ssh")
+    assert _get_config()["conn_id"] == "localhost_ssh"
+
+    clear_cache()
+    assert _get_config()["conn_id"] == "other_ssh"
+
+
 # ---------------------------------------------------------------------------
 # Test: format_report output
 # ---------------------------------------------------------------------------
@@ -4,6 +4,7 @@ Tests for the VM SSH pre-flight checks module (second-hop validation).
 Uses mocked httpx responses to simulate MCP server replies.
 """
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -276,6 +277,47 @@ class TestRunVmSshPreflight:
 
         assert client.get.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, monkeypatch):
+        import intent_parser.vm_ssh_preflight as vm_ssh_preflight
+
+        monkeypatch.setattr(vm_ssh_preflight, "_MAX_CACHED_VMS", 2)
+        resp = _mock_response(json_data={"status": "ok", "vm": "freeipa", "ip": "1.2.3.4"})
+        patcher, client = _patch_httpx(resp)
+        with patcher:
+            await run_vm_ssh_preflight("freeipa")
+            await run_vm_ssh_preflight("vyos")
+            await run_vm_ssh_preflight("freeipa")  # Cache hit, now most recent
+            await run_vm_ssh_preflight("step-ca")  # Evicts vyos
+            await run_vm_ssh_preflight("freeipa")
+            await run_vm_ssh_preflight("vyos")
+
+        assert client.get.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_one_check(self):
+        release = asyncio.Event()
+
+        async def check_get(url, params):
+            await release.wait()
+            return _mock_response(json_data={"status": "ok", "vm": url.rsplit("/", 1)[-1], "ip": "1.2.3.4"})
+
+        patcher, client = _patch_httpx(None)
+        client.get = AsyncMock(side_effect=check_get)
+        with patcher:
+            runs = [
+                asyncio.ensure_future(run_vm_ssh_preflight("freeipa")),
+                asyncio.ensure_future(run_vm_ssh_preflight("freeipa")),
+                asyncio.ensure_future(run_vm_ssh_preflight("vyos")),
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*runs)
+
+        assert client.get.call_count == 2
+        assert results[0] is results[1]
+        assert "vyos" in results[2].checks[0].message
+
     @pytest.mark.asyncio
     async def test_report_format_all_ok(self):
         resp = _mock_response(